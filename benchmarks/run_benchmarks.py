@@ -0,0 +1,249 @@
+"""Offline benchmark suite for strapvizpy.
+
+Sweeps sample size, rep, n, estimator and engine for
+`bootstrap_distribution()` and `calculate_boot_stats()`, plus the render
+times of `plot_ci()` and `tabulate_stats()`. Every case records its wall
+time and its peak traced memory, and the report is written as JSON so
+that runs on different versions can be compared.
+
+Examples
+--------
+$ python benchmarks/run_benchmarks.py --quick --output before.json
+$ python benchmarks/run_benchmarks.py --quick --output after.json \\
+      --compare before.json
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import strapvizpy
+from strapvizpy.bootstrap import (SUPPORTED_ESTIMATORS,
+                                  bootstrap_distribution,
+                                  calculate_boot_stats)
+from strapvizpy.display import plot_ci, tabulate_stats
+
+# Parameter grids of the full and the quick sweeps
+GRIDS = {
+    "full": {
+        "size": [100, 10 ** 4, 10 ** 6],
+        "rep": [1000, 10 ** 4],
+        "n": ["auto", 100],
+        "estimator": list(SUPPORTED_ESTIMATORS),
+        "engine": ["naive", "multinomial", "numba"],
+    },
+    "quick": {
+        "size": [100, 10 ** 4],
+        "rep": [1000],
+        "n": ["auto", 100],
+        "estimator": list(SUPPORTED_ESTIMATORS),
+        "engine": ["naive", "multinomial", "numba"],
+    },
+}
+
+# Cases drawing more than this many resampled values are skipped
+MAX_DRAWS = {"full": 10 ** 8, "quick": 10 ** 7}
+
+# Default slowdown ratio over the baseline reported as a regression
+DEFAULT_THRESHOLD = 1.25
+
+
+def _has_numba():
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _cases(grid, max_draws):
+    """Yields the name, parameters and callable of every case."""
+
+    rng = np.random.default_rng(0)
+    samples = {size: rng.lognormal(size=size) for size in grid["size"]}
+    engines = [e for e in grid["engine"] if e != "numba" or _has_numba()]
+
+    for size, rep, n, estimator, engine in itertools.product(
+            grid["size"], grid["rep"], grid["n"], grid["estimator"],
+            engines):
+        draws = rep * (size if n == "auto" else n)
+        if draws > max_draws:
+            continue
+        params = {"size": size, "rep": rep, "n": n,
+                  "estimator": estimator, "engine": engine}
+        sample = samples[size]
+        # the numba engine is only parallel over its own threads
+        n_jobs = -1 if engine == "numba" else 1
+        yield ("bootstrap_distribution", params,
+               lambda s=sample, p=params, j=n_jobs: bootstrap_distribution(
+                   s, p["rep"], n=p["n"], estimator=p["estimator"],
+                   random_state=1, engine=p["engine"], n_jobs=j))
+
+    for size, rep in itertools.product(grid["size"], grid["rep"]):
+        if rep * size > max_draws:
+            continue
+        params = {"size": size, "rep": rep}
+        sample = samples[size]
+        yield ("calculate_boot_stats", params,
+               lambda s=sample, r=rep: calculate_boot_stats(
+                   s, r, random_state=1))
+
+    sample = samples[grid["size"][0]]
+    for rep in grid["rep"]:
+        params = {"size": len(sample), "rep": rep}
+        yield ("plot_ci", params, lambda r=rep: _render_plot(sample, r))
+
+    stats = calculate_boot_stats(sample, grid["rep"][0], random_state=1)
+    yield ("tabulate_stats", {}, lambda: _render_tables(stats))
+
+
+def _render_plot(sample, rep):
+    plot_ci(sample, rep, random_state=1)
+    plt.close("all")
+
+
+def _render_tables(stats):
+    for table in tabulate_stats(stats):
+        table.to_latex()
+
+
+def _measure(func, repeat):
+    """Wall times of `repeat` calls and the peak traced memory of one."""
+
+    # warm up caches, lazy imports and compilation
+    func()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return times, peak
+
+
+def _key(name, params):
+    return name + json.dumps(params, sort_keys=True)
+
+
+def run(grid="quick", repeat=3, select=None):
+    """Runs the benchmark sweep and returns the report dictionary.
+
+    Parameters
+    ----------
+    grid : {"quick", "full"}, default="quick"
+        parameter grid to sweep
+    repeat : int, default=3
+        number of timed calls per case
+    select : None or str, default=None
+        only run cases whose name contains this string
+
+    Returns
+    -------
+    dictionary
+        environment of the run and one result per case
+    """
+
+    results = []
+    for name, params, func in _cases(GRIDS[grid], MAX_DRAWS[grid]):
+        if select is not None and select not in name:
+            continue
+        times, peak = _measure(func, repeat)
+        results.append({
+            "name": name,
+            "params": params,
+            "min_time": min(times),
+            "median_time": statistics.median(times),
+            "peak_traced_bytes": peak,
+            # high-water mark of the whole process, not of this case
+            "max_rss_bytes": resource.getrusage(
+                resource.RUSAGE_SELF).ru_maxrss * 1024,
+        })
+        print(f"{name} {params} {min(times):.4f}s "
+              f"{peak / 2 ** 20:.1f}MiB", file=sys.stderr)
+
+    return {
+        "strapvizpy": strapvizpy.__version__,
+        "numpy": np.__version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "grid": grid,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """Cases of `report` slower than in `baseline` by more than `threshold`.
+
+    Returns
+    -------
+    list
+        tuples of case name, parameters and slowdown ratio
+    """
+
+    base = {_key(r["name"], r["params"]): r for r in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        old = base.get(_key(result["name"], result["params"]))
+        if old is None:
+            continue
+        ratio = result["min_time"] / old["min_time"]
+        if ratio > threshold:
+            regressions.append((result["name"], result["params"], ratio))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true",
+                        help="sweep the small grid only")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed calls per case")
+    parser.add_argument("--select", default=None,
+                        help="only run cases whose name contains this")
+    parser.add_argument("--output", default="benchmark_report.json",
+                        help="path of the JSON report")
+    parser.add_argument("--compare", default=None,
+                        help="baseline JSON report to compare against")
+    parser.add_argument("--threshold", type=float,
+                        default=DEFAULT_THRESHOLD,
+                        help="slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    report = run("quick" if args.quick else "full", args.repeat,
+                 args.select)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    if args.compare is None:
+        return 0
+
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args.threshold)
+    for name, params, ratio in regressions:
+        print(f"REGRESSION {name} {params} {ratio:.2f}x slower")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,48 @@
-# read version from installed package
-from importlib.metadata import version
-__version__ = version("strapvizpy")
+"""Bootstrapped statistics, tables and charts.
+
+The public API is imported lazily from its submodules on first access,
+so that e.g. ``import strapvizpy.bootstrap`` loads neither pandas nor
+matplotlib, and the installed version is only read when asked for.
+"""
+
+from importlib import import_module
+
+# Submodule of every name of the public API
+_API = {
+    "bootstrap_distribution": "bootstrap",
+    "calculate_boot_stats": "bootstrap",
+    "calculate_boot_stats_grouped": "batch",
+    "calculate_boot_stats_many": "batch",
+    "BootstrapCache": "cache",
+    "bootstrap_compare": "compare",
+    "optimal_block_length": "blocks",
+    "BootstrapResult": "result",
+    "stats_from_distribution": "result",
+    "BootstrapAccumulator": "streaming",
+    "calculate_boot_stats_stream": "streaming",
+    "plot_ci": "display",
+    "plot_ci_batch": "display",
+    "tabulate_stats": "display",
+    "tabulate_stats_many": "display",
+}
+
+__all__ = sorted(_API) + ["__version__"]
+
+
+def __getattr__(name):
+    if name == "__version__":
+        # read version from installed package
+        from importlib.metadata import version
+
+        value = version("strapvizpy")
+    elif name in _API:
+        value = getattr(import_module(f"{__name__}.{_API[name]}"), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,194 @@
+import numpy as np
+
+# numba is optional, the kernels are only compiled when it is installed
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Estimator codes understood by the kernels
+ESTIMATOR_CODES = {"mean": 0, "median": 1, "var": 2, "sd": 3}
+
+# Longest resample whose median is found by insertion sort
+INSERTION_SORT_MAX = 64
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _next_index(state, size):
+        """Advances a splitmix64 `state` and maps it to an index < `size`."""
+
+        state = state + np.uint64(0x9E3779B97F4A7C15)
+        z = state
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z = z ^ (z >> np.uint64(31))
+        uniform = np.float64(z >> np.uint64(11)) * (1.0 / 9007199254740992.0)
+        return state, np.int64(uniform * size)
+
+    @numba.njit(cache=True)
+    def _buffer_median(buffer):
+        """Median of `buffer`, which is sorted in place.
+
+        Short buffers are insertion sorted, which beats a general sort by
+        far for the small samples bootstrapped in bulk, and no copy is
+        made as by np.median. As with np.median, a buffer holding NaN has
+        a NaN median.
+        """
+
+        n = buffer.shape[0]
+        for i in range(n):
+            if np.isnan(buffer[i]):
+                return np.nan
+        if n > INSERTION_SORT_MAX:
+            buffer.sort()
+        else:
+            for i in range(1, n):
+                value = buffer[i]
+                j = i - 1
+                while j >= 0 and buffer[j] > value:
+                    buffer[j + 1] = buffer[j]
+                    j -= 1
+                buffer[j + 1] = value
+        return (buffer[(n - 1) // 2] + buffer[n // 2]) / 2
+
+    @numba.njit(parallel=True, cache=True)
+    def _resample_reduce(sample, n, estimator, shift, seeds, out):
+        """Fills `out` with one estimate per seed, never storing resamples.
+
+        Every replicate draws its indices from its own splitmix64 stream
+        seeded by `seeds`, so results do not depend on how replicates are
+        scheduled across threads.
+        """
+
+        size = sample.shape[0]
+        for r in numba.prange(seeds.shape[0]):
+            state = seeds[r]
+            if estimator == 1:
+                buffer = np.empty(n)
+                for i in range(n):
+                    state, j = _next_index(state, size)
+                    buffer[i] = sample[j]
+                out[r] = _buffer_median(buffer)
+                continue
+
+            first = 0.0
+            second = 0.0
+            for i in range(n):
+                state, j = _next_index(state, size)
+                dev = sample[j] - shift
+                first += dev
+                second += dev * dev
+            first /= n
+            if estimator == 0:
+                out[r] = shift + first
+            else:
+                var = max(second / n - first * first, 0.0)
+                out[r] = var if estimator == 2 else np.sqrt(var)
+
+
+    @numba.njit(parallel=True, cache=True)
+    def _segment_resample_reduce(values, starts, sizes, draws, estimator,
+                                 centers, seeds, out):
+        """Fills row i of `out` with replicates of the i-th segment.
+
+        Segments are bootstrapped in parallel, each from its own
+        splitmix64 stream seeded by `seeds`, and never store resamples
+        other than the buffer a median is taken of.
+        """
+
+        for seg in numba.prange(starts.shape[0]):
+            state = seeds[seg]
+            start = starts[seg]
+            size = sizes[seg]
+            n = draws[seg]
+            shift = centers[seg]
+            buffer = np.empty(n if estimator == 1 else 0)
+            for r in range(out.shape[1]):
+                if estimator == 1:
+                    for i in range(n):
+                        state, j = _next_index(state, size)
+                        buffer[i] = values[start + j]
+                    out[seg, r] = _buffer_median(buffer)
+                    continue
+
+                first = 0.0
+                second = 0.0
+                for i in range(n):
+                    state, j = _next_index(state, size)
+                    dev = values[start + j] - shift
+                    first += dev
+                    second += dev * dev
+                first /= n
+                if estimator == 0:
+                    out[seg, r] = shift + first
+                else:
+                    var = max(second / n - first * first, 0.0)
+                    out[seg, r] = var if estimator == 2 else np.sqrt(var)
+
+
+def _finite_shift(values):
+    """First finite value of `values`, or 0 when there is none.
+
+    Moments are accumulated about it, so that NaN or infinite values
+    only spread to the replicates drawing them.
+    """
+
+    finite = np.flatnonzero(np.isfinite(values))
+    return float(values[finite[0]]) if len(finite) else 0.0
+
+
+def numba_segments(values, starts, sizes, draws, estimator, centers, rep,
+                   rng, n_threads=1):
+    """Bootstraps `rep` replicates of every segment of `values`.
+
+    Returns an array of shape (segments, `rep`), one stream per segment
+    seeded from `rng`, so results do not depend on `n_threads`. Centers
+    that are not finite are replaced by a finite value of their segment.
+    """
+
+    centers = np.array(centers, dtype=float)
+    for seg in np.flatnonzero(~np.isfinite(centers)):
+        centers[seg] = _finite_shift(
+            values[starts[seg]:starts[seg] + sizes[seg]]
+        )
+    seeds = rng.integers(0, 2 ** 63, size=len(starts)).view(np.uint64)
+    dist = np.empty((len(starts), rep))
+
+    previous = numba.get_num_threads()
+    numba.set_num_threads(min(n_threads, numba.config.NUMBA_NUM_THREADS))
+    try:
+        _segment_resample_reduce(np.ascontiguousarray(values, dtype=float),
+                                 starts, sizes, draws,
+                                 ESTIMATOR_CODES[estimator], centers, seeds,
+                                 dist)
+    finally:
+        numba.set_num_threads(previous)
+
+    return dist
+
+
+def numba_block(sample, n, estimator, rep, rng, n_threads=1):
+    """Bootstraps `rep` replicates with the compiled kernel.
+
+    Per-replicate seeds are drawn from `rng`, and the columns of a 2-D
+    sample reuse them so that they are resampled by the same rows. No
+    resample matrix is allocated, so replicates are not chunked.
+    """
+
+    seeds = rng.integers(0, 2 ** 63, size=rep).view(np.uint64)
+    columns = np.asarray(sample, dtype=float).reshape(len(sample), -1).T
+    dist = np.empty((rep, len(columns)))
+
+    previous = numba.get_num_threads()
+    numba.set_num_threads(min(n_threads, numba.config.NUMBA_NUM_THREADS))
+    try:
+        for col, values in enumerate(columns):
+            values = np.ascontiguousarray(values)
+            _resample_reduce(values, n, ESTIMATOR_CODES[estimator],
+                             _finite_shift(values), seeds, dist[:, col])
+    finally:
+        numba.set_num_threads(previous)
+
+    return dist.reshape((rep,) + sample.shape[1:])
@@ -0,0 +1,376 @@
+import os
+import numpy as np
+from strapvizpy.bootstrap import (_check_level, _check_max_bytes,
+                                  _check_params, _check_random_state,
+                                  _chunk_reps, _generators, _is_pandas)
+
+# Default memory budget, in bytes, of a block of segments. Blocks are
+# streamed through several elementwise passes, which run markedly faster
+# when a block stays cache-sized than with the full `DEFAULT_MAX_BYTES`.
+BATCH_MAX_BYTES = 2 ** 23
+
+
+def _segment_estimates(values, starts, sizes, estimator):
+    """Estimator, means and centered values of every sorted segment."""
+
+    means = np.add.reduceat(values, starts) / sizes
+    centered = values - np.repeat(means, sizes)
+    variances = np.add.reduceat(centered ** 2, starts) / sizes
+    estimates = {
+        "mean": means,
+        "median": (values[starts + (sizes - 1) // 2] +
+                   values[starts + sizes // 2]) / 2,
+        "var": variances,
+        "sd": np.sqrt(variances),
+    }[estimator]
+
+    return estimates, means, centered
+
+
+def _segment_stats(values, sizes, rep, n, level, estimator, rng,
+                   max_bytes=None):
+    """Bootstraps every segment of `values` in vectorised blocks.
+
+    `values` holds the segments back to back, each sorted, with lengths
+    `sizes`. Segments are laid out by size and blocks of whole segments
+    are resampled at once: indices are drawn by a single call per run of
+    equal sizes, moments are reduced per segment with `np.add.reduceat`,
+    and medians are order statistics of the sorted indices, so the Python
+    loop runs per block and distinct size rather than per segment.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        sample estimate, lower bound, upper bound and standard error of
+        every segment
+    """
+
+    # segments of equal size are resampled together once laid out by size
+    order = np.argsort(sizes, kind="stable")
+    starts = np.cumsum(sizes[order]) - sizes[order]
+    values = values[np.arange(len(values)) + np.repeat(
+        (np.cumsum(sizes) - sizes)[order] - starts, sizes[order]
+    )]
+    sizes = sizes[order]
+    draws = sizes if n == "auto" else np.full(len(sizes), n)
+    estimates, means, centered = _segment_estimates(values, starts, sizes,
+                                                    estimator)
+
+    if max_bytes is None:
+        max_bytes = BATCH_MAX_BYTES
+
+    # resample indices, gathered values and a reduction temporary per draw
+    bytes_per_draw = 3 * 8
+    limit = max(max_bytes // (bytes_per_draw * rep), 1)
+    total_draws = np.cumsum(draws)
+
+    lower = np.empty(len(sizes))
+    upper = np.empty(len(sizes))
+    std_err = np.empty(len(sizes))
+    first = 0
+    while first < len(sizes):
+        done = total_draws[first - 1] if first else 0
+        last = max(np.searchsorted(total_draws, done + limit, side="right"),
+                   first + 1)
+        block = slice(first, last)
+        block_draws = draws[block]
+        offsets = np.concatenate(([0], np.cumsum(block_draws)[:-1]))
+        # indices are relative to the block's first segment
+        base = starts[first]
+        shifts = np.repeat(starts[block] - base, block_draws)
+        # runs of segments of equal size, as (low, high) positions and size
+        runs = np.concatenate(
+            ([0], np.flatnonzero(np.diff(sizes[block])) + 1, [last - first])
+        )
+        spans = [(offsets[a], offsets[b - 1] + block_draws[b - 1],
+                  sizes[first + a]) for a, b in zip(runs[:-1], runs[1:])]
+
+        dist = np.empty((last - first, rep))
+        chunk = _chunk_reps(rep, bytes_per_draw * len(shifts),
+                            max_bytes=max_bytes)
+        for start in range(0, rep, chunk):
+            stop = min(start + chunk, rep)
+            # integers with a scalar bound are drawn much faster than
+            # with per-element bounds, so each run is drawn at once
+            if len(spans) == 1:
+                idx = rng.integers(spans[0][2],
+                                   size=(stop - start, len(shifts)))
+            else:
+                idx = np.empty((stop - start, len(shifts)), dtype=np.int64)
+                for low, high, size in spans:
+                    idx[:, low:high] = rng.integers(
+                        size, size=(stop - start, high - low)
+                    )
+            if last - first > 1:
+                idx += shifts
+
+            if estimator == "median":
+                # segments occupy increasing index ranges, so sorting the
+                # rows sorts every segment's resample in place
+                idx.sort(axis=1)
+                dist[:, start:stop] = ((
+                    values[base:][idx[:, offsets + (block_draws - 1) // 2]]
+                    + values[base:][idx[:, offsets + block_draws // 2]]
+                ) / 2).T
+                continue
+
+            resample = centered[base:][idx]
+            shift = np.add.reduceat(resample, offsets, axis=1) / block_draws
+            if estimator == "mean":
+                dist[:, start:stop] = (means[block] + shift).T
+                continue
+            var = np.maximum(
+                np.add.reduceat(resample ** 2, offsets, axis=1) / block_draws
+                - shift ** 2, 0
+            )
+            dist[:, start:stop] = (var if estimator == "var"
+                                   else np.sqrt(var)).T
+
+        lower[block], upper[block] = np.percentile(
+            dist, [100 * (1-level)/2, 100 * (1-(1-level)/2)], axis=1
+        )
+        std_err[block] = np.std(dist, axis=1)
+        first = last
+
+    # back to the order of the segments given
+    unsort = np.argsort(order)
+    return (estimates[unsort], lower[unsort], upper[unsort],
+            std_err[unsort])
+
+
+def calculate_boot_stats_grouped(df, value_col, by, rep, n="auto",
+                                 level=0.95, estimator="mean",
+                                 random_state=None, max_bytes=None):
+    """Calculates bootstrapped confidence intervals for every group.
+
+    All groups of `df` are bootstrapped in batched, vectorised passes
+    instead of calling `calculate_boot_stats()` once per group, so
+    thousands of groups cost little more than one large sample.
+
+    Parameters
+    ----------
+    df : pandas.core.frame.DataFrame
+        data containing the samples and their group keys
+    value_col : str
+        column holding the sample values
+    by : str or list
+        column or columns defining the groups
+    rep : int
+        number of replicates of each distribution
+    n : str or int, default="auto"
+        bootstrap sample size, "auto" specifies using the same size as
+        each group
+    level : float, default=0.95
+        confidence level
+    estimator : {"mean", "median", "var", "sd"}
+        sampling distributor's estimator
+    random_state : None or int or numpy.random.SeedSequence or numpy.random.Generator, default=None
+        seed, seed sequence or generator for the resampling streams
+    max_bytes : None or int, default=None
+        memory budget in bytes for the resamples held at once, None uses
+        `BATCH_MAX_BYTES`
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        One row per group with the group keys followed by the keys of
+        the `calculate_boot_stats()` dictionary.
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({"endpoint": ["a", "a", "b", "b", "b"],
+    ...                    "latency": [1.0, 2.0, 3.0, 4.0, 5.0]})
+    >>> calculate_boot_stats_grouped(df, "latency", by="endpoint", rep=1000,
+    ...                              random_state=123)
+    """
+
+    if not _is_pandas(df, "DataFrame"):
+        raise TypeError("df should be of type 'pandas.core.frame.DataFrame'")
+
+    if value_col not in df.columns:
+        raise ValueError("value_col should be a column of df")
+
+    if not (isinstance(by, str) or isinstance(by, list)):
+        raise TypeError("by should be of type 'str' or 'list'")
+
+    _check_params(rep, n, estimator)
+    _check_level(level)
+    _check_random_state(random_state)
+    _check_max_bytes(max_bytes)
+
+    grouped = df.groupby(by, sort=True, observed=True)
+    codes = grouped.ngroup().to_numpy()
+    keep = ~np.isnan(codes)
+    values = df[value_col].to_numpy(dtype=float)[keep]
+    codes = codes[keep].astype(np.int64)
+
+    # lay the groups out back to back, each sorted by value
+    order = np.lexsort((values, codes))
+    counts = grouped.size()
+    sizes = counts.to_numpy()
+
+    estimates, lower, upper, std_err = _segment_stats(
+        values[order], sizes, rep, n, level, estimator,
+        _generators(random_state)[0], max_bytes
+    )
+
+    stats_df = counts.index.to_frame(index=False)
+    stats_df["lower"] = lower
+    stats_df["upper"] = upper
+    stats_df["sample_" + estimator] = estimates
+    stats_df["std_err"] = std_err
+    stats_df["level"] = level
+    stats_df["sample_size"] = sizes
+    stats_df["n"] = n
+    stats_df["rep"] = rep
+    stats_df["estimator"] = estimator
+
+    return stats_df
+
+
+def calculate_boot_stats_many(samples, rep, n="auto", level=0.95,
+                              estimator="mean", random_state=None,
+                              max_bytes=None, offsets=None, engine="auto",
+                              n_jobs=1):
+    """Calculates bootstrapped confidence intervals for many samples.
+
+    Independent samples of varying length are validated once, laid out
+    back to back and bootstrapped in the same batched, vectorised passes
+    as `calculate_boot_stats_grouped()`, so thousands of small samples
+    avoid the per-call overhead of `calculate_boot_stats()`.
+
+    The NumPy passes draw the indices of all samples of equal size at
+    once, so they pay off most for many small samples, whose sizes
+    repeat, while large samples of distinct sizes cost about as much as
+    a `calculate_boot_stats()` call each. The opt-in "numba" engine,
+    which requires numba, instead runs a compiled kernel fusing draws
+    and reductions for each sample, in parallel over samples on `n_jobs`
+    threads.
+
+    Parameters
+    ----------
+    samples : list or numpy.ndarray
+        list of 1-D samples, or with `offsets` the values of all samples
+        back to back
+    rep : int
+        number of replicates of each distribution
+    n : str or int, default="auto"
+        bootstrap sample size, "auto" specifies using the same size as
+        each sample
+    level : float, default=0.95
+        confidence level
+    estimator : {"mean", "median", "var", "sd"}
+        sampling distributor's estimator
+    random_state : None or int or numpy.random.SeedSequence or numpy.random.Generator, default=None
+        seed, seed sequence or generator for the resampling streams
+    max_bytes : None or int, default=None
+        memory budget in bytes for the resamples held at once, None uses
+        `BATCH_MAX_BYTES`
+    offsets : None or list or numpy.ndarray, default=None
+        boundaries of the samples within `samples`, starting at 0 and
+        ending at its length, so that sample i is
+        ``samples[offsets[i]:offsets[i + 1]]``
+    engine : {"auto", "numpy", "numba"}, default="auto"
+        resampling engine, "auto" and "numpy" use the vectorised passes
+    n_jobs : int, default=1
+        number of numba threads, -1 uses all available cores, so that the
+        "numba" engine is serial unless it is set
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        One row per sample, in order, with the keys of the
+        `calculate_boot_stats()` dictionary.
+
+    Examples
+    --------
+    >>> calculate_boot_stats_many([[1.0, 2.0], [3.0, 4.0, 5.0]], 1000,
+    ...                           random_state=123)
+    >>> calculate_boot_stats_many(np.array([1.0, 2.0, 3.0, 4.0, 5.0]), 1000,
+    ...                           offsets=[0, 2, 5], random_state=123)
+    """
+
+    if offsets is None:
+        if not isinstance(samples, list):
+            raise TypeError("samples should be of type 'list'")
+        arrays = [np.asarray(sample, dtype=float) for sample in samples]
+        if any(array.ndim != 1 for array in arrays):
+            raise ValueError("samples should be 1 dimensional")
+        sizes = np.array([len(array) for array in arrays], dtype=np.int64)
+        values = np.concatenate(arrays) if arrays else np.empty(0)
+    else:
+        if not isinstance(samples, np.ndarray):
+            raise TypeError("samples should be of type 'numpy.ndarray' "
+                            "with offsets")
+        values = np.asarray(samples, dtype=float)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if (values.ndim != 1 or offsets.ndim != 1 or len(offsets) < 1 or
+                offsets[0] != 0 or offsets[-1] != len(values)):
+            raise ValueError("offsets should start at 0 and end at the "
+                             "number of values")
+        sizes = np.diff(offsets)
+
+    if np.any(sizes < 1):
+        raise ValueError("Every sample should hold at least one value")
+
+    _check_params(rep, n, estimator)
+    _check_level(level)
+    _check_random_state(random_state)
+    _check_max_bytes(max_bytes)
+
+    if not isinstance(engine, str):
+        raise TypeError("engine should be of type 'str'")
+
+    if engine not in ("auto", "numpy", "numba"):
+        raise ValueError("Supported engines are auto, numpy, numba")
+
+    if not isinstance(n_jobs, int):
+        raise TypeError("n_jobs should be of type 'int'")
+
+    if n_jobs == 0 or n_jobs < -1:
+        raise ValueError("Invalid value for n_jobs")
+
+    if estimator == "median":
+        # medians are order statistics of each sorted sample
+        codes = np.repeat(np.arange(len(sizes)), sizes)
+        values = values[np.lexsort((values, codes))]
+
+    rng = _generators(random_state)[0]
+    if engine == "numba":
+        from strapvizpy import _numba
+
+        if _numba.numba is None:
+            raise ImportError("The numba engine requires numba to be "
+                              "installed")
+
+        starts = np.cumsum(sizes) - sizes
+        draws = sizes if n == "auto" else np.full(len(sizes), n)
+        estimates, means, _ = _segment_estimates(values, starts, sizes,
+                                                 estimator)
+        dist = _numba.numba_segments(
+            values, starts, sizes, draws, estimator, means, rep, rng,
+            n_threads=(os.cpu_count() or 1) if n_jobs == -1 else n_jobs
+        )
+        lower, upper = np.percentile(
+            dist, [100 * (1-level)/2, 100 * (1-(1-level)/2)], axis=1
+        )
+        std_err = np.std(dist, axis=1)
+    else:
+        estimates, lower, upper, std_err = _segment_stats(
+            values, sizes, rep, n, level, estimator, rng, max_bytes
+        )
+
+    # pandas is only imported once a table is returned
+    import pandas as pd
+
+    return pd.DataFrame({
+        "lower": lower,
+        "upper": upper,
+        "sample_" + estimator: estimates,
+        "std_err": std_err,
+        "level": level,
+        "sample_size": sizes,
+        "n": n,
+        "rep": rep,
+        "estimator": estimator,
+    })
@@ -0,0 +1,318 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Global constant for supported block bootstraps
+SUPPORTED_BLOCKS = ("moving", "circular", "stationary")
+
+# Bytes held per resampled position and column by each block bootstrap:
+# gathered values and their deviations, plus the wrapped indices of
+# circular blocks and the draws, block offsets and indices of stationary
+# ones
+BLOCK_BYTES_PER_POSITION = {"moving": 32, "circular": 48, "stationary": 96}
+
+# Series positions correlated with all lags at once by one FFT when
+# estimating autocovariances
+ACV_SEGMENT = 2 ** 16
+
+# Bytes held per resampled position and column by the median of a block
+# bootstrap on top of its gathering, for the bucket keys and masks of
+# its rank counts
+MEDIAN_BYTES_PER_POSITION = 32
+
+# Base 2 logarithm of the number of rank buckets the medians of block
+# bootstraps are first located in
+MEDIAN_BUCKET_BITS = 12
+
+
+def _autocovariance(x, mean, max_lag, direct=False):
+    """Autocovariances of `x` at lags 0 to `max_lag`.
+
+    With `direct`, each lag is one dot product of views of `x`, which is
+    fastest for a few lags. Otherwise the series is cross-correlated
+    with itself `ACV_SEGMENT` positions at a time by FFT, so every lag
+    costs O(log) per position. Neither copies `x` whole.
+    """
+
+    size = len(x)
+    if direct:
+        total = x.sum()
+        return np.array([
+            (x[:size - lag] @ x[lag:] -
+             mean * (2 * total - x[size - lag:].sum() - x[:lag].sum()) +
+             (size - lag) * mean ** 2) / size
+            for lag in range(max_lag + 1)
+        ])
+
+    fft_size = 1 << int(np.ceil(np.log2(2 * ACV_SEGMENT + max_lag)))
+    acv = np.zeros(max_lag + 1)
+    for start in range(0, size, ACV_SEGMENT):
+        head = x[start:start + ACV_SEGMENT] - mean
+        tail = x[start:start + ACV_SEGMENT + max_lag] - mean
+        spectrum = (np.conj(np.fft.rfft(head, fft_size)) *
+                    np.fft.rfft(tail, fft_size))
+        acv += np.fft.irfft(spectrum, fft_size)[:max_lag + 1]
+
+    return acv / size
+
+
+def optimal_block_length(sample, block="stationary"):
+    """Automatic block length of a block bootstrap of `sample`.
+
+    Follows Politis and White (2004): autocorrelations are computed
+    until `K_N` consecutive ones are insignificant, and a flat-top lag
+    window over twice that many lags estimates the spectral density and
+    its derivative at zero, from which the block length minimising the
+    mean squared error of the variance follows. Moving blocks use the
+    circular block length. 2-D samples use their longest column, and
+    constant series or series holding NaN a length of 1.
+
+    Parameters
+    ----------
+    sample : list or numpy.ndarray or pandas.core.series.Series
+        time series, in time order along its first axis
+    block : {"moving", "circular", "stationary"}, default="stationary"
+        block bootstrap the length is chosen for, the expected length of
+        the stationary bootstrap's geometric blocks
+
+    Returns
+    -------
+    int
+        block length, between 1 and the length of `sample`
+
+    Examples
+    --------
+    >>> optimal_block_length(np.cumsum(np.random.normal(size=1000)))
+    """
+
+    x = np.asarray(sample, dtype=float)
+    if x.ndim == 2:
+        return max(optimal_block_length(x[:, col], block)
+                   for col in range(x.shape[1]))
+
+    size = len(x)
+    if size < 3:
+        return 1
+
+    mean = x.mean()
+    k_n = max(5, int(np.ceil(np.sqrt(np.log10(size)))))
+    m_max = min(int(np.ceil(np.sqrt(size))) + k_n, size - 1)
+    threshold = 2 * np.sqrt(np.log10(size) / size)
+
+    # smallest lag followed by k_n insignificant autocorrelations, among
+    # a few lags computed directly and, failing that, all of them
+    max_lag = min(4 * k_n, m_max)
+    acv = _autocovariance(x, mean, max_lag, direct=True)
+    while True:
+        if not acv[0] > 0:
+            return 1
+        insignificant = np.abs(acv[1:] / acv[0]) < threshold
+        runs = np.convolve(insignificant, np.ones(k_n), "valid") == k_n
+        if runs.any() and 2 * max(np.argmax(runs), 1) <= max_lag:
+            m_hat = np.argmax(runs)
+            break
+        if max_lag == m_max:
+            m_hat = np.argmax(runs) if runs.any() else m_max
+            break
+        max_lag = m_max
+        acv = _autocovariance(x, mean, max_lag)
+
+    m = min(2 * max(m_hat, 1), m_max)
+    lags = np.arange(1, m + 1)
+    window = np.minimum(1, 2 * (1 - lags / m))
+    acv = acv[:m + 1]
+    g = acv[0] + 2 * np.sum(window * acv[1:])
+    big_g = 2 * np.sum(window * lags * acv[1:])
+    d = (2 if block == "stationary" else 4 / 3) * g ** 2
+    if not d > 0:
+        return 1
+
+    length = (2 * big_g ** 2 / d) ** (1 / 3) * size ** (1 / 3)
+    return int(min(max(round(length), 1), size))
+
+
+def _block_values(sample, windows, block, length, rows, width, rng,
+                  carry):
+    """Resampled values of `width` positions for `rows` replicates.
+
+    Moving blocks are gathered from the strided `windows` view of the
+    sample and circular blocks by wrapped indices, from vectorised start
+    indices of every block. Stationary blocks start at each position
+    with probability 1 / `length`, and otherwise continue from the
+    previous position, `carry` holding each replicate's last index from
+    the previous segment. Returns the values and the new carry.
+    """
+
+    size = len(sample)
+    if block != "stationary":
+        blocks = -(-width // length)
+        if block == "moving":
+            starts = rng.integers(0, size - length + 1, size=(rows, blocks))
+            values = np.moveaxis(windows[starts], -1, 2)
+        else:
+            starts = rng.integers(0, size, size=(rows, blocks))
+            offsets = np.arange(length)
+            values = sample[(starts[..., None] + offsets) % size]
+        values = values.reshape((rows, blocks * length) + sample.shape[1:])
+        return values[:, :width], None
+
+    pos = np.arange(width)
+    new = rng.random((rows, width)) < 1 / length
+    if carry is None:
+        new[:, 0] = True
+    first = np.where(new, pos, -1)
+    np.maximum.accumulate(first, axis=1, out=first)
+
+    idx = np.empty((rows, width), dtype=np.int64)
+    idx[new] = rng.integers(0, size, size=np.count_nonzero(new))
+    continued = first >= 0
+    row = np.nonzero(continued)[0]
+    idx[continued] = (idx[row, first[continued]] +
+                      (pos - first)[continued])
+    if carry is not None:
+        # positions before the segment's first new block continue the
+        # previous segment's last block
+        idx[~continued] = (carry[:, None] + 1 + pos)[~continued]
+    idx %= size
+    return sample[idx], idx[:, -1]
+
+
+def _median_ranks(sample):
+    """Ranks of every value of `sample` within its column.
+
+    Returns the ranks, as int32 when they fit, the sorted columns and
+    the number of values that are not NaN in each column, which take the
+    highest ranks. Memory is that of a copy of the sample, whatever the
+    number and length of the replicates.
+    """
+
+    columns = sample.reshape(len(sample), -1)
+    order = np.argsort(columns, axis=0, kind="stable")
+    dtype = np.int32 if len(sample) < 2 ** 31 else np.int64
+    ranks = np.empty(columns.shape, dtype=dtype)
+    np.put_along_axis(ranks, order,
+                      np.arange(len(sample), dtype=dtype)[:, None], axis=0)
+    return (ranks, np.take_along_axis(columns, order, axis=0),
+            np.count_nonzero(~np.isnan(columns), axis=0))
+
+
+def _rank_counts(ranks, key, rows, bins):
+    """Counts of `key` per row and column of gathered `ranks`."""
+
+    cols = ranks.shape[2]
+    cell = (np.arange(rows)[:, None, None] * cols +
+            np.arange(cols)) * bins
+    return np.bincount((cell + key).ravel(),
+                       minlength=rows * cols * bins).reshape(rows, cols,
+                                                             bins)
+
+
+def _block_median(ranks, windows, block, length, n, segment, rows, rng):
+    """Ranks of the two middle order statistics of `rows` replicates.
+
+    Replicates are gathered as ranks `segment` positions at a time, so
+    memory never depends on `n`. A first pass counts the ranks in
+    `2 ** MEDIAN_BUCKET_BITS` buckets, which locates the bucket of each
+    middle order statistic, and a second pass redraws the same segments
+    from the saved generator state to count the exact ranks within
+    those buckets. Also returns the highest rank drawn by each
+    replicate, which tells whether it drew a NaN.
+    """
+
+    size, cols = ranks.shape
+    shift = max((size - 1).bit_length() - MEDIAN_BUCKET_BITS, 0)
+    buckets = ((size - 1) >> shift) + 1
+    width = 1 << shift
+    targets = np.array([(n - 1) // 2, n // 2])
+    state = rng.bit_generator.state
+
+    def segments():
+        carry = None
+        for pos in range(0, n, segment):
+            values, carry = _block_values(ranks, windows, block, length,
+                                          rows, min(segment, n - pos), rng,
+                                          carry)
+            yield values
+
+    counts = np.zeros((rows, cols, buckets), dtype=np.int64)
+    highest = np.zeros((rows, cols), dtype=np.int64)
+    for values in segments():
+        counts += _rank_counts(values, values >> shift, rows, buckets)
+        np.maximum(highest, values.max(axis=1), out=highest)
+
+    # bucket of every target and the number of ranks below that bucket
+    cum = np.cumsum(counts, axis=2)
+    bucket = (cum[..., None, :] <= targets[:, None]).sum(axis=3)
+    below = np.take_along_axis(cum, np.maximum(bucket - 1, 0), axis=2)
+    below[bucket == 0] = 0
+
+    rng.bit_generator.state = state
+    fine = np.zeros((2, rows, cols, width), dtype=np.int64)
+    for values in segments():
+        for t in range(2):
+            offset = values - (bucket[:, None, :, t] << shift)
+            # ranks outside the bucket are counted in a spare last slot
+            key = np.where((offset >= 0) & (offset < width), offset, width)
+            fine[t] += _rank_counts(values, key, rows, width + 1)[..., :-1]
+
+    middle = np.empty((rows, cols, 2), dtype=np.int64)
+    for t in range(2):
+        within = (np.cumsum(fine[t], axis=2) <=
+                  (targets[t] - below[..., t])[..., None]).sum(axis=2)
+        middle[..., t] = (bucket[..., t] << shift) + within
+    return middle, highest
+
+
+def _block_resample_block(sample, n, estimator, block, length, center,
+                          segment, rep, rng, chunk, order_stats=None):
+    """Bootstraps `rep` replicates of a block bootstrap, `chunk` at a time.
+
+    Moment estimators reduce every replicate `segment` positions at a
+    time, as sums of deviations from `center`, so a replicate of a long
+    series never needs to be held at once. Segments of moving and
+    circular bootstraps hold whole blocks, and stationary blocks carry
+    over from one segment to the next. Medians are selected from the
+    ranks of `order_stats`, from `_median_ranks()`, by `_block_median()`
+    within the same segments.
+    """
+
+    windows = None
+    if estimator == "median":
+        ranks, sorted_values, n_valid = order_stats
+        if block == "moving":
+            windows = sliding_window_view(ranks, length, axis=0)
+    elif block == "moving":
+        windows = sliding_window_view(sample, length, axis=0)
+
+    dist = np.empty((rep,) + sample.shape[1:])
+    for start in range(0, rep, chunk):
+        stop = min(start + chunk, rep)
+        rows = stop - start
+        if estimator == "median":
+            middle, highest = _block_median(ranks, windows, block,
+                                            length, n, segment, rows, rng)
+            cols = np.arange(ranks.shape[1])[:, None]
+            median = sorted_values[middle, cols].mean(axis=2)
+            # NaN take the highest ranks, and propagate as in np.median
+            median[highest >= n_valid] = np.nan
+            dist[start:stop] = median.reshape((rows,) + sample.shape[1:])
+            continue
+
+        first = np.zeros((rows,) + sample.shape[1:])
+        second = np.zeros((rows,) + sample.shape[1:])
+        carry = None
+        for pos in range(0, n, segment):
+            values, carry = _block_values(sample, windows, block, length,
+                                          rows, min(segment, n - pos), rng,
+                                          carry)
+            dev = values - center
+            first += dev.sum(axis=1)
+            second += (dev ** 2).sum(axis=1)
+
+        first /= n
+        if estimator == "mean":
+            dist[start:stop] = center + first
+            continue
+        var = np.maximum(second / n - first ** 2, 0)
+        dist[start:stop] = var if estimator == "var" else np.sqrt(var)
+
+    return dist
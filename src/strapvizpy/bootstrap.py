@@ -1,6 +1,15 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from multiprocessing import get_context
+from statistics import NormalDist
 import numpy as np
-import pandas as pd
 import warnings
+from strapvizpy.blocks import (BLOCK_BYTES_PER_POSITION,
+                               MEDIAN_BUCKET_BITS, MEDIAN_BYTES_PER_POSITION,
+                               SUPPORTED_BLOCKS, _block_resample_block,
+                               _median_ranks, optimal_block_length)
 
 # Global constant for supported estimators
 SUPPORTED_ESTIMATORS = {
@@ -10,17 +19,593 @@ SUPPORTED_ESTIMATORS = {
     "sd": np.std
 }
 
-def bootstrap_distribution(sample, rep, n="auto", estimator="mean", random_seed=None):
+# Global constant for supported worker pool backends
+SUPPORTED_BACKENDS = ("thread", "process")
+
+# Global constant for supported resampling engines
+SUPPORTED_ENGINES = ("auto", "numpy", "naive", "multinomial", "numba")
+
+# Global constant for supported policies on NaN in samples
+SUPPORTED_NAN_POLICIES = ("propagate", "omit", "raise")
+
+# Global constant for supported confidence interval methods
+SUPPORTED_METHODS = ("percentile", "basic", "bca", "studentized")
+
+# Moment estimators use the multinomial engine, and medians draw counts
+# from a multinomial rather than by counting indices, when the bootstrap
+# sample size is at least this many times the number of distinct values
+MULTINOMIAL_MIN_RATIO = 32
+
+# Default memory budget, in bytes, for the resamples held at once
+DEFAULT_MAX_BYTES = 2 ** 27
+
+# Default cap on the replicates drawn by adaptive bootstraps
+DEFAULT_MAX_REP = 10 ** 5
+
+# Fewest increments of replicates an adaptive bootstrap estimates its
+# Monte Carlo error from before it may stop
+ADAPTIVE_MIN_BATCHES = 4
+
+
+def _chunk_reps(rep, bytes_per_rep, chunk_reps=None, max_bytes=None):
+    """Number of replicates to resample at once within the memory budget."""
+
+    if chunk_reps is None:
+        if max_bytes is None:
+            max_bytes = DEFAULT_MAX_BYTES
+        chunk_reps = max_bytes // max(bytes_per_rep, 1)
+
+    return int(min(max(chunk_reps, 1), rep))
+
+
+def _check_params(rep, n, estimator):
+    """Validates the replicates, bootstrap sample size and estimator."""
+
+    if not isinstance(rep, int):
+        raise TypeError("rep should be of type 'int'")
+
+    if isinstance(rep, int) and rep < 1:
+        raise ValueError("Invalid value for rep")
+
+    if not (isinstance(n, str) or isinstance(n, int)):
+        raise TypeError("n should be of type 'str' or 'int'")
+
+    if isinstance(n, str) and n != "auto":
+        raise ValueError("Invalid value for n. Did you intend n='auto'?")
+
+    if isinstance(n, int) and n < 1:
+        raise ValueError("Invalid value for n")
+
+    if not isinstance(estimator, str):
+        raise TypeError("estimator should be of type 'str'")
+
+    if estimator not in SUPPORTED_ESTIMATORS.keys():
+        raise ValueError("Supported estimators are mean, median, var, sd")
+
+
+def _check_max_bytes(max_bytes):
+    """Validates a memory budget in bytes."""
+
+    if not (max_bytes is None or isinstance(max_bytes, int)):
+        raise TypeError("max_bytes should be None or of type 'int'")
+
+    if isinstance(max_bytes, int) and max_bytes < 1:
+        raise ValueError("Invalid value for max_bytes")
+
+
+def _check_random_state(random_state):
+    """Validates a seed, SeedSequence or Generator used for resampling."""
+
+    if not (random_state is None or
+            isinstance(random_state, int) or
+            isinstance(random_state, np.random.SeedSequence) or
+            isinstance(random_state, np.random.Generator)):
+        raise TypeError("random_state should be None or of type 'int', "
+                        "numpy.random.SeedSequence or numpy.random.Generator")
+
+    if isinstance(random_state, int) and random_state < 0:
+        raise ValueError("Invalid value for random_state")
+
+
+def _generators(random_state, n_jobs=1):
+    """Independent generators for `n_jobs` workers seeded by `random_state`.
+
+    A single worker draws from `random_state` directly when it is already
+    a Generator, so the caller's stream is advanced as usual. Otherwise
+    every worker gets a PCG64 stream spawned from one SeedSequence, which
+    keeps results reproducible for a given seed and number of workers.
+    """
+
+    if isinstance(random_state, np.random.Generator):
+        if n_jobs == 1:
+            return [random_state]
+        random_state = np.random.SeedSequence(
+            random_state.integers(2 ** 63, size=4)
+        )
+
+    if not isinstance(random_state, np.random.SeedSequence):
+        random_state = np.random.SeedSequence(random_state)
+
+    if n_jobs == 1:
+        return [np.random.default_rng(random_state)]
+
+    return [np.random.default_rng(seed)
+            for seed in random_state.spawn(n_jobs)]
+
+
+def _resample_block(sample, n, estimator, rep, rng, chunk, sort=False,
+                    cum=None):
+    """Bootstraps `rep` replicates drawn from `rng`, `chunk` at a time.
+
+    With `sort`, the indices of each replicate are gathered in ascending
+    order, which leaves every estimator unchanged and reads memory-mapped
+    samples sequentially. With `cum`, the cumulative weights of the rows,
+    indices are drawn in proportion to the weights by searching uniform
+    draws in `cum`.
+    """
+
+    dist = np.empty((rep,) + sample.shape[1:])
+    for start in range(0, rep, chunk):
+        stop = min(start + chunk, rep)
+        if cum is None:
+            idx = rng.integers(0, len(sample), size=(stop - start, n))
+        else:
+            idx = np.searchsorted(cum, rng.random((stop - start, n)) * cum[-1],
+                                  side="right")
+            np.minimum(idx, len(cum) - 1, out=idx)
+        if sort:
+            idx.sort(axis=1)
+        dist[start:stop] = SUPPORTED_ESTIMATORS[estimator](
+            sample[idx],
+            axis=1
+        )
+
+    return dist
+
+
+def _multinomial_block(values, probs, n, estimator, rep, rng, chunk):
+    """Bootstraps moment estimators from multinomial counts of `values`.
+
+    Each replicate draws how often every distinct value (or row, for 2-D
+    samples) is resampled and computes weighted moments about the sample
+    mean, so the cost scales with the number of distinct values instead
+    of with `n`.
+    """
+
+    center = probs @ values
+    dev = values - center
+    dist = np.empty((rep,) + values.shape[1:])
+    for start in range(0, rep, chunk):
+        stop = min(start + chunk, rep)
+        counts = rng.multinomial(n, probs, size=stop - start)
+        shift = counts @ dev / n
+        if estimator == "mean":
+            dist[start:stop] = center + shift
+            continue
+        var = np.maximum(counts @ dev ** 2 / n - shift ** 2, 0)
+        dist[start:stop] = var if estimator == "var" else np.sqrt(var)
+
+    return dist
+
+
+def _count_median(counts, values, n):
+    """Medians of resamples of sorted `values`, one row of `counts` each."""
+
+    rows, k = counts.shape
+
+    # offset each row's running count by the rows before it, so a
+    # single search over the flattened counts serves every replicate
+    cum = np.cumsum(counts, axis=1)
+    cum += np.arange(rows)[:, None] * n
+    base = np.arange(rows) * n
+    lower = np.searchsorted(cum.ravel(), base + (n - 1) // 2, side="right")
+    upper = np.searchsorted(cum.ravel(), base + n // 2, side="right")
+    offset = np.arange(rows) * k
+    return (values[lower - offset] + values[upper - offset]) / 2
+
+
+def _median_block(values, order, probs, n, rep, rng, chunk):
+    """Bootstraps the median as an order statistic of resample counts.
+
+    `values` are sorted, so the median of a replicate is found with a
+    cumulative search over how often each value is resampled and no data
+    is sorted per replicate. Counts are drawn from a multinomial with
+    `probs` when given, otherwise by counting uniform indices. For 2-D
+    samples the counts are over rows and `order` holds, for each column,
+    the rows sorting it, with `values` sorted column by column.
+    """
+
+    k = len(values)
+    dist = np.empty((rep,) + values.shape[1:])
+    for start in range(0, rep, chunk):
+        stop = min(start + chunk, rep)
+        rows = stop - start
+        if probs is None:
+            idx = rng.integers(0, k, size=(rows, n))
+            idx += np.arange(rows)[:, None] * k
+            counts = np.bincount(idx.ravel(), minlength=rows * k)
+            counts = counts.reshape(rows, k)
+        else:
+            counts = rng.multinomial(n, probs, size=rows)
+
+        if order is None:
+            dist[start:stop] = _count_median(counts, values, n)
+            continue
+        for col in range(values.shape[1]):
+            dist[start:stop, col] = _count_median(counts[:, order[:, col]],
+                                                  values[:, col], n)
+
+    return dist
+
+
+def _run_blocks(block, rep, bytes_per_rep, rngs, chunk_reps, max_bytes,
+                backend):
+    """Splits `rep` replicates of `block` across one worker per generator."""
+
+    n_jobs = len(rngs)
+    if n_jobs == 1:
+        chunk = _chunk_reps(rep, bytes_per_rep, chunk_reps, max_bytes)
+        return block(rep, rngs[0], chunk)
+
+    if chunk_reps is None:
+        max_bytes = (max_bytes or DEFAULT_MAX_BYTES) // n_jobs
+    quotient, remainder = divmod(rep, n_jobs)
+    reps = [quotient + (i < remainder) for i in range(n_jobs)]
+
+    if backend == "thread":
+        pool = ThreadPoolExecutor(max_workers=n_jobs)
+    else:
+        # forking a process whose threads (e.g. a numba threading layer)
+        # hold locks can deadlock the children, so workers are spawned
+        pool = ProcessPoolExecutor(max_workers=n_jobs,
+                                   mp_context=get_context("spawn"))
+    with pool as executor:
+        blocks = executor.map(
+            block, reps, rngs,
+            [_chunk_reps(r, bytes_per_rep, chunk_reps, max_bytes)
+             for r in reps]
+        )
+        return np.concatenate(list(blocks))
+
+
+def _is_arrow(sample):
+    """Whether `sample` is a pyarrow Array or ChunkedArray."""
+
+    # pyarrow is optional, and its arrays only exist once it is imported
+    pa = sys.modules.get("pyarrow")
+    return pa is not None and isinstance(sample, (pa.Array, pa.ChunkedArray))
+
+
+def _is_pandas(sample, *kinds):
+    """Whether `sample` is a pandas object of one of `kinds`."""
+
+    # pandas is only imported by callers passing its objects, so it is
+    # never imported here
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(
+        sample, tuple(getattr(pd, kind) for kind in kinds)
+    )
+
+
+def _as_sample(sample):
+    """Validates `sample` and converts it to an array once.
+
+    Contiguous NumPy, pandas and Arrow buffers are viewed rather than
+    copied, and memory-mapped arrays stay memory-mapped, so resampling
+    gathers by index straight from the original buffer.
+    """
+
+    if isinstance(sample, np.ndarray):
+        # keeps np.memmap, whose pages are only read when gathered
+        return sample
+
+    if _is_arrow(sample):
+        # nulls become NaN, which forces a copy of that buffer only
+        return sample.to_numpy(zero_copy_only=False)
+
+    if not (isinstance(sample, list) or
+            _is_pandas(sample, "Series", "DataFrame")):
+        raise TypeError("sample should be one of the types"
+                        "[list, numpy.ndarray, pandas.core.series.Series, "
+                        "pandas.core.frame.DataFrame, pyarrow.Array, "
+                        "pyarrow.ChunkedArray]")
+
+    return np.asarray(sample)
+
+
+def _has_nan(sample, max_bytes=None):
+    """Whether a float `sample` holds NaN, scanned within `max_bytes`."""
+
+    if sample.dtype.kind not in "fc":
+        return False
+
+    row_bytes = max(sample.itemsize * int(np.prod(sample.shape[1:])), 1)
+    step = _chunk_reps(len(sample), row_bytes, None, max_bytes)
+    return any(np.isnan(sample[start:start + step]).any()
+               for start in range(0, len(sample), step))
+
+
+def _check_weights(weights, name, size):
+    """Validates per-row `weights` of a sample of `size` rows."""
+
+    if weights is None:
+        return None
+
+    if not (isinstance(weights, list) or
+            isinstance(weights, np.ndarray) or
+            _is_pandas(weights, "Series") or
+            _is_arrow(weights)):
+        raise TypeError(f"{name} should be None or one of the types"
+                        "[list, numpy.ndarray, pandas.core.series.Series, "
+                        "pyarrow.Array, pyarrow.ChunkedArray]")
+
+    weights = np.asarray(_as_sample(weights), dtype=float)
+
+    if weights.shape != (size,):
+        raise ValueError(f"{name} should have one value per row of sample")
+
+    if not (np.all(weights >= 0) and weights.sum() > 0):
+        raise ValueError(f"Invalid value for {name}")
+
+    if name == "frequencies" and not np.all(weights == np.round(weights)):
+        raise ValueError("Invalid value for frequencies")
+
+    return weights
+
+
+def _prepare_sample(sample, weights=None, frequencies=None,
+                    nan_policy="propagate", max_bytes=None):
+    """Converts a sample and its weights, applying `nan_policy` once.
+
+    Returns the sample, its weights or frequencies (None when not given)
+    and whether they are frequencies.
+    """
+
+    sample = _as_sample(sample)
+
+    if sample.ndim not in (1, 2):
+        raise ValueError("sample should be 1 or 2 dimensional")
+
+    if weights is not None and frequencies is not None:
+        raise ValueError("Only one of weights and frequencies should be set")
+
+    weights = _check_weights(weights, "weights", len(sample))
+    frequencies = _check_weights(frequencies, "frequencies", len(sample))
+    if frequencies is not None:
+        weights = frequencies
+
+    if not isinstance(nan_policy, str):
+        raise TypeError("nan_policy should be of type 'str'")
+
+    if nan_policy not in SUPPORTED_NAN_POLICIES:
+        raise ValueError("Supported nan policies are propagate, omit, raise")
+
+    if nan_policy != "propagate" and _has_nan(sample, max_bytes):
+        if nan_policy == "raise":
+            raise ValueError("sample contains NaN")
+        keep = ~np.isnan(sample.reshape(len(sample), -1)).any(axis=1)
+        sample = sample[keep]
+        if weights is not None:
+            weights = weights[keep]
+        if len(sample) == 0 or (weights is not None and weights.sum() == 0):
+            raise ValueError("sample contains only NaN")
+
+    return sample, weights, frequencies is not None
+
+
+def _sample_size(sample, weights, is_frequencies):
+    """Number of observations a sample and its frequencies stand for."""
+
+    if is_frequencies:
+        return int(weights.sum())
+    return len(sample)
+
+
+def _estimate(sample, estimator, weights=None):
+    """Applies `estimator` to `sample`, weighting its rows by `weights`.
+
+    The weighted median averages the values at which the cumulative
+    weight first reaches and first exceeds half the total weight, which
+    for frequencies is the median of the expanded sample.
+    """
+
+    if weights is None:
+        return SUPPORTED_ESTIMATORS[estimator](sample, axis=0)
+
+    if estimator == "median":
+        order = np.argsort(sample, axis=0, kind="stable")
+        values = np.take_along_axis(sample, order, axis=0)
+        cum = np.cumsum(weights[order], axis=0)
+        half = cum[-1] / 2
+        if sample.ndim == 1:
+            lower = np.searchsorted(cum, half, side="left")
+            upper = np.searchsorted(cum, half, side="right")
+            return (values[lower] + values[min(upper, len(cum) - 1)]) / 2
+        return np.array([
+            (values[np.searchsorted(cum[:, col], half[col], side="left"), col]
+             + values[min(np.searchsorted(cum[:, col], half[col],
+                                          side="right"), len(cum) - 1), col])
+            / 2 for col in range(sample.shape[1])
+        ])
+
+    mean = np.average(sample, weights=weights, axis=0)
+    if estimator == "mean":
+        return mean
+    var = np.average((sample - mean) ** 2, weights=weights, axis=0)
+    return var if estimator == "var" else np.sqrt(var)
+
+
+def _check_block(block, block_length, size, weighted):
+    """Validates a block bootstrap of a sample of `size` rows."""
+
+    if not (block is None or isinstance(block, str)):
+        raise TypeError("block should be None or of type 'str'")
+
+    if isinstance(block, str) and block not in SUPPORTED_BLOCKS:
+        raise ValueError("Supported blocks are moving, circular, stationary")
+
+    if not (isinstance(block_length, str) or isinstance(block_length, int)):
+        raise TypeError("block_length should be of type 'str' or 'int'")
+
+    if isinstance(block_length, str) and block_length != "auto":
+        raise ValueError("Invalid value for block_length. Did you intend "
+                         "block_length='auto'?")
+
+    if isinstance(block_length, int) and not 1 <= block_length <= size:
+        raise ValueError("Invalid value for block_length")
+
+    if block is not None and weighted:
+        raise ValueError("Block bootstraps do not support weights")
+
+
+def _check_bootstrap(sample, rep, n, estimator, random_seed, chunk_reps,
+                     max_bytes, n_jobs, backend, random_state, engine,
+                     weights=None, frequencies=None, nan_policy="propagate",
+                     block=None, block_length="auto"):
+    """Validates the arguments of `bootstrap_distribution()`.
+
+    Returns the sample as an array, its weights (None when unweighted),
+    the bootstrap sample size, the number of workers and the random
+    state to resample with.
+    """
+
+    sample, weights, is_frequencies = _prepare_sample(
+        sample, weights, frequencies, nan_policy, max_bytes
+    )
+
+    _check_params(rep, n, estimator)
+
+    if not (random_seed is None or isinstance(random_seed, int)):
+        raise TypeError("random_seed should be None or of type 'int'")
+
+    if isinstance(random_seed, int) and random_seed < 0:
+        raise ValueError("Invalid value for random_seed")
+
+    _check_random_state(random_state)
+
+    if random_seed is not None and random_state is not None:
+        raise ValueError("Only one of random_seed and random_state "
+                         "should be set")
+
+    if random_seed is not None:
+        random_state = random_seed
+
+    if not (chunk_reps is None or isinstance(chunk_reps, int)):
+        raise TypeError("chunk_reps should be None or of type 'int'")
+
+    if isinstance(chunk_reps, int) and chunk_reps < 1:
+        raise ValueError("Invalid value for chunk_reps")
+
+    _check_max_bytes(max_bytes)
+
+    if not isinstance(n_jobs, int):
+        raise TypeError("n_jobs should be of type 'int'")
+
+    if n_jobs == 0 or n_jobs < -1:
+        raise ValueError("Invalid value for n_jobs")
+
+    if not isinstance(backend, str):
+        raise TypeError("backend should be of type 'str'")
+
+    if backend not in SUPPORTED_BACKENDS:
+        raise ValueError("Supported backends are thread, process")
+
+    if not isinstance(engine, str):
+        raise TypeError("engine should be of type 'str'")
+
+    if engine not in SUPPORTED_ENGINES:
+        raise ValueError("Supported engines are auto, numpy, naive, "
+                         "multinomial, numba")
+
+    if engine == "numba":
+        from strapvizpy import _numba
+
+        if _numba.numba is None:
+            raise ImportError("The numba engine requires numba to be "
+                              "installed")
+
+        if weights is not None:
+            raise ValueError("The numba engine does not support weights")
+
+    _check_block(block, block_length, len(sample), weights is not None)
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+
+    n_jobs = min(n_jobs, rep)
+
+    if n == "auto":
+        n = _sample_size(sample, weights, is_frequencies)
+
+    return sample, weights, n, n_jobs, random_state
+
+
+def bootstrap_distribution(sample, rep, n="auto", estimator="mean", random_seed=None,
+                           chunk_reps=None, max_bytes=None, n_jobs=1, backend="thread",
+                           random_state=None, engine="auto", weights=None, frequencies=None,
+                           nan_policy="propagate", block=None, block_length="auto"):
     """Bootstraps a sampling distribution for a sample.
 
     A sampling distribution of `rep` replicates is generated
     for the specified `estimator`with replacement with a
-    bootstrap sample size of `n`.
+    bootstrap sample size of `n`. Replicates are resampled and
+    reduced in chunks, so peak memory scales with the chunk size
+    rather than with `rep` * `n`. With `n_jobs` > 1 the replicates
+    are split across a pool of workers, each drawing from its own
+    stream spawned from `numpy.random.SeedSequence(random_state)`, so
+    results are reproducible for a given seed and number of workers.
+    The global NumPy random state is never touched, so concurrent
+    calls do not interfere with each other.
+
+    The "multinomial" engine draws how often each sample value is
+    resampled instead of gathering `rep` * `n` values. Means, variances
+    and standard deviations are weighted moments of the distinct values,
+    and medians are found by a cumulative search over the counts of the
+    sorted sample. "auto" selects it for medians and, for the other
+    estimators, when `n` is much larger than the number of distinct
+    values. "naive" always gathers the resamples, and is also used for
+    samples containing NaN so that replicates drawing one are NaN.
+
+    The opt-in "numba" engine, which requires numba, runs a compiled
+    kernel that fuses index generation, gathering and reduction for each
+    replicate, in parallel over replicates and without allocating the
+    resamples. It runs on `n_jobs` numba threads rather than a worker
+    pool, so with the default `n_jobs=1` it is serial: pass `n_jobs=-1`
+    (or a number of threads) for it to run in parallel. Its results do
+    not depend on `n_jobs`. "auto" and its alias "numpy" only select
+    among the NumPy engines.
+
+    Samples are converted to an array once, viewing rather than copying
+    contiguous NumPy, pandas and pyarrow buffers. Memory-mapped samples
+    (`np.memmap`) are never loaded whole: "auto" gathers their resamples
+    by index, in ascending order within each replicate, so only the
+    pages drawn are read. The process backend pickles the sample into
+    every worker, so threads suit memory-mapped samples better.
+
+    Pre-aggregated samples are resampled from their compressed form:
+    `frequencies` gives how often each row was observed, and `weights`
+    any non-negative row weights, to which resampling probabilities are
+    proportional. The multinomial engines draw counts of the distinct
+    values with those probabilities, and "naive" draws rows by searching
+    uniform draws in the cumulative weights, so the sample is never
+    expanded. `nan_policy` is applied once, before resampling.
+
+    For autocorrelated time series, `block` resamples blocks of
+    consecutive observations instead of single ones: "moving" blocks of
+    `block_length` start anywhere they fit, "circular" blocks wrap around
+    the end of the series, and "stationary" blocks have geometric
+    lengths of mean `block_length`. Block starts are drawn in vectorised
+    form and moving blocks gathered from a strided view of the series.
+    "auto" chooses the length with `optimal_block_length()`. Means,
+    variances and standard deviations are reduced a segment of blocks
+    at a time, so long series stay within the memory budget. Block
+    bootstraps always gather, whatever the `engine`.
 
     Parameters
     ----------
-    sample : list or numpy.ndarray or pandas.core.series.Series 
-        sample to bootstrap
+    sample : list or numpy.ndarray or pandas.core.series.Series or pandas.core.frame.DataFrame or pyarrow.Array
+        sample to bootstrap, 2-D samples are resampled by row and every
+        column is bootstrapped from the same resampled rows
     rep : int
         number of replicates of the distribution
     n : str or int, default="auto"
@@ -28,12 +613,42 @@ def bootstrap_distribution(sample, rep, n="auto", estimator="mean", random_seed=
     estimator : {"mean", "median", "var", "sd"}
         sampling distributor's estimator
     random_seed : None or int, default=None
-        seed for random state
+        seed for random state, shorthand for an int `random_state`
+    chunk_reps : None or int, default=None
+        number of replicates resampled at once, overrides `max_bytes`
+    max_bytes : None or int, default=None
+        memory budget in bytes for the resamples of a single chunk,
+        None uses `DEFAULT_MAX_BYTES`, shared between the workers
+    n_jobs : int, default=1
+        number of workers, -1 uses all available cores
+    backend : {"thread", "process"}, default="thread"
+        type of worker pool used when `n_jobs` > 1, process workers are
+        spawned rather than forked
+    random_state : None or int or numpy.random.SeedSequence or numpy.random.Generator, default=None
+        seed, seed sequence or generator for the resampling streams
+    engine : {"auto", "numpy", "naive", "multinomial", "numba"}, default="auto"
+        resampling engine, "naive" forces gathering the resamples and
+        "numba" runs on `n_jobs` threads, serially unless `n_jobs` is set
+    weights : None or list or numpy.ndarray or pandas.core.series.Series or pyarrow.Array, default=None
+        non-negative weight of every row, with `n` "auto" using the
+        number of rows
+    frequencies : None or list or numpy.ndarray or pandas.core.series.Series or pyarrow.Array, default=None
+        integer count of every row, with `n` "auto" using their total
+    nan_policy : {"propagate", "omit", "raise"}, default="propagate"
+        "omit" drops rows holding NaN, "raise" raises a ValueError, and
+        "propagate" keeps them so that replicates drawing one are NaN
+    block : None or {"moving", "circular", "stationary"}, default=None
+        block bootstrap of a time series, None resamples observations
+        independently
+    block_length : str or int, default="auto"
+        (expected) length of the blocks, "auto" chooses it from the
+        autocorrelation of the sample
     
     Returns
     -------
     numpy.ndarray
-        bootstrapped sampling distribution
+        bootstrapped sampling distribution, of shape (`rep`, n_columns)
+        for 2-D samples
     
     Examples
     --------
@@ -41,51 +656,428 @@ def bootstrap_distribution(sample, rep, n="auto", estimator="mean", random_seed=
     array([1.66, 2, 2.66])
     """
 
-    if not (isinstance(sample, list) or
-            isinstance(sample, np.ndarray) or
-            isinstance(sample, pd.Series)):
-        raise TypeError("sample should be one of the types"
-                        "[list, numpy.ndarray, pandas.core.series.Series]")
+    sample, weights, n, n_jobs, random_state = _check_bootstrap(
+        sample, rep, n, estimator, random_seed, chunk_reps, max_bytes,
+        n_jobs, backend, random_state, engine, weights, frequencies,
+        nan_policy, block, block_length
+    )
 
-    if not isinstance(rep, int):
-        raise TypeError("rep should be of type 'int'")
+    if block is not None:
+        return _block_distribution(sample, rep, n, estimator, chunk_reps,
+                                   max_bytes, n_jobs, backend, random_state,
+                                   block, block_length)
 
-    if isinstance(rep, int) and rep < 1:
-        raise ValueError("Invalid value for rep")
+    # counting engines would drop NaN from the resamples, so samples with
+    # missing values are always gathered and propagate NaN like NumPy
+    if engine != "numba" and _has_nan(sample, max_bytes):
+        engine = "naive"
 
-    if not (isinstance(n, str) or isinstance(n, int)):
-        raise TypeError("n should be of type 'str' or 'int'")
+    # finding the distinct values of a memory-mapped sample would read
+    # and sort all of it, so its resamples are gathered by index instead
+    mapped = isinstance(sample, np.memmap)
+    if mapped and engine in ("auto", "numpy"):
+        engine = "naive"
 
-    if isinstance(n, str) and n != "auto":
-        raise ValueError("Invalid value for n. Did you intend n='auto'?")
+    if engine in ("auto", "numpy", "multinomial"):
+        axis = 0 if sample.ndim == 2 else None
+        if weights is None:
+            values, counts = np.unique(sample, return_counts=True,
+                                       axis=axis)
+            probs = counts / len(sample)
+        else:
+            # probabilities of the distinct values, summed over their rows
+            values, inverse = np.unique(sample, return_inverse=True,
+                                        axis=axis)
+            probs = np.bincount(inverse.ravel(), weights=weights,
+                                minlength=len(values))
+            probs /= probs.sum()
+        few_values = len(values) * MULTINOMIAL_MIN_RATIO <= n
+        if engine != "multinomial":
+            # weighted medians can only count values by multinomial draws,
+            # which pay off once there are fewer values than draws
+            use_counts = few_values or (estimator == "median" and
+                                        (weights is None or len(values) <= n))
+            engine = "multinomial" if use_counts else "naive"
 
-    if isinstance(n, int) and n < 1:
-        raise ValueError("Invalid value for n")
+    if engine == "multinomial" and estimator == "median":
+        if not few_values and weights is None:
+            # count indices into the sorted sample
+            values, probs = np.repeat(values, counts, axis=0), None
+        order = None
+        if sample.ndim == 2:
+            order = np.argsort(values, axis=0, kind="stable")
+            values = np.take_along_axis(values, order, axis=0)
+        block = partial(_median_block, values, order, probs, n)
+        # index draws, counts, and their per-column reordering and sums
+        bytes_per_rep = 8 * ((probs is None) * n + 3 * len(values))
+    elif engine == "numba":
+        # numba is slow to import, so it is only loaded when requested
+        from strapvizpy import _numba
 
-    if not isinstance(estimator, str):
-        raise TypeError("estimator should be of type 'str'")
+        # the kernel is already parallel over replicates, and calling it
+        # from several Python workers at once stalls numba's thread pool
+        return _numba.numba_block(sample, n, estimator, rep,
+                                  _generators(random_state)[0],
+                                  n_threads=n_jobs)
+    elif engine == "multinomial":
+        block = partial(_multinomial_block, values.astype(float), probs, n,
+                        estimator)
+        # multinomial counts plus the weighted moment temporaries
+        bytes_per_rep = 3 * 8 * len(values)
+    else:
+        cum = None if weights is None else np.cumsum(weights)
+        block = partial(_resample_block, sample, n, estimator,
+                        sort=mapped, cum=cum)
+        # resample indices (and uniform draws, when weighted) plus
+        # gathered values (and the estimator's float64 temporaries) for
+        # one replicate
+        bytes_per_rep = n * (8 * (1 + (cum is not None)) +
+                             int(np.prod(sample.shape[1:])) *
+                             max(sample.itemsize, 8))
 
-    if estimator not in SUPPORTED_ESTIMATORS.keys():
-        raise ValueError("Supported estimators are mean, median, var, sd")
+    return _run_blocks(block, rep, bytes_per_rep,
+                       _generators(random_state, n_jobs),
+                       chunk_reps, max_bytes, backend)
 
-    if not (random_seed is None or isinstance(random_seed, int)):
-        raise TypeError("random_seed should be None or of type 'int'")
+def _block_distribution(sample, rep, n, estimator, chunk_reps, max_bytes,
+                        n_jobs, backend, random_state, block, block_length):
+    """Bootstraps a validated sample by blocks, within the memory budget."""
 
-    if isinstance(random_seed, int) and random_seed < 0:
-        raise ValueError("Invalid value for random_seed")
+    if block_length == "auto":
+        block_length = optimal_block_length(sample, block)
 
-    if random_seed:
-        np.random.seed(random_seed)
+    columns = int(np.prod(sample.shape[1:]))
+    bytes_per_position = BLOCK_BYTES_PER_POSITION[block] * columns
+    # medians count the ranks of every replicate in buckets, and then
+    # within the buckets of its middle order statistics
+    order_stats, bytes_per_rep = None, 0
+    if estimator == "median":
+        order_stats = _median_ranks(sample)
+        bytes_per_position += MEDIAN_BYTES_PER_POSITION * columns
+        # bucket counts plus the within-bucket counts of both targets
+        width = 2 ** max(len(sample).bit_length() - MEDIAN_BUCKET_BITS, 0)
+        bytes_per_rep = 8 * columns * (2 ** MEDIAN_BUCKET_BITS + 2 * width)
+    budget = (max_bytes or DEFAULT_MAX_BYTES) // n_jobs
+    # whole blocks per segment, at least one
+    segment = budget // bytes_per_position // block_length
+    segment = min(max(segment, 1) * block_length, n)
 
-    if n == "auto":
-        n = len(sample)
+    center = np.nanmean(sample, axis=0) if len(sample) else 0.0
+    worker = partial(_block_resample_block, sample, n, estimator, block,
+                     block_length, center, segment,
+                     order_stats=order_stats)
+    return _run_blocks(worker, rep,
+                       bytes_per_position * segment + bytes_per_rep,
+                       _generators(random_state, n_jobs), chunk_reps,
+                       max_bytes, backend)
+
+
+def _check_level(level):
+    """Validates a confidence level, warning when it looks like an alpha."""
+
+    if not isinstance(level, float):
+        raise TypeError("level should be of type 'float'")
+
+    if not (level > 0 and level < 1):
+        raise ValueError("level should be between 0 and 1")
+
+    if level < 0.7:
+        warnings.warn("Warning: chosen level is quite \
+            low--level is a confidence level, not a signficance level")
+
+
+def _check_method(method, estimator, weighted=False, block=None):
+    """Validates a confidence interval method for the estimator."""
+
+    if not isinstance(method, str):
+        raise TypeError("method should be of type 'str'")
+
+    if method not in SUPPORTED_METHODS:
+        raise ValueError("Supported methods are percentile, basic, bca, "
+                         "studentized")
+
+    if method == "studentized" and estimator == "median":
+        raise ValueError("The studentized method supports the mean, var "
+                         "and sd estimators")
+
+    if weighted and method in ("bca", "studentized"):
+        raise ValueError("The bca and studentized methods do not support "
+                         "weights")
+
+    if block is not None and method in ("bca", "studentized"):
+        raise ValueError("The bca and studentized methods do not support "
+                         "block bootstraps")
+
+
+def _jackknife(sample, estimator):
+    """Leave-one-out estimates of `sample`, along its first axis.
+
+    Moment estimators use closed forms in the deviations from the mean,
+    and medians are read off the sorted sample, whose median without the
+    `i`-th smallest value is a neighbouring order statistic, so no
+    estimator is evaluated once per left out value.
+    """
+
+    x = np.asarray(sample, dtype=float)
+    m = len(x)
+
+    if estimator == "median":
+        ordered = np.sort(x, axis=0)
+        left_out = np.arange(m).reshape((m,) + (1,) * (x.ndim - 1))
+
+        def order_stat(k):
+            return np.where(k < left_out, ordered[k], ordered[k + 1])
+
+        return (order_stat((m - 2) // 2) + order_stat((m - 1) // 2)) / 2
+
+    dev = x - x.mean(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        shift = -dev / (m - 1)
+        if estimator == "mean":
+            return x.mean(axis=0) + shift
+        var = np.maximum(((dev ** 2).sum(axis=0) - dev ** 2) / (m - 1) -
+                         shift ** 2, 0)
+    return var if estimator == "var" else np.sqrt(var)
+
+
+def _estimate_se(x, n, estimator, axis=0):
+    """Moment estimates along `axis` of `x` and their plug-in standard
+    errors for a sample of size `n`."""
+
+    mean = x.mean(axis=axis)
+    dev = x - np.expand_dims(mean, axis)
+    m2 = (dev ** 2).mean(axis=axis)
+    m4 = (dev ** 4).mean(axis=axis)
+    var_se = np.sqrt(np.maximum(m4 - m2 ** 2, 0) / n)
+
+    if estimator == "mean":
+        return mean, np.sqrt(m2 / n)
+    if estimator == "var":
+        return m2, var_se
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.sqrt(m2), var_se / (2 * np.sqrt(m2))
+
+
+def _studentized_block(sample, n, estimator, rep, rng, chunk):
+    """Bootstraps estimates alongside each replicate's standard error.
+
+    Resamples are drawn exactly as by `_resample_block()`. Returns an
+    array of shape (`rep`, 2, ...) holding each estimate followed by its
+    plug-in standard error.
+    """
 
-    return SUPPORTED_ESTIMATORS[estimator](
-        np.random.choice(sample, size=(rep, n), replace=True),
-        axis=1
+    out = np.empty((rep, 2) + sample.shape[1:])
+    for start in range(0, rep, chunk):
+        stop = min(start + chunk, rep)
+        idx = rng.integers(0, len(sample), size=(stop - start, n))
+        estimate, se = _estimate_se(sample[idx].astype(float), n, estimator,
+                                    axis=1)
+        out[start:stop, 0] = estimate
+        out[start:stop, 1] = se
+
+    return out
+
+
+def _column_quantile(dist, q):
+    """Linearly interpolated quantiles of `dist` along its first axis,
+    with a separate `q` for every column."""
+
+    ordered = np.sort(dist, axis=0)
+    pos = np.asarray(q) * (len(dist) - 1)
+    low = np.floor(pos).astype(np.int64)
+    high = np.minimum(low + 1, len(dist) - 1)
+
+    def take(idx):
+        return np.take_along_axis(ordered, idx[None, ...], axis=0)[0]
+
+    return take(low) + (take(high) - take(low)) * (pos - low)
+
+
+def _interval(dist, sample, estimate, level, estimator, method, n,
+              dist_se=None):
+    """Lower and upper bounds of a bootstrapped confidence interval.
+
+    "percentile" takes the percentiles of `dist` and "basic" reflects
+    them about `estimate`. "bca" shifts the percentiles by a bias
+    correction from the share of replicates below `estimate` and an
+    acceleration from the skewness of the jackknife estimates of
+    `sample`. "studentized" takes the percentiles of the replicates'
+    t-statistics, using their standard errors `dist_se`.
+    """
+
+    alpha = 1 - level
+    if method in ("percentile", "basic"):
+        lower, upper = np.percentile(dist, [100 * alpha/2,
+                                            100 * (1 - alpha/2)], axis=0)
+        if method == "basic":
+            lower, upper = 2 * estimate - upper, 2 * estimate - lower
+        return lower, upper
+
+    normal = NormalDist()
+    z = np.array([normal.inv_cdf(alpha/2), normal.inv_cdf(1 - alpha/2)])
+
+    if method == "studentized":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t = (dist - estimate) / dist_se
+        t[~np.isfinite(t)] = np.nan
+        t_low, t_high = np.nanpercentile(t, [100 * alpha/2,
+                                             100 * (1 - alpha/2)], axis=0)
+        _, se = _estimate_se(np.asarray(sample, dtype=float), n, estimator)
+        return estimate - t_high * se, estimate - t_low * se
+
+    # ties count half, so discrete distributions are not biased
+    rep = len(dist)
+    below = (np.sum(dist < estimate, axis=0) +
+             np.sum(dist == estimate, axis=0) / 2) / rep
+    below = np.clip(below, 1 / (2 * rep), 1 - 1 / (2 * rep))
+    z0 = np.vectorize(normal.inv_cdf, otypes=[float])(below)
+
+    dev = _jackknife(sample, estimator)
+    dev = dev.mean(axis=0) - dev
+    with np.errstate(invalid="ignore", divide="ignore"):
+        accel = ((dev ** 3).sum(axis=0) /
+                 (6 * ((dev ** 2).sum(axis=0)) ** 1.5))
+    accel = np.nan_to_num(accel, nan=0.0, posinf=0.0, neginf=0.0)
+
+    cdf = np.vectorize(normal.cdf, otypes=[float])
+    bounds = [
+        _column_quantile(dist, cdf(z0 + (z0 + z_a) / (1 - accel * (z0 + z_a))))
+        for z_a in z
+    ]
+    return bounds[0], bounds[1]
+
+
+def _replicates(sample, rep, n, estimator, random_seed, chunk_reps,
+                max_bytes, n_jobs, backend, random_state, engine, method,
+                weights=None, frequencies=None, block=None,
+                block_length="auto"):
+    """Bootstraps `rep` replicates for a confidence interval `method`.
+
+    Returns the distribution and, for studentized intervals, the
+    standard error of every replicate, otherwise None.
+    """
+
+    if method != "studentized":
+        # get the bootstrapped mean vector
+        return bootstrap_distribution(sample=sample,
+                                      rep=rep,
+                                      n=n,
+                                      estimator=estimator,
+                                      random_seed=random_seed,
+                                      chunk_reps=chunk_reps,
+                                      max_bytes=max_bytes,
+                                      n_jobs=n_jobs,
+                                      backend=backend,
+                                      random_state=random_state,
+                                      engine=engine,
+                                      weights=weights,
+                                      frequencies=frequencies,
+                                      block=block,
+                                      block_length=block_length), None
+
+    sample, _, n, n_jobs, random_state = _check_bootstrap(
+        sample, rep, n, estimator, random_seed, chunk_reps, max_bytes,
+        n_jobs, backend, random_state, engine
+    )
+    # resample indices plus gathered values and their moment
+    # temporaries for one replicate
+    bytes_per_rep = n * (8 + 3 * 8 * int(np.prod(sample.shape[1:])))
+    dist, dist_se = np.moveaxis(
+        _run_blocks(partial(_studentized_block, sample, n, estimator),
+                    rep, bytes_per_rep, _generators(random_state, n_jobs),
+                    chunk_reps, max_bytes, backend), 1, 0
     )
+    return dist, dist_se
+
+
+def _check_adaptive(rep, tol, max_rep):
+    """Validates the tolerance and replicate cap of adaptive bootstraps."""
+
+    if not (tol is None or isinstance(tol, float)):
+        raise TypeError("tol should be None or of type 'float'")
+
+    if isinstance(tol, float) and not tol > 0:
+        raise ValueError("Invalid value for tol")
+
+    if not (max_rep is None or isinstance(max_rep, int)):
+        raise TypeError("max_rep should be None or of type 'int'")
+
+    # the Monte Carlo error is estimated from at least two increments
+    if isinstance(max_rep, int) and isinstance(rep, int) and \
+            max_rep < 2 * rep:
+        raise ValueError("Invalid value for max_rep")
+
+
+def _adaptive_replicates(draw, interval, rep, rng, tol, max_rep):
+    """Draws increments of `rep` replicates until the bounds converge.
+
+    The Monte Carlo error of the lower and upper bounds and of the
+    standard error is estimated by batch means, from their spread
+    across increments. Drawing stops once every error is within `tol`,
+    after at least `ADAPTIVE_MIN_BATCHES` increments, or when another
+    increment would exceed `max_rep` replicates.
+
+    Returns
+    -------
+    tuple
+        distribution, standard errors of the replicates (or None) and
+        Monte Carlo errors of the lower bound, upper bound and standard
+        error
+    """
+
+    dists, dist_ses, batch_stats = [], [], []
+    while True:
+        dist, dist_se = draw(rep=rep, random_seed=None, random_state=rng)
+        dists.append(dist)
+        dist_ses.append(dist_se)
+        batch_stats.append([*interval(dist, dist_se=dist_se),
+                            np.std(dist, axis=0)])
+
+        batches = len(dists)
+        if batches > 1:
+            mc_error = (np.std(batch_stats, axis=0, ddof=1) /
+                        np.sqrt(batches))
+        else:
+            mc_error = np.full(np.shape(batch_stats[0]), np.nan)
+
+        if batches >= ADAPTIVE_MIN_BATCHES and np.all(mc_error <= tol):
+            break
+        if (batches + 1) * rep > max_rep:
+            break
+
+    dist_se = None if dist_ses[0] is None else np.concatenate(dist_ses)
+    return np.concatenate(dists), dist_se, mc_error
 
-def calculate_boot_stats(sample, rep, n="auto", level=0.95, estimator="mean", random_seed=None, pass_dist=False):
+
+def _boot_stats(dist, sample_estimate, level, sample_size, n, rep,
+                estimator, bounds=None):
+    """Builds the stats dictionary of a bootstrapped distribution.
+
+    `bounds` holds the lower and upper confidence bounds, by default the
+    percentiles of `dist`.
+    """
+
+    stats_dict = {}
+
+    if bounds is None:
+        bounds = (np.percentile(dist, 100 * (1-level)/2, axis=0),
+                  np.percentile(dist, 100 * (1-(1-level)/2), axis=0))
+    stats_dict["lower"], stats_dict["upper"] = bounds
+    stats_dict["sample_" + estimator] = sample_estimate
+    stats_dict["std_err"] = np.std(dist, axis=0)
+    stats_dict["level"] = level
+    stats_dict["sample_size"] = sample_size
+    stats_dict["n"] = n
+    stats_dict["rep"] = rep
+    stats_dict["estimator"] = estimator
+
+    return stats_dict
+
+
+def calculate_boot_stats(sample, rep, n="auto", level=0.95, estimator="mean", random_seed=None, pass_dist=False,
+                         chunk_reps=None, max_bytes=None, n_jobs=1, backend="thread", random_state=None,
+                         engine="auto", method="percentile", tol=None, max_rep=None, weights=None,
+                         frequencies=None, nan_policy="propagate", block=None, block_length="auto"):
     """Calculates a bootstrapped confidence interval for a sample.
 
     A bootstrapped confidence interval for the desired estimator for
@@ -93,10 +1085,32 @@ def calculate_boot_stats(sample, rep, n="auto", level=0.95, estimator="mean", ra
     Other stats and parameters of the distribution and sample are
     also returned. 
 
+    Besides percentile intervals, `method` offers basic intervals,
+    reflected about the sample estimate, and bias-corrected and
+    accelerated ("bca") and studentized intervals, whose coverage on
+    skewed data converges at far fewer replicates. The BCa acceleration
+    comes from a jackknife computed in closed form, and studentized
+    intervals use each replicate's plug-in standard error, so they are
+    available for the moment estimators and always gather resamples.
+
+    With `tol`, replicates are drawn adaptively in increments of `rep`
+    until the Monte Carlo errors of the bounds and standard error, found
+    by batch means over the increments, are all within `tol`, or
+    `max_rep` replicates have been drawn.
+
+    `weights`, `frequencies` and `nan_policy` are applied once as in
+    `bootstrap_distribution()`, and the sample estimate is weighted
+    alike. Weighted samples support percentile and basic intervals.
+
+    `block` bootstraps an autocorrelated time series by blocks, whose
+    automatic length is chosen once and reported as "block_length".
+    Block bootstraps also support percentile and basic intervals.
+
     Parameters
     ----------
-    sample : list or numpy.ndarray or pandas.core.series.Series 
-        sample to bootstrap
+    sample : list or numpy.ndarray or pandas.core.series.Series or pandas.core.frame.DataFrame or pyarrow.Array
+        sample to bootstrap, 2-D samples are resampled by row and every
+        column is bootstrapped from the same resampled rows
     rep : int
         number of replicates of the distribution
     n : str or int, default="auto"
@@ -109,13 +1123,53 @@ def calculate_boot_stats(sample, rep, n="auto", level=0.95, estimator="mean", ra
         seed for random state
     pass_dist : bool, default = "False"
         return the bootstrapped sample distribution - False or True 
+    chunk_reps : None or int, default=None
+        number of replicates resampled at once, overrides `max_bytes`
+    max_bytes : None or int, default=None
+        memory budget in bytes for the resamples of a single chunk
+    n_jobs : int, default=1
+        number of workers, -1 uses all available cores
+    backend : {"thread", "process"}, default="thread"
+        type of worker pool used when `n_jobs` > 1, process workers are
+        spawned rather than forked
+    random_state : None or int or numpy.random.SeedSequence or numpy.random.Generator, default=None
+        seed, seed sequence or generator for the resampling streams
+    engine : {"auto", "numpy", "naive", "multinomial", "numba"}, default="auto"
+        resampling engine, "naive" forces gathering the resamples and
+        "numba" runs on `n_jobs` threads, serially unless `n_jobs` is set
+    method : {"percentile", "basic", "bca", "studentized"}, default="percentile"
+        confidence interval method
+    tol : None or float, default=None
+        Monte Carlo error at which adaptive bootstrapping stops, None
+        draws `rep` replicates once
+    max_rep : None or int, default=None
+        cap on the replicates drawn adaptively, at least two increments of
+        `rep`, None uses `DEFAULT_MAX_REP` or `ADAPTIVE_MIN_BATCHES`
+        increments if more
+    weights : None or list or numpy.ndarray or pandas.core.series.Series or pyarrow.Array, default=None
+        non-negative weight of every row
+    frequencies : None or list or numpy.ndarray or pandas.core.series.Series or pyarrow.Array, default=None
+        integer count of every row, whose total is the sample size
+    nan_policy : {"propagate", "omit", "raise"}, default="propagate"
+        handling of rows holding NaN
+    block : None or {"moving", "circular", "stationary"}, default=None
+        block bootstrap of a time series, None resamples observations
+        independently
+    block_length : str or int, default="auto"
+        (expected) length of the blocks, "auto" chooses it from the
+        autocorrelation of the sample
     
     Returns
     -------
     dictionary
         Dictionary containing lower and upper bootstrapped confidence
         interval for the desired estimator, along with the given estimator.
-        Also 
+        Also other stats and parameters. For 2-D samples the bounds,
+        estimate and standard error are arrays with one entry per column.
+        With `block`, "block" and "block_length" hold the block bootstrap.
+        With `tol`, "rep_used" holds the number of replicates drawn and
+        "mc_error_lower", "mc_error_upper" and "mc_error_std_err" their
+        estimated Monte Carlo errors.
     
     Examples
     --------
@@ -123,7 +1177,7 @@ def calculate_boot_stats(sample, rep, n="auto", level=0.95, estimator="mean", ra
     {'lower': 1.5,
     'upper': 3.5,
     'sample_mean': 2.5,
-    'std_err': 0.5414773771820943,
+    'std_err': 0.5778319392349301,
     'level': 0.95,
     'sample size': 4,
     'n': 'auto',
@@ -131,37 +1185,68 @@ def calculate_boot_stats(sample, rep, n="auto", level=0.95, estimator="mean", ra
     'estimator': 'mean'}
     """
 
-    if not isinstance(level, float):
-        raise TypeError("level should be of type 'float'")
-
-    if not (level > 0 and level < 1):
-        raise ValueError("level should be between 0 and 1")
+    _check_level(level)
 
     if not isinstance(pass_dist, bool):
         raise TypeError("pass_dist should be of type 'bool'")
 
-    if level < 0.7:
-        warnings.warn("Warning: chosen level is quite \
-            low--level is a confidence level, not a signficance level")
+    # converted once, with NaN handled, and shared by every draw
+    sample, weights, is_frequencies = _prepare_sample(
+        sample, weights, frequencies, nan_policy, max_bytes
+    )
+    sample_size = _sample_size(sample, weights, is_frequencies)
 
-    # get the bootstrapped mean vector
-    dist = bootstrap_distribution(sample=sample,
-                                  rep=rep,
-                                  n=n,
-                                  estimator=estimator,
-                                  random_seed=random_seed)
+    _check_method(method, estimator, weights is not None, block)
 
-    stats_dict = {}
+    _check_adaptive(rep, tol, max_rep)
 
-    stats_dict["lower"] = np.percentile(dist, 100 * (1-level)/2)
-    stats_dict["upper"] = np.percentile(dist, 100 * (1-(1-level)/2))
-    stats_dict["sample_" + estimator] = SUPPORTED_ESTIMATORS[estimator](sample)
-    stats_dict["std_err"] = np.std(dist)
-    stats_dict["level"] = level
-    stats_dict["sample_size"] = len(sample)
-    stats_dict["n"] = n
-    stats_dict["rep"] = rep
-    stats_dict["estimator"] = estimator
+    _check_block(block, block_length, len(sample), weights is not None)
+    if block is not None and block_length == "auto":
+        # chosen once rather than by every adaptive draw
+        block_length = optimal_block_length(sample, block)
+
+    draw = partial(_replicates, sample, n=n, estimator=estimator,
+                   chunk_reps=chunk_reps, max_bytes=max_bytes,
+                   n_jobs=n_jobs, backend=backend, engine=engine,
+                   method=method,
+                   weights=None if is_frequencies else weights,
+                   frequencies=weights if is_frequencies else None,
+                   block=block, block_length=block_length)
+
+    sample_estimate = _estimate(sample, estimator, weights)
+    interval = partial(_interval, sample=sample, estimate=sample_estimate,
+                       level=level, estimator=estimator, method=method,
+                       n=sample_size if n == "auto" else n)
+
+    if tol is None:
+        dist, dist_se = draw(rep=rep, random_seed=random_seed,
+                             random_state=random_state)
+    else:
+        _check_bootstrap(sample, rep, n, estimator, random_seed, chunk_reps,
+                         max_bytes, n_jobs, backend, random_state, engine)
+        rng = _generators(random_state if random_seed is None
+                          else random_seed)[0]
+        dist, dist_se, mc_error = _adaptive_replicates(
+            draw, interval, rep, rng, tol,
+            max(DEFAULT_MAX_REP, ADAPTIVE_MIN_BATCHES * rep)
+            if max_rep is None else max_rep
+        )
+
+    bounds = None
+    if method != "percentile":
+        bounds = interval(dist, dist_se=dist_se)
+
+    stats_dict = _boot_stats(dist, sample_estimate, level, sample_size, n,
+                             rep, estimator, bounds)
+
+    if block is not None:
+        stats_dict["block"] = block
+        stats_dict["block_length"] = block_length
+
+    if tol is not None:
+        stats_dict["rep_used"] = len(dist)
+        (stats_dict["mc_error_lower"], stats_dict["mc_error_upper"],
+         stats_dict["mc_error_std_err"]) = mc_error
 
     if pass_dist:
         return stats_dict, dist
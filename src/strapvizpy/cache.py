@@ -0,0 +1,253 @@
+import hashlib
+import inspect
+import os
+from collections import OrderedDict
+import numpy as np
+from strapvizpy.bootstrap import (_is_pandas, bootstrap_distribution,
+                                  calculate_boot_stats)
+
+# Default memory budget, in bytes, of the in-memory cache tier
+DEFAULT_CACHE_BYTES = 2 ** 28
+
+# Nominal size, in bytes, charged for the scalars of a stats dictionary
+STATS_DICT_BYTES = 1024
+
+
+def _hash_sample(digest, sample):
+    """Feeds the dtype, shape and raw buffer of `sample` to `digest`."""
+
+    if _is_pandas(sample, "DataFrame"):
+        digest.update(repr(list(sample.columns)).encode())
+    array = np.ascontiguousarray(sample)
+    digest.update(f"{array.dtype.str}{array.shape}".encode())
+    if array.dtype.hasobject:
+        digest.update(repr(array.tolist()).encode())
+    else:
+        digest.update(array.reshape(-1).view(np.uint8))
+
+
+def _nbytes(value):
+    """Approximate memory held by a cached result."""
+
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, tuple):
+        return sum(_nbytes(v) for v in value)
+    return STATS_DICT_BYTES + sum(np.asarray(v).nbytes
+                                  for v in value.values())
+
+
+def _copy(value):
+    """Copies a cached result, so callers cannot modify the cache."""
+
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy(v) for v in value)
+    return {k: v.copy() if isinstance(v, np.ndarray) else v
+            for k, v in value.items()}
+
+
+class BootstrapCache:
+    """Content-addressed cache of seeded bootstrap results.
+
+    Results of `bootstrap_distribution()` and `calculate_boot_stats()`
+    are keyed by a BLAKE2 hash of the sample buffer and every argument,
+    so repeated seeded calls on identical data cost a hash instead of a
+    bootstrap. The in-memory tier evicts the least recently used results
+    once they exceed `max_bytes`, and with `directory` results are also
+    written there as ``.npy`` (distributions) or ``.npz`` (stats) files
+    that outlive the process. Calls without an int or SeedSequence seed
+    are not reproducible, so they are never cached.
+
+    Parameters
+    ----------
+    max_bytes : int, default=268435456
+        memory budget in bytes of the in-memory tier
+    directory : None or str, default=None
+        directory of the on-disk tier, None keeps results in memory only
+
+    Attributes
+    ----------
+    hits : int
+        calls answered from memory or disk
+    misses : int
+        seeded calls that had to bootstrap
+    disk_hits : int
+        hits answered from the on-disk tier
+    evictions : int
+        results evicted from the in-memory tier
+    currsize : int
+        bytes held by the in-memory tier
+
+    Examples
+    --------
+    >>> cache = BootstrapCache(directory="bootstrap_cache")
+    >>> cache.calculate_boot_stats([1, 2, 3, 4], 1000, random_seed=123)
+    >>> cache.calculate_boot_stats([1, 2, 3, 4], 1000, random_seed=123)
+    >>> cache.hits, cache.misses
+    (1, 1)
+    """
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES, directory=None):
+
+        if not isinstance(max_bytes, int):
+            raise TypeError("max_bytes should be of type 'int'")
+
+        if max_bytes < 0:
+            raise ValueError("Invalid value for max_bytes")
+
+        if not (directory is None or isinstance(directory, str)):
+            raise TypeError("directory should be None or of type 'str'")
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.currsize = 0
+        self._entries = OrderedDict()
+
+    def _key(self, func, args, kwargs):
+        """Hash of a call, or None when it is not reproducible."""
+
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+
+        # random_seed is shorthand for an int random_state
+        seed = params.pop("random_state")
+        random_seed = params.pop("random_seed")
+        if random_seed is not None:
+            seed = random_seed
+        if isinstance(seed, np.random.SeedSequence):
+            # spawning children advances a sequence without changing
+            # its entropy, and parallel calls spawn their streams
+            seed = (seed.entropy, seed.spawn_key, seed.pool_size,
+                    seed.n_children_spawned)
+        elif not isinstance(seed, int):
+            return None
+
+        digest = hashlib.blake2b(digest_size=16)
+        _hash_sample(digest, params.pop("sample"))
+        # arrays are hashed by content, their repr elides long arrays
+        for name in ("weights", "frequencies"):
+            weights = params.pop(name)
+            digest.update(name.encode())
+            if weights is not None:
+                _hash_sample(digest, np.asarray(weights))
+        digest.update(repr((func.__name__, seed,
+                            sorted(params.items()))).encode())
+        return digest.hexdigest()
+
+    def _path(self, key, value):
+        suffix = ".npy" if isinstance(value, np.ndarray) else ".npz"
+        return os.path.join(self.directory, key + suffix)
+
+    def _remember(self, key, value):
+        """Adds a result to memory, evicting the least recently used."""
+
+        size = _nbytes(value)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (value, size)
+        self.currsize += size
+        while self.currsize > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.currsize -= evicted
+            self.evictions += 1
+
+    def _save(self, key, value):
+        """Writes a result to the on-disk tier."""
+
+        if isinstance(value, np.ndarray):
+            np.save(self._path(key, value), value)
+            return
+        stats, dist = value if isinstance(value, tuple) else (value, None)
+        arrays = {"stats_" + k: np.asarray(v) for k, v in stats.items()}
+        if dist is not None:
+            arrays["dist"] = dist
+        np.savez(self._path(key, stats), **arrays)
+
+    def _load(self, key):
+        """Reads a result from the on-disk tier, or None when missing."""
+
+        if self.directory is None:
+            return None
+        path = os.path.join(self.directory, key)
+        if os.path.exists(path + ".npy"):
+            return np.load(path + ".npy")
+        if not os.path.exists(path + ".npz"):
+            return None
+
+        with np.load(path + ".npz") as arrays:
+            stats = {k[len("stats_"):]: arrays[k][()] if arrays[k].ndim == 0
+                     else arrays[k] for k in arrays.files
+                     if k.startswith("stats_")}
+            stats = {k: v.item() if isinstance(v, (np.str_, np.integer))
+                     else v for k, v in stats.items()}
+            if "dist" in arrays.files:
+                return stats, arrays["dist"]
+        return stats
+
+    def _call(self, func, args, kwargs):
+        key = self._key(func, args, kwargs)
+        if key is None:
+            return func(*args, **kwargs)
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _copy(self._entries[key][0])
+
+        value = self._load(key)
+        if value is not None:
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, value)
+            return _copy(value)
+
+        self.misses += 1
+        value = func(*args, **kwargs)
+        self._remember(key, value)
+        if self.directory is not None:
+            self._save(key, value)
+        return _copy(value)
+
+    def bootstrap_distribution(self, *args, **kwargs):
+        """Cached `bootstrap_distribution()`, taking the same arguments."""
+
+        return self._call(bootstrap_distribution, args, kwargs)
+
+    def calculate_boot_stats(self, *args, **kwargs):
+        """Cached `calculate_boot_stats()`, taking the same arguments."""
+
+        return self._call(calculate_boot_stats, args, kwargs)
+
+    def clear(self):
+        """Empties the in-memory tier and resets the counters.
+
+        Files of the on-disk tier are left in place.
+        """
+
+        self._entries.clear()
+        self.currsize = 0
+        self.hits = self.misses = self.disk_hits = self.evictions = 0
+
+    def info(self):
+        """Counters and size of the cache.
+
+        Returns
+        -------
+        dictionary
+            hits, misses, disk hits, evictions, number of results and
+            bytes held in memory
+        """
+
+        return {"hits": self.hits, "misses": self.misses,
+                "disk_hits": self.disk_hits, "evictions": self.evictions,
+                "entries": len(self._entries), "currsize": self.currsize}
@@ -0,0 +1,167 @@
+from functools import partial
+import numpy as np
+from strapvizpy.bootstrap import (_boot_stats, _check_bootstrap, _check_level,
+                                  _generators, _has_nan, _prepare_sample,
+                                  _run_blocks)
+
+# Global constant for supported two-sample statistics
+SUPPORTED_STATISTICS = ("diff_mean", "ratio_mean", "diff_median")
+
+
+def _compare_block(values, size_a, n_a, n_b, statistic, sort, rep, rng,
+                   chunk):
+    """Bootstraps `rep` replicates of a two-sample `statistic`.
+
+    `values` holds sample a (its first `size_a` values) and then sample
+    b. A single uniform draw per chunk is scaled into indices of both
+    samples, so both resamples come from one batched gather. With
+    `sort`, each sample's values are sorted and medians are read off the
+    sorted indices, as every index into a is below every index into b.
+    """
+
+    bounds = np.repeat([size_a, len(values) - size_a], [n_a, n_b])
+    shifts = np.repeat([0, size_a], [n_a, n_b])
+    dist = np.empty(rep)
+    for start in range(0, rep, chunk):
+        stop = min(start + chunk, rep)
+        uniform = rng.random((stop - start, n_a + n_b))
+        uniform *= bounds
+        idx = uniform.astype(np.int64)
+        np.minimum(idx, bounds - 1, out=idx)
+        idx += shifts
+
+        if statistic == "diff_median" and sort:
+            idx.sort(axis=1)
+            med_a = (values[idx[:, (n_a - 1) // 2]] +
+                     values[idx[:, n_a // 2]]) / 2
+            med_b = (values[idx[:, n_a + (n_b - 1) // 2]] +
+                     values[idx[:, n_a + n_b // 2]]) / 2
+            dist[start:stop] = med_b - med_a
+            continue
+
+        resample = values[idx]
+        if statistic == "diff_median":
+            dist[start:stop] = (np.median(resample[:, n_a:], axis=1) -
+                                np.median(resample[:, :n_a], axis=1))
+            continue
+        mean_a = resample[:, :n_a].mean(axis=1)
+        mean_b = resample[:, n_a:].mean(axis=1)
+        dist[start:stop] = (mean_b - mean_a if statistic == "diff_mean"
+                            else mean_b / mean_a)
+
+    return dist
+
+
+def bootstrap_compare(a, b, rep, statistic="diff_mean", n="auto",
+                      level=0.95, random_seed=None, pass_dist=False,
+                      chunk_reps=None, max_bytes=None, n_jobs=1,
+                      backend="thread", random_state=None,
+                      nan_policy="propagate"):
+    """Calculates a bootstrapped confidence interval comparing two samples.
+
+    Samples `a` (e.g. control) and `b` (e.g. treatment) are resampled
+    independently, and every replicate of `statistic` compares b to a:
+    "diff_mean" is mean(b) - mean(a), "ratio_mean" is mean(b) / mean(a)
+    and "diff_median" is median(b) - median(a). Both resamples are drawn
+    in one batched pass, chunked within the memory budget and split
+    across workers as in `bootstrap_distribution()`.
+
+    Parameters
+    ----------
+    a : list or numpy.ndarray or pandas.core.series.Series or pyarrow.Array
+        first sample, the baseline of the comparison
+    b : list or numpy.ndarray or pandas.core.series.Series or pyarrow.Array
+        second sample, compared to `a`
+    rep : int
+        number of replicates of the distribution
+    statistic : {"diff_mean", "ratio_mean", "diff_median"}, default="diff_mean"
+        two-sample statistic to bootstrap
+    n : str or int, default="auto"
+        bootstrap sample size of each sample, "auto" specifies using the
+        size of each sample
+    level : float, default=0.95
+        confidence level
+    random_seed : None or int, default=None
+        seed for random state, shorthand for an int `random_state`
+    pass_dist : bool, default=False
+        also return the bootstrapped distribution
+    chunk_reps : None or int, default=None
+        number of replicates resampled at once, overrides `max_bytes`
+    max_bytes : None or int, default=None
+        memory budget in bytes for the resamples of a single chunk
+    n_jobs : int, default=1
+        number of workers, -1 uses all available cores
+    backend : {"thread", "process"}, default="thread"
+        type of worker pool used when `n_jobs` > 1
+    random_state : None or int or numpy.random.SeedSequence or numpy.random.Generator, default=None
+        seed, seed sequence or generator for the resampling streams
+    nan_policy : {"propagate", "omit", "raise"}, default="propagate"
+        handling of NaN in either sample
+
+    Returns
+    -------
+    dictionary or tuple
+        Dictionary in the format of `calculate_boot_stats()`, with the
+        statistic as estimator, the total size of both samples as
+        "sample_size" and their own sizes as "sample_size_a" and
+        "sample_size_b". With `pass_dist`, a tuple of the dictionary and
+        the distribution, which `plot_ci()` renders as it is.
+
+    Examples
+    --------
+    >>> bootstrap_compare([1, 2, 3, 4], [2, 3, 4, 5], 1000, random_seed=123)
+    """
+
+    _check_level(level)
+
+    if not isinstance(pass_dist, bool):
+        raise TypeError("pass_dist should be of type 'bool'")
+
+    if not isinstance(statistic, str):
+        raise TypeError("statistic should be of type 'str'")
+
+    if statistic not in SUPPORTED_STATISTICS:
+        raise ValueError("Supported statistics are diff_mean, ratio_mean, "
+                         "diff_median")
+
+    a, _, n_a, n_jobs, random_state = _check_bootstrap(
+        a, rep, n, "mean", random_seed, chunk_reps, max_bytes, n_jobs,
+        backend, random_state, "auto", nan_policy=nan_policy
+    )
+    b, _, _ = _prepare_sample(b, nan_policy=nan_policy, max_bytes=max_bytes)
+    n_b = len(b) if n == "auto" else n
+
+    if a.ndim != 1 or b.ndim != 1:
+        raise ValueError("a and b should be 1 dimensional")
+
+    # NaN would sort last and shift the order statistics, so samples
+    # holding NaN take medians of the gathered resamples instead
+    sort = (statistic == "diff_median" and
+            not (_has_nan(a, max_bytes) or _has_nan(b, max_bytes)))
+    if sort:
+        a, b = np.sort(a), np.sort(b)
+    values = np.concatenate((a, b)).astype(float, copy=False)
+
+    if statistic == "diff_median":
+        sample_estimate = np.median(b) - np.median(a)
+    elif statistic == "diff_mean":
+        sample_estimate = np.mean(b) - np.mean(a)
+    else:
+        sample_estimate = np.mean(b) / np.mean(a)
+
+    # uniform draws, indices and gathered values of both resamples
+    bytes_per_rep = 3 * 8 * (n_a + n_b)
+    dist = _run_blocks(
+        partial(_compare_block, values, len(a), n_a, n_b, statistic, sort),
+        rep, bytes_per_rep, _generators(random_state, n_jobs), chunk_reps,
+        max_bytes, backend
+    )
+
+    stats_dict = _boot_stats(dist, sample_estimate, level, len(a) + len(b),
+                             n, rep, statistic)
+    stats_dict["sample_size_a"] = len(a)
+    stats_dict["sample_size_b"] = len(b)
+
+    if pass_dist:
+        return stats_dict, dist
+    return stats_dict
@@ -1,23 +1,115 @@
 import os
+import sys
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
 from strapvizpy.bootstrap import calculate_boot_stats
+from strapvizpy.result import BootstrapResult
 
+# Global constant for supported file formats of batch rendered charts
+SUPPORTED_FORMATS = ("png", "svg")
 
-def plot_ci(sample, rep, bin_size=30, n="auto", ci_level=0.95,
+# Global constant for file formats of bulk tables and their extensions
+TABLE_FORMATS = {"csv": "csv", "latex": "tex", "html": "html",
+                 "parquet": "parquet"}
+
+
+def _pyplot():
+    """Imports pyplot on first use.
+
+    Matplotlib is only imported once a chart is drawn. Without a
+    display, the non-interactive Agg backend is used rather than probing
+    for GUI toolkits, unless a backend was chosen explicitly.
+    """
+
+    if (sys.platform.startswith("linux") and
+            "matplotlib.pyplot" not in sys.modules and
+            not any(os.environ.get(var) for var in
+                    ("DISPLAY", "WAYLAND_DISPLAY", "MPLBACKEND"))):
+        import matplotlib
+        matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _binned(sample, dist, bin_size):
+    """Histogram counts and edges of a distribution to draw.
+
+    The replicates are binned once by `np.histogram`, so only the counts
+    are drawn and sent to workers, whatever the number of replicates.
+    Results stored as a histogram keep their own bins.
+    """
+
+    if isinstance(sample, BootstrapResult) and sample.counts is not None:
+        return sample.counts, sample.edges
+    return np.histogram(dist, bins=bin_size)
+
+
+def _draw_ci(ax, stats, counts, edges, title, x_axis, y_axis):
+    """Draws a binned distribution and its interval onto the Axes `ax`.
+
+    Only the Axes methods are used, so that no pyplot state is touched
+    and figures can be drawn from any thread or worker.
+    """
+
+    estimate = "sample_" + stats["estimator"]
+
+    ax.stairs(counts, edges, fill=True)
+    ax.axvline(stats["lower"], color='k', linestyle='--')
+    ax.axvline(stats[estimate], color='r', linestyle='-')
+    ax.axvline(stats["upper"], color='k', linestyle='--')
+    _, y_max = ax.get_ylim()
+    ax.text(stats[estimate],
+            y_max * 0.9,
+            (str(round(stats[estimate], 2)) +
+             '(' + u"\u00B1" + str(round(stats['std_err'], 2)) + ')'),
+            ha='center', va='center', rotation='horizontal',
+            color="k", bbox={'facecolor': 'white', 'pad': 5})
+    ax.text(stats["upper"],
+            y_max * 0.9,
+            (str(round(stats["upper"], 2))),
+            ha='center', va='center', rotation='horizontal',
+            color="k", bbox={'facecolor': 'white', 'pad': 5})
+    ax.text(stats["lower"],
+            y_max * 0.9,
+            (str(round(stats["lower"], 2))),
+            ha='center', va='center', rotation='horizontal',
+            color="k", bbox={'facecolor': 'white', 'pad': 5})
+    ax.set_title(title)
+    ax.set_xlabel(x_axis)
+    ax.set_ylabel(y_axis)
+
+
+def plot_ci(sample, rep=None, bin_size=30, n="auto", ci_level=0.95,
             ci_random_seed=None, title="", x_axis="Bootstrap Sample Mean", 
-            y_axis="Count", path=None):
-    
+            y_axis="Count", path=None, random_state=None, ax=None):
+
     """Makes a histogram of a boostrapped sampling distribution 
     with its confidence interval and oberserved mean.
+
+    A `BootstrapResult` passed as `sample` is drawn at `ci_level` as it
+    is, without resampling, and the resampling arguments are ignored.
+    So is a tuple of stats and distribution, as returned with
+    `pass_dist=True` by `calculate_boot_stats()` or `bootstrap_compare()`,
+    which is drawn at its own level. The distribution is binned once and
+    drawn as stairs, and results stored as a histogram are drawn from
+    their counts, in a time independent of the number of replicates.
+
+    Without `ax`, the chart is drawn onto the current pyplot figure and
+    the pyplot module is returned. With `ax`, only that Axes is drawn
+    onto, without touching pyplot state, so charts can be laid out in
+    subplots or drawn from threads.
      
     Parameters
     ----------
-    sample : list or numpy.ndarray or pandas.core.series.Series 
-        sample to bootstrap
-    rep : int
-        number of replicates of the distribution
+    sample : list or numpy.ndarray or pandas.core.series.Series or BootstrapResult or tuple
+        sample to bootstrap, or an already bootstrapped result
+    rep : None or int, default=None
+        number of replicates of the distribution, required unless
+        `sample` is already bootstrapped
     bin_size = int
         a number of bins representing intervals of equal size
         over the range
@@ -36,12 +128,16 @@ def plot_ci(sample, rep, bin_size=30, n="auto", ci_level=0.95,
         name of the y axis
     path : None or str, default = None
         specify the directory to save the figure as .png
+    random_state : None or int or numpy.random.SeedSequence or numpy.random.Generator, default=None
+        seed, seed sequence or generator for the resampling streams
+    ax : None or matplotlib.axes.Axes, default=None
+        Axes to draw onto instead of the current pyplot figure
     
     Returns
     -------
-    plot: histogram
+    plot: histogram or matplotlib.axes.Axes
         histogram of bootstrap distribution with confidence interval
-        and oberserved mean
+        and oberserved mean, or `ax` when it is passed
     
     Examples
     --------
@@ -73,43 +169,162 @@ def plot_ci(sample, rep, bin_size=30, n="auto", ci_level=0.95,
         if os.path.isdir(path) is False:
             raise NameError("The folder path you specified is invalid.")
 
-    sample_stat_dict = calculate_boot_stats(sample, rep, level=ci_level, 
-                                            n=n, random_seed = ci_random_seed,
-                                            pass_dist=True)
-        
-    plt.hist(sample_stat_dict[1], density=False, bins=bin_size)
-    plt.axvline(sample_stat_dict[0]["lower"], color='k', linestyle='--')
-    plt.axvline(sample_stat_dict[0]["sample_mean"], color='r', linestyle='-')
-    plt.axvline(sample_stat_dict[0]["upper"], color='k', linestyle='--')
-    axes = plt.gca()
-    _, y_max = axes.get_ylim()
-    plt.text(sample_stat_dict[0]["sample_mean"], 
-             y_max * 0.9 , 
-             (str(round(sample_stat_dict[0]["sample_mean"], 2))+
-              '('+u"\u00B1"+str(round(sample_stat_dict[0]['std_err'],2))+')'), 
-             ha='center', va='center',rotation='horizontal', 
-             color = "k", bbox={'facecolor':'white', 'pad':5})
-    plt.text(sample_stat_dict[0]["upper"], 
-             y_max * 0.9 , 
-             (str(round(sample_stat_dict[0]["upper"], 2))), 
-             ha='center', va='center',rotation='horizontal', 
-             color = "k", bbox={'facecolor':'white', 'pad':5})
-    plt.text(sample_stat_dict[0]["lower"], 
-             y_max * 0.9 , 
-             (str(round(sample_stat_dict[0]["lower"], 2))), 
-             ha='center', va='center',rotation='horizontal', 
-             color = "k", bbox={'facecolor':'white', 'pad':5})
-    plt.title(title)
-    plt.xlabel(x_axis)
-    plt.ylabel(y_axis)
+    if ax is not None:
+        from matplotlib.axes import Axes
+
+        if not isinstance(ax, Axes):
+            raise TypeError("ax should be None or of type "
+                            "'matplotlib.axes.Axes'")
+
+    if isinstance(sample, BootstrapResult):
+        sample_stat_dict = sample.stats(ci_level), sample.dist
+    elif isinstance(sample, tuple):
+        sample_stat_dict = sample
+    else:
+        sample_stat_dict = calculate_boot_stats(sample, rep, level=ci_level,
+                                                n=n,
+                                                random_seed=ci_random_seed,
+                                                pass_dist=True,
+                                                random_state=random_state)
+    if ax is None:
+        plt = _pyplot()
+        ax = plt.gca()
+        figure = plt
+    else:
+        figure = ax.figure
+
+    counts, edges = _binned(sample, sample_stat_dict[1], bin_size)
+    _draw_ci(ax, sample_stat_dict[0], counts, edges, title, x_axis, y_axis)
 
     if path is not None:
-        plt.savefig(f"{path}bootstrap_histogram.png")
+        figure.savefig(f"{path}bootstrap_histogram.png")
 
-    return plt
+    return ax if figure is ax.figure else figure
     
 
 
+def _render_ci(file, stats, counts, edges, title, x_axis, y_axis, dpi):
+    """Renders one chart to `file` on a figure unknown to pyplot.
+
+    The figure is drawn by its own Agg canvas and cleared once saved,
+    so rendering holds a single figure whatever the backend.
+    """
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    _draw_ci(figure.subplots(), stats, counts, edges, title, x_axis, y_axis)
+    figure.savefig(file, dpi=dpi)
+    figure.clear()
+    return file
+
+
+def plot_ci_batch(results, out_dir, n_jobs=1, fmt="png", bin_size=30,
+                  ci_level=0.95, title="", x_axis="Bootstrap Sample Mean",
+                  y_axis="Count", dpi=100):
+    """Renders the charts of `plot_ci()` for many results to files.
+
+    Every chart is drawn on its own figure, outside of pyplot, and
+    released once saved. Distributions are binned before rendering, so
+    only their counts are sent to workers. With `n_jobs` > 1 the charts
+    are rendered by a pool of spawned processes, with at most two charts
+    per worker in flight, so memory stays bounded however many results
+    are rendered.
+
+    Parameters
+    ----------
+    results : list
+        results to draw, each a BootstrapResult or a tuple of stats and
+        distribution as returned with `pass_dist=True`
+    out_dir : str
+        existing directory the charts are written to, as
+        ``ci_<index>.<fmt>``
+    n_jobs : int, default=1
+        number of worker processes, -1 uses all available cores
+    fmt : {"png", "svg"}, default="png"
+        file format of the charts
+    bin_size : int, default=30
+        number of bins of the histograms
+    ci_level : float, default=0.95
+        confidence level of BootstrapResult charts
+    title : str, default=""
+        title of every chart
+    x_axis : str, default="Bootstrap Sample Mean"
+        name of the x axis
+    y_axis : str, default="Count"
+        name of the y axis
+    dpi : int, default=100
+        resolution of PNG charts
+
+    Returns
+    -------
+    list
+        paths of the rendered files, in the order of `results`
+
+    Examples
+    --------
+    >>> results = [BootstrapResult.from_sample(s, 1000, random_state=123)
+    ...            for s in ([1, 2, 3, 4], [2, 4, 6, 8])]
+    >>> plot_ci_batch(results, "charts/", n_jobs=2)
+    """
+
+    if not isinstance(results, list):
+        raise TypeError("results should be of type 'list'")
+
+    if not isinstance(out_dir, str):
+        raise TypeError("out_dir should be of type 'str'")
+
+    if not os.path.isdir(out_dir):
+        raise NameError("The folder path you specified is invalid.")
+
+    if not isinstance(n_jobs, int):
+        raise TypeError("n_jobs should be of type 'int'")
+
+    if n_jobs == 0 or n_jobs < -1:
+        raise ValueError("Invalid value for n_jobs")
+
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError("Supported formats are png, svg")
+
+    for name, value in (("title", title), ("x_axis", x_axis),
+                        ("y_axis", y_axis)):
+        if not isinstance(value, str):
+            raise TypeError(
+                f"The value of the argument '{name}' must be type of str."
+            )
+
+    def tasks():
+        for i, result in enumerate(results):
+            if isinstance(result, BootstrapResult):
+                stats, dist = result.stats(ci_level), result.dist
+            elif isinstance(result, tuple):
+                stats, dist = result
+            else:
+                raise TypeError("results should hold BootstrapResult or "
+                                "tuple items")
+            counts, edges = _binned(result, dist, bin_size)
+            file = os.path.join(out_dir, f"ci_{i}.{fmt}")
+            yield file, stats, counts, edges, title, x_axis, y_axis, dpi
+
+    n_jobs = (os.cpu_count() or 1) if n_jobs == -1 else n_jobs
+    if n_jobs == 1:
+        return [_render_ci(*task) for task in tasks()]
+
+    files = []
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=n_jobs,
+                             mp_context=get_context("spawn")) as executor:
+        for task in tasks():
+            if len(pending) == 2 * n_jobs:
+                files.append(pending.popleft().result())
+            pending.append(executor.submit(_render_ci, *task))
+        files.extend(future.result() for future in pending)
+
+    return files
+
+
 def tabulate_stats(stat, precision=2, estimator=True, alpha=True, path=None):
     """Makes two tables that summerize the statistics from the bootstrapped 
     samples and the parameters for creating the bootstrapped samples. It also allows you
@@ -118,8 +333,9 @@ def tabulate_stats(stat, precision=2, estimator=True, alpha=True, path=None):
 
     Parameters
     ----------
-    stat : dict or tuple
-        summary statistics produced by the `calculate_boot_stats()` function 
+    stat : dict or tuple or BootstrapResult or Mapping
+        summary statistics produced by the `calculate_boot_stats()` function,
+        or a result summarised at its own confidence level
     precision : int, default=2
         the precision of the table values
     estimator : boolean, default=True
@@ -151,7 +367,9 @@ def tabulate_stats(stat, precision=2, estimator=True, alpha=True, path=None):
     >>> parameter_table
     """
 
-    if not(isinstance(stat, tuple) | isinstance(stat, dict)):
+    import pandas as pd
+
+    if not(isinstance(stat, tuple) | isinstance(stat, Mapping)):
         raise TypeError(
             "The stats parameter must be created from "
             "calculate_boot_stats() function."
@@ -247,3 +465,128 @@ def tabulate_stats(stat, precision=2, estimator=True, alpha=True, path=None):
             tf.write(bs_params.to_latex())
         
     return stats_table, bs_params
+
+
+def tabulate_stats_many(stats, precision=2, estimator=True, alpha=True,
+                        path=None, fmt="csv", style=False):
+    """Makes one table summarising the statistics of many bootstraps.
+
+    Unlike `tabulate_stats()`, no Styler is built per result: the stats
+    of every result are gathered column by column into a single
+    DataFrame with one row per result, which is written in one go. Only
+    with `style` is the table formatted by a Styler.
+
+    Parameters
+    ----------
+    stats : list
+        summary statistics produced by `calculate_boot_stats()` or
+        similar functions, as dictionaries, tuples with `pass_dist=True`
+        or BootstrapResult
+    precision : int, default=2
+        the precision of the LaTeX, HTML and styled table values
+    estimator : boolean, default=True
+        include the estimator and the bootstrap estimate
+    alpha : boolean, default=True
+        include the significance level
+    path : None or str, default=None
+        specify a directory where the table is saved as
+        ``bootstrap_stats.<extension>`` of `fmt`
+    fmt : {"csv", "latex", "html", "parquet"}, default="csv"
+        file format of the saved table, "parquet" requires pyarrow or
+        fastparquet
+    style : boolean, default=False
+        return and save the table formatted by a Styler, as in
+        `tabulate_stats()`
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame or pandas.io.formats.style.Styler
+        table with one row per result, of the interval bounds, standard
+        error, estimator and estimate, significance level, sample size,
+        repetitions and samples per bootstrap
+
+    Examples
+    --------
+    >>> st = [calculate_boot_stats(s, 1000, random_seed=123)
+    ...       for s in ([1, 2, 3, 4], [2, 4, 6, 8])]
+    >>> tabulate_stats_many(st, path="tables/", fmt="latex")
+    """
+
+    import pandas as pd
+
+    if not isinstance(stats, list):
+        raise TypeError("stats should be of type 'list'")
+    if not isinstance(precision, int):
+        raise TypeError("The precision parameter must be of type int.")
+    if not (isinstance(estimator, bool) & isinstance(alpha, bool) &
+            isinstance(style, bool)):
+        raise TypeError(
+            "The estimator, alpha and style parameters must be of type "
+            "boolean."
+        )
+    if not (isinstance(path, str) or path is None):
+        raise TypeError("The path parameter must be a character string.")
+
+    if path is not None:
+        if os.path.isdir(path) is False:
+            raise NameError("The folder path you specified is invalid.")
+
+    if fmt not in TABLE_FORMATS:
+        raise ValueError("Supported formats are csv, latex, html, parquet")
+
+    stats = [stat[0] if isinstance(stat, tuple) else stat for stat in stats]
+    keys = {"lower", "upper", "std_err", "estimator", "level",
+            "sample_size", "n", "rep"}
+    if not all(isinstance(stat, Mapping) and keys <= stat.keys()
+               for stat in stats):
+        raise TypeError(
+            "The statistics dictionary is missing a key. "
+            "Please rerun calculate_boot_stats() function"
+        )
+
+    columns = {
+        "Lower Bound CI": [stat["lower"] for stat in stats],
+        "Upper Bound CI": [stat["upper"] for stat in stats],
+        "Standard Error": [stat["std_err"] for stat in stats],
+    }
+    if estimator is True:
+        columns["Estimator"] = [stat["estimator"] for stat in stats]
+        columns["Sample Estimate"] = [stat["sample_" + stat["estimator"]]
+                                      for stat in stats]
+    levels = np.array([stat["level"] for stat in stats], dtype=float)
+    if alpha is True:
+        columns["Significance Level"] = 1 - levels
+    columns["Sample Size"] = [stat["sample_size"] for stat in stats]
+    columns["Repetition"] = [stat["rep"] for stat in stats]
+    # "auto" bootstrap sizes are the sample sizes, so the column is numeric
+    columns["Samples per bootstrap"] = [
+        stat["sample_size"] if stat["n"] == "auto" else stat["n"]
+        for stat in stats
+    ]
+    df = pd.DataFrame(columns)
+
+    table = df
+    if style is True:
+        table = df.style.format(
+            precision=precision,
+            formatter={"Significance Level": "{:.3f}"}
+        ).hide(axis="index")
+
+    if path is not None:
+        file = os.path.join(path, "bootstrap_stats." +
+                            TABLE_FORMATS[fmt])
+        # csv and parquet keep every value at full precision
+        if fmt == "parquet":
+            df.to_parquet(file, index=False)
+        elif fmt == "csv":
+            df.to_csv(file, index=False)
+        elif style is True:
+            with open(file, "w") as tf:
+                tf.write(table.to_latex() if fmt == "latex"
+                         else table.to_html())
+        elif fmt == "latex":
+            df.to_latex(file, index=False, float_format=f"%.{precision}f")
+        else:
+            df.to_html(file, index=False, float_format=f"%.{precision}f")
+
+    return table
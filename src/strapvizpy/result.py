@@ -0,0 +1,318 @@
+from collections.abc import Mapping
+import numpy as np
+from strapvizpy.bootstrap import (_check_level, _check_params, _estimate,
+                                  _prepare_sample, _sample_size,
+                                  bootstrap_distribution)
+
+# Global constant for supported replicate storages of results
+SUPPORTED_STORAGES = ("float64", "float32", "histogram")
+
+# Default number of histogram bins of results stored as histograms
+DEFAULT_RESULT_BINS = 256
+
+
+class BootstrapResult(Mapping):
+    """Bootstrapped distribution with what its stats are derived from.
+
+    A result is resampled once and then summarised at any confidence
+    level, by `stats_from_distribution()` or directly by `plot_ci()` and
+    `tabulate_stats()`, so rendering never bootstraps again. Results are
+    read like the `calculate_boot_stats()` dictionary at their `level`,
+    whose stats are only computed on first access.
+
+    Results use `__slots__`, and the replicates can be kept as float32
+    or replaced by a histogram of `bins` counts between their extremes,
+    whose percentiles are interpolated within a bin, so that many
+    results fit in memory at once. NaN replicates are counted apart from
+    the histogram and, as with the other storages, make its percentiles
+    and standard error NaN.
+
+    Parameters
+    ----------
+    dist : numpy.ndarray
+        bootstrapped sampling distribution
+    sample_estimate : float or numpy.ndarray
+        estimator applied to the original sample
+    estimator : {"mean", "median", "var", "sd"}, default="mean"
+        sampling distributor's estimator
+    sample_size : None or int, default=None
+        size of the original sample, if known
+    n : str or int, default="auto"
+        bootstrap sample size the distribution was drawn with
+    level : float, default=0.95
+        default confidence level of `stats()`
+    storage : {"float64", "float32", "histogram"}, default="float64"
+        how the replicates are kept
+    bins : int, default=256
+        number of histogram bins of the "histogram" storage
+
+    Examples
+    --------
+    >>> result = BootstrapResult.from_sample([1, 2, 3, 4], 1000,
+    ...                                      random_seed=123,
+    ...                                      storage="float32")
+    >>> result["upper"]
+    >>> result.stats(0.9)
+    >>> stats_from_distribution(result, [0.9, 0.95, 0.99])
+    """
+
+    __slots__ = ("dist", "counts", "low", "high", "nan_count",
+                 "sample_estimate",
+                 "estimator", "sample_size", "n", "level", "_rep",
+                 "_std_err", "_stats")
+
+    def __init__(self, dist, sample_estimate, estimator="mean",
+                 sample_size=None, n="auto", level=0.95, storage="float64",
+                 bins=DEFAULT_RESULT_BINS):
+
+        _check_params(1, n, estimator)
+        _check_level(level)
+
+        if storage not in SUPPORTED_STORAGES:
+            raise ValueError("Supported storages are float64, float32, "
+                             "histogram")
+
+        if not isinstance(bins, int):
+            raise TypeError("bins should be of type 'int'")
+
+        if bins < 1:
+            raise ValueError("Invalid value for bins")
+
+        dist = np.asarray(dist)
+        self._rep = len(dist)
+        self._std_err = None
+        self._stats = None
+        self.dist = self.counts = self.low = self.high = None
+        self.nan_count = None
+
+        if storage == "histogram":
+            if dist.ndim != 1:
+                raise ValueError("Histogram storage supports 1 dimensional "
+                                 "distributions")
+            if np.isinf(dist).any():
+                raise ValueError("Histogram storage supports finite or NaN "
+                                 "replicates")
+            # the standard error is exact, only percentiles are binned
+            self._std_err = np.std(dist)
+            finite = dist[~np.isnan(dist)]
+            self.nan_count = len(dist) - len(finite)
+            self.low, self.high = ((float(finite.min()), float(finite.max()))
+                                   if len(finite) else (0.0, 0.0))
+            counts, _ = np.histogram(finite, bins=bins,
+                                     range=(self.low, self.high))
+            self.counts = counts.astype(np.uint32)
+        else:
+            self.dist = dist.astype(storage, copy=False)
+
+        self.sample_estimate = sample_estimate
+        self.estimator = estimator
+        self.sample_size = sample_size
+        self.n = n
+        self.level = level
+
+    @classmethod
+    def from_sample(cls, sample, rep, n="auto", level=0.95,
+                    estimator="mean", storage="float64",
+                    bins=DEFAULT_RESULT_BINS, weights=None,
+                    frequencies=None, nan_policy="propagate", **kwargs):
+        """Bootstraps a sample into a result.
+
+        The sample is converted, weighted and cleaned of NaN once, and
+        its estimate and size follow its weights or frequencies as in
+        `calculate_boot_stats()`.
+
+        Parameters
+        ----------
+        sample : list or numpy.ndarray or pandas.core.series.Series or pandas.core.frame.DataFrame or pyarrow.Array
+            sample to bootstrap
+        rep : int
+            number of replicates of the distribution
+        n : str or int, default="auto"
+            bootstrap sample size, "auto" specifies using the same size
+            as the sample
+        level : float, default=0.95
+            default confidence level of `stats()`
+        estimator : {"mean", "median", "var", "sd"}
+            sampling distributor's estimator
+        storage : {"float64", "float32", "histogram"}, default="float64"
+            how the replicates are kept
+        bins : int, default=256
+            number of histogram bins of the "histogram" storage
+        weights : None or list or numpy.ndarray or pandas.core.series.Series, default=None
+            non-negative sampling weight of every row of `sample`
+        frequencies : None or list or numpy.ndarray or pandas.core.series.Series, default=None
+            number of observations every row of `sample` stands for
+        nan_policy : {"propagate", "omit", "raise"}, default="propagate"
+            handling of NaN in `sample`
+        **kwargs
+            further arguments of `bootstrap_distribution()`
+
+        Returns
+        -------
+        BootstrapResult
+            the bootstrapped result
+        """
+
+        _check_level(level)
+        sample, weights, is_frequencies = _prepare_sample(
+            sample, weights, frequencies, nan_policy, kwargs.get("max_bytes")
+        )
+        dist = bootstrap_distribution(
+            sample, rep, n=n, estimator=estimator,
+            weights=None if is_frequencies else weights,
+            frequencies=weights if is_frequencies else None, **kwargs
+        )
+        return cls(dist, _estimate(sample, estimator, weights), estimator,
+                   _sample_size(sample, weights, is_frequencies), n, level,
+                   storage, bins)
+
+    @property
+    def rep(self):
+        """Number of replicates of the distribution."""
+
+        return self._rep
+
+    @property
+    def edges(self):
+        """Bin edges of the "histogram" storage, otherwise None."""
+
+        if self.counts is None:
+            return None
+        return np.linspace(self.low, self.high, len(self.counts) + 1)
+
+    @property
+    def std_err(self):
+        """Standard deviation of the replicates, computed once."""
+
+        if self._std_err is None:
+            self._std_err = np.std(self.dist, axis=0, dtype=np.float64)
+        return self._std_err
+
+    def percentile(self, q):
+        """Percentiles `q` of the replicates, along their first axis.
+
+        Percentiles of the "histogram" storage are interpolated linearly
+        within the bin holding them.
+        """
+
+        if self.counts is None:
+            return np.percentile(self.dist, q, axis=0)
+
+        if self.nan_count:
+            return np.full(np.shape(q), np.nan)
+
+        cum = np.cumsum(self.counts, dtype=np.float64)
+        target = np.asarray(q) / 100 * cum[-1]
+        j = np.minimum(np.searchsorted(cum, target), len(cum) - 1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frac = np.nan_to_num((target - cum[j] + self.counts[j]) /
+                                 self.counts[j])
+        edges = self.edges
+        return edges[j] + np.clip(frac, 0, 1) * (edges[j + 1] - edges[j])
+
+    def stats(self, level=None):
+        """Stats dictionary at one confidence level.
+
+        Parameters
+        ----------
+        level : None or float, default=None
+            confidence level, None uses the result's `level`
+
+        Returns
+        -------
+        dictionary
+            Dictionary in the format of `calculate_boot_stats()`.
+        """
+
+        if level is None or level == self.level:
+            return dict(self._mapping())
+
+        return stats_from_distribution(self, level)
+
+    def _mapping(self):
+        if self._stats is None:
+            self._stats = stats_from_distribution(self, self.level)
+        return self._stats
+
+    def __getitem__(self, key):
+        return self._mapping()[key]
+
+    def __iter__(self):
+        return iter(self._mapping())
+
+    def __len__(self):
+        return len(self._mapping())
+
+
+def stats_from_distribution(dist, level=0.95, sample_estimate=None,
+                            estimator="mean", sample_size=None, n="auto"):
+    """Calculates confidence intervals from a precomputed distribution.
+
+    The percentiles of every requested level are found in a single
+    `np.percentile` pass over the distribution, so one bootstrap serves
+    any number of confidence levels.
+
+    Parameters
+    ----------
+    dist : numpy.ndarray or BootstrapResult
+        bootstrapped sampling distribution, or a result whose other
+        fields are used for the remaining arguments
+    level : float or list, default=0.95
+        confidence level, or list of confidence levels
+    sample_estimate : None or float or numpy.ndarray, default=None
+        estimator applied to the original sample, required unless `dist`
+        is a BootstrapResult
+    estimator : {"mean", "median", "var", "sd"}, default="mean"
+        sampling distributor's estimator
+    sample_size : None or int, default=None
+        size of the original sample, if known
+    n : str or int, default="auto"
+        bootstrap sample size the distribution was drawn with
+
+    Returns
+    -------
+    dictionary or list
+        Dictionary in the format of `calculate_boot_stats()`, or one per
+        level when `level` is a list.
+
+    Examples
+    --------
+    >>> dist = bootstrap_distribution([1, 2, 3, 4], 1000, random_seed=123)
+    >>> stats_from_distribution(dist, [0.9, 0.95], sample_estimate=2.5)
+    """
+
+    if isinstance(dist, BootstrapResult):
+        result = dist
+    elif sample_estimate is None:
+        raise ValueError("sample_estimate should be set for a distribution")
+    elif not (isinstance(dist, np.ndarray) and dist.ndim in (1, 2)):
+        raise TypeError("dist should be a 1 or 2 dimensional "
+                        "numpy.ndarray or a BootstrapResult")
+    else:
+        result = BootstrapResult(dist, sample_estimate, estimator,
+                                 sample_size, n)
+
+    levels = level if isinstance(level, list) else [level]
+    for lvl in levels:
+        _check_level(lvl)
+
+    # lower and upper percentiles of every level, in one pass
+    alphas = np.array([1 - lvl for lvl in levels])
+    bounds = result.percentile(np.concatenate((100 * alphas/2,
+                                               100 * (1 - alphas/2))))
+
+    stats = []
+    for i, lvl in enumerate(levels):
+        stats.append({
+            "lower": bounds[i],
+            "upper": bounds[len(levels) + i],
+            "sample_" + result.estimator: result.sample_estimate,
+            "std_err": result.std_err,
+            "level": lvl,
+            "sample_size": result.sample_size,
+            "n": result.n,
+            "rep": result.rep,
+            "estimator": result.estimator,
+        })
+
+    return stats if isinstance(level, list) else stats[0]
@@ -0,0 +1,526 @@
+import io
+import json
+import numpy as np
+from strapvizpy.bootstrap import (_boot_stats, _check_level,
+                                  _check_max_bytes, _check_params,
+                                  _check_random_state, _chunk_reps,
+                                  _generators)
+
+# Default number of bins per sign of the per-replicate median sketches
+DEFAULT_SKETCH_BINS = 1024
+
+# Finest log-magnitude resolution of the median sketches, as a power of 2
+MIN_SKETCH_EXPONENT = -20
+
+
+class _LogStore:
+    """Weighted histograms, one per row, of log magnitudes.
+
+    Grid bin `j` covers log values in [j * 2**exponent, (j + 1) *
+    2**exponent), i.e. magnitudes within a factor exp(2**exponent) of
+    each other, and only `bins` consecutive grid bins are tracked. When
+    new values fall outside them, adjacent bins are merged until
+    everything fits, so memory stays at `rows` * `bins` and the relative
+    error stays uniform however skewed the values are.
+    """
+
+    def __init__(self, rows, bins):
+        self.counts = np.zeros((rows, bins))
+        self.exponent = None
+        self.offset = 0
+        self.low = np.inf
+        self.high = -np.inf
+
+    def _index(self, y, exponent):
+        return np.floor(np.ldexp(y, -exponent)).astype(np.int64)
+
+    def _spans(self, low, high, exponent):
+        return (self._index(high, exponent) - self._index(low, exponent)
+                < self.counts.shape[1])
+
+    def _coarsen(self, levels):
+        """Merges pairs of adjacent bins `levels` times."""
+
+        rows, bins = self.counts.shape
+        counts, offset = self.counts, self.offset
+        for _ in range(levels):
+            # align the first tracked bin on an even grid index
+            counts = np.pad(counts, ((0, 0), (offset % 2, 0)))
+            counts = np.pad(counts, ((0, 0), (0, counts.shape[1] % 2)))
+            counts = counts.reshape(rows, -1, 2).sum(axis=2)
+            offset //= 2
+
+        self.counts = np.zeros((rows, bins))
+        self.counts[:, :counts.shape[1]] = counts[:, :bins]
+        self.offset = offset
+
+    def _fit(self, low, high, exponent=MIN_SKETCH_EXPONENT):
+        """Coarsens and shifts the grid so that [low, high] is tracked."""
+
+        low, high = min(low, self.low), max(high, self.high)
+
+        if self.exponent is not None:
+            exponent = max(exponent, self.exponent)
+        while not self._spans(low, high, exponent):
+            exponent += 1
+
+        if self.exponent is not None:
+            self._coarsen(exponent - self.exponent)
+            shift = self.offset - int(self._index(low, exponent))
+            if shift > 0:
+                self.counts[:, shift:] = self.counts[:, :-shift].copy()
+                self.counts[:, :shift] = 0
+                self.offset -= shift
+        else:
+            self.offset = int(self._index(low, exponent))
+
+        self.exponent = exponent
+        self.low, self.high = low, high
+
+    def add(self, y, weights):
+        """Adds log magnitudes `y` with one row of `weights` per row."""
+
+        self._fit(y.min(), y.max())
+        idx = self._index(y, self.exponent) - self.offset
+        order = np.argsort(idx, kind="stable")
+        bins, starts = np.unique(idx[order], return_index=True)
+        self.counts[:, bins] += np.add.reduceat(weights[:, order], starts,
+                                                axis=1)
+
+    def merge(self, other):
+        """Adds the counts of `other`, on the coarser grid of both."""
+
+        if other.exponent is None:
+            return
+        if self.exponent is None:
+            self.counts = other.counts.copy()
+            self.exponent, self.offset = other.exponent, other.offset
+            self.low, self.high = other.low, other.high
+            return
+
+        self._fit(other.low, other.high, other.exponent)
+        aligned = _LogStore(*other.counts.shape)
+        aligned.counts, aligned.offset = other.counts, other.offset
+        aligned._coarsen(self.exponent - other.exponent)
+        # both grids now cover the merged range, other's from a later bin
+        shift = aligned.offset - self.offset
+        self.counts[:, shift:] += aligned.counts[:, :self.counts.shape[1] -
+                                                 shift]
+
+    def value(self, position):
+        """Magnitude at a fractional bin `position` of the tracked grid."""
+
+        y = np.ldexp(self.offset + position, self.exponent)
+        return np.exp(np.clip(y, self.low, self.high))
+
+
+class _LogSketch:
+    """Weighted quantile sketches, one per row, with relative accuracy.
+
+    Negative and positive values go to separate `_LogStore` histograms
+    of their log magnitudes and zeros are counted apart, so quantiles of
+    heavy-tailed or skewed data are interpolated to within a bounded
+    relative error rather than a fraction of the range.
+    """
+
+    def __init__(self, rows, bins):
+        self.negative = _LogStore(rows, bins)
+        self.positive = _LogStore(rows, bins)
+        self.zeros = np.zeros(rows)
+
+    def add(self, x, weights):
+        """Adds values `x` with one row of `weights` per histogram."""
+
+        for store, mask in [(self.negative, x < 0), (self.positive, x > 0)]:
+            if mask.any():
+                store.add(np.log(np.abs(x[mask])), weights[:, mask])
+        self.zeros += weights[:, x == 0].sum(axis=1)
+
+    def merge(self, other):
+        """Adds the counts of the sketch `other`, row by row."""
+
+        self.negative.merge(other.negative)
+        self.positive.merge(other.positive)
+        self.zeros += other.zeros
+
+    def quantile(self, q):
+        """Interpolated `q` quantile of every row."""
+
+        # lay out the bins in increasing order of value
+        neg, pos = self.negative.counts[:, ::-1], self.positive.counts
+        counts = np.hstack((neg, self.zeros[:, None], pos))
+        bins = neg.shape[1]
+
+        rows = np.arange(counts.shape[0])
+        cum = np.cumsum(counts, axis=1)
+        target = q * cum[:, -1]
+        j = np.minimum((cum < target[:, None]).sum(axis=1),
+                       counts.shape[1] - 1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frac = (target - cum[rows, j] + counts[rows, j]) / counts[rows, j]
+
+        estimate = np.zeros(len(rows))
+        if self.negative.exponent is not None:
+            # negative bins run from large to small magnitudes
+            below = j < bins
+            estimate[below] = -self.negative.value(
+                bins - j[below] - frac[below]
+            )
+        if self.positive.exponent is not None:
+            above = j > bins
+            estimate[above] = self.positive.value(
+                j[above] - bins - 1 + frac[above]
+            )
+        estimate[np.isnan(frac)] = np.nan
+        return estimate
+
+
+class BootstrapAccumulator:
+    """Online Poisson bootstrap of an estimator over chunks of data.
+
+    Instead of resampling, every replicate weights each observation by
+    an independent Poisson(1) draw as it streams past, keeping running
+    weighted moments for "mean", "var" and "sd" and a weighted log-spaced
+    quantile sketch for "median". Memory is O(`rep`), whatever the
+    stream length. As with ``nan_policy="propagate"``, NaN values make
+    the estimate of every replicate weighting them NaN, whatever the
+    estimator, and infinite values are rejected.
+
+    Accumulators of shards of the data (e.g. on separate nodes) are
+    combined by `merge()`, which is associative, and shipped with
+    `to_bytes()` and `from_bytes()`, so only their O(`rep`) state, never
+    the data, has to be sent. Shards should be seeded independently,
+    e.g. by spawning their seeds from one `numpy.random.SeedSequence`.
+
+    Parameters
+    ----------
+    rep : int
+        number of replicates of the distribution
+    estimator : {"mean", "median", "var", "sd"}
+        sampling distributor's estimator
+    random_state : None or int or numpy.random.SeedSequence or numpy.random.Generator, default=None
+        seed, seed sequence or generator for the Poisson weights
+    sketch_bins : int, default=1024
+        number of log-spaced bins per sign and replicate for the "median"
+        estimator
+    max_bytes : None or int, default=None
+        memory budget in bytes for the weights of a single block of values
+
+    Examples
+    --------
+    >>> acc = BootstrapAccumulator(1000, estimator="median", random_state=1)
+    >>> for chunk in pd.read_csv("latency.csv", chunksize=10 ** 6):
+    ...     acc.update(chunk["latency"])
+    >>> acc.stats(level=0.95)
+
+    >>> seeds = np.random.SeedSequence(1).spawn(2)
+    >>> shards = [BootstrapAccumulator(1000, random_state=seed).update(part)
+    ...           for seed, part in zip(seeds, np.array_split(sample, 2))]
+    >>> BootstrapAccumulator.from_bytes(shards[0].to_bytes()).merge(
+    ...     shards[1]).stats()
+    """
+
+    def __init__(self, rep, estimator="mean", random_state=None,
+                 sketch_bins=DEFAULT_SKETCH_BINS, max_bytes=None):
+
+        _check_params(rep, "auto", estimator)
+
+        _check_random_state(random_state)
+
+        if not isinstance(sketch_bins, int):
+            raise TypeError("sketch_bins should be of type 'int'")
+
+        if sketch_bins < 2:
+            raise ValueError("Invalid value for sketch_bins")
+
+        _check_max_bytes(max_bytes)
+
+        self.rep = rep
+        self.estimator = estimator
+        self.sketch_bins = sketch_bins
+        self.max_bytes = max_bytes
+        self.sample_size = 0
+        # Poisson weight of NaN values, row 0 being the sample itself
+        self._nan_weight = np.zeros(rep + 1)
+        self._rng = _generators(random_state)[0]
+
+        # row 0 holds the sample itself, with unit weights
+        if estimator == "median":
+            self._sketch = _LogSketch(rep + 1, sketch_bins)
+        else:
+            self._shift = None
+            self._moments = np.zeros((3, rep + 1))
+
+    def update(self, chunk):
+        """Adds a chunk of observations to every replicate.
+
+        Parameters
+        ----------
+        chunk : list or numpy.ndarray or pandas.core.series.Series
+            next observations of the stream
+
+        Returns
+        -------
+        BootstrapAccumulator
+            the updated accumulator
+        """
+
+        chunk = np.asarray(chunk, dtype=float).ravel()
+        if chunk.size == 0:
+            return self
+
+        if np.isinf(chunk).any():
+            raise ValueError("chunk contains infinite values")
+
+        # Poisson weights plus their float64 copies for every replicate
+        step = _chunk_reps(len(chunk), 3 * 8 * (self.rep + 1),
+                           max_bytes=self.max_bytes)
+        for start in range(0, len(chunk), step):
+            x = chunk[start:start + step]
+            weights = np.ones((self.rep + 1, len(x)))
+            weights[1:] = self._rng.poisson(1.0, size=(self.rep, len(x)))
+
+            nan = np.isnan(x)
+            if nan.any():
+                self._nan_weight += weights[:, nan].sum(axis=1)
+                x, weights = x[~nan], weights[:, ~nan]
+                if x.size == 0:
+                    continue
+
+            if self.estimator == "median":
+                self._sketch.add(x, weights)
+                continue
+
+            if self._shift is None:
+                self._shift = x[0]
+            dev = x - self._shift
+            self._moments[0] += weights.sum(axis=1)
+            self._moments[1] += weights @ dev
+            self._moments[2] += weights @ dev ** 2
+
+        self.sample_size += len(chunk)
+        return self
+
+    def merge(self, other):
+        """Adds the observations of another accumulator.
+
+        Moments are summed about a common shift and median sketches bin
+        by bin on the coarser grid of both, so the order in which shards
+        are merged does not matter.
+
+        Parameters
+        ----------
+        other : BootstrapAccumulator
+            accumulator of the same `rep`, `estimator` and `sketch_bins`,
+            updated from other observations with another seed
+
+        Returns
+        -------
+        BootstrapAccumulator
+            the merged accumulator
+        """
+
+        if not isinstance(other, BootstrapAccumulator):
+            raise TypeError("other should be of type 'BootstrapAccumulator'")
+
+        if (other.rep, other.estimator, other.sketch_bins) != \
+                (self.rep, self.estimator, self.sketch_bins):
+            raise ValueError("Only accumulators of the same rep, estimator "
+                             "and sketch_bins can be merged")
+
+        if self.estimator == "median":
+            self._sketch.merge(other._sketch)
+        elif other._shift is not None:
+            if self._shift is None:
+                self._shift = other._shift
+            # moments of deviations from other's shift, moved to this one
+            delta = other._shift - self._shift
+            weight, first, second = other._moments
+            self._moments[0] += weight
+            self._moments[1] += first + delta * weight
+            self._moments[2] += second + 2 * delta * first + \
+                delta ** 2 * weight
+
+        self._nan_weight += other._nan_weight
+        self.sample_size += other.sample_size
+        return self
+
+    def to_bytes(self):
+        """Serialises the accumulator, without pickling.
+
+        Returns
+        -------
+        bytes
+            the state of the accumulator as a NumPy ``.npz`` archive,
+            restored by `from_bytes()`
+        """
+
+        meta = {
+            "rep": self.rep, "estimator": self.estimator,
+            "sketch_bins": self.sketch_bins, "max_bytes": self.max_bytes,
+            "sample_size": self.sample_size,
+            "rng": self._rng.bit_generator.state,
+        }
+        arrays = {"nan_weight": self._nan_weight}
+        if self.estimator == "median":
+            arrays["zeros"] = self._sketch.zeros
+            for name in ("negative", "positive"):
+                store = getattr(self._sketch, name)
+                arrays[name] = store.counts
+                meta[name] = [store.exponent, store.offset, store.low,
+                              store.high]
+        else:
+            arrays["moments"] = self._moments
+            meta["shift"] = self._shift
+
+        buffer = io.BytesIO()
+        np.savez(buffer, meta=np.array(json.dumps(meta)), **arrays)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Restores an accumulator serialised by `to_bytes()`.
+
+        Parameters
+        ----------
+        data : bytes
+            serialised accumulator
+
+        Returns
+        -------
+        BootstrapAccumulator
+            the restored accumulator
+        """
+
+        if not isinstance(data, bytes):
+            raise TypeError("data should be of type 'bytes'")
+
+        with np.load(io.BytesIO(data)) as arrays:
+            meta = json.loads(str(arrays["meta"]))
+            acc = cls(meta["rep"], meta["estimator"],
+                      sketch_bins=meta["sketch_bins"],
+                      max_bytes=meta["max_bytes"])
+            acc.sample_size = meta["sample_size"]
+            acc._rng.bit_generator.state = meta["rng"]
+            acc._nan_weight = arrays["nan_weight"]
+            if acc.estimator == "median":
+                acc._sketch.zeros = arrays["zeros"]
+                for name in ("negative", "positive"):
+                    store = getattr(acc._sketch, name)
+                    store.counts = arrays[name]
+                    (store.exponent, store.offset, store.low,
+                     store.high) = meta[name]
+            else:
+                acc._moments = arrays["moments"]
+                acc._shift = meta["shift"]
+
+        return acc
+
+    def _estimates(self):
+        """Sample estimate followed by the `rep` replicate estimates."""
+
+        if self.estimator == "median":
+            estimates = self._sketch.quantile(0.5)
+        else:
+            weight, first, second = self._moments
+            with np.errstate(invalid="ignore", divide="ignore"):
+                shift = first / weight
+                var = np.maximum(second / weight - shift ** 2, 0)
+
+            if self.estimator == "mean":
+                estimates = shift + (0 if self._shift is None
+                                     else self._shift)
+            else:
+                estimates = var if self.estimator == "var" else np.sqrt(var)
+
+        estimates[self._nan_weight > 0] = np.nan
+        return estimates
+
+    def stats(self, level=0.95, pass_dist=False):
+        """Calculates a bootstrapped confidence interval from the stream.
+
+        Parameters
+        ----------
+        level : float, default=0.95
+            confidence level
+        pass_dist : bool, default = "False"
+            return the bootstrapped sample distribution - False or True
+
+        Returns
+        -------
+        dictionary
+            Dictionary in the format of `calculate_boot_stats()`.
+        """
+
+        _check_level(level)
+
+        if not isinstance(pass_dist, bool):
+            raise TypeError("pass_dist should be of type 'bool'")
+
+        if self.sample_size == 0:
+            raise ValueError("No observations have been added")
+
+        estimates = self._estimates()
+        dist = estimates[1:]
+        stats_dict = _boot_stats(dist, estimates[0], level, self.sample_size,
+                                 "auto", self.rep, self.estimator)
+
+        if pass_dist:
+            return stats_dict, dist
+        else:
+            return stats_dict
+
+
+def calculate_boot_stats_stream(chunks, rep, level=0.95, estimator="mean",
+                                random_state=None, pass_dist=False,
+                                sketch_bins=DEFAULT_SKETCH_BINS,
+                                max_bytes=None):
+    """Calculates a bootstrapped confidence interval for a stream of data.
+
+    Uses the online Poisson bootstrap of `BootstrapAccumulator`, so data
+    larger than memory (e.g. CSV or Parquet files read in chunks) can be
+    bootstrapped with memory independent of the stream length. Means,
+    variances and standard deviations are exact for the Poisson weights,
+    medians are interpolated from per-replicate log-spaced sketches with
+    a bounded relative error.
+
+    Parameters
+    ----------
+    chunks : iterable
+        iterable of lists, numpy.ndarray or pandas.core.series.Series
+    rep : int
+        number of replicates of the distribution
+    level : float, default=0.95
+        confidence level
+    estimator : {"mean", "median", "var", "sd"}
+        sampling distributor's estimator
+    random_state : None or int or numpy.random.SeedSequence or numpy.random.Generator, default=None
+        seed, seed sequence or generator for the Poisson weights
+    pass_dist : bool, default = "False"
+        return the bootstrapped sample distribution - False or True
+    sketch_bins : int, default=1024
+        number of log-spaced bins per sign and replicate for the "median"
+        estimator
+    max_bytes : None or int, default=None
+        memory budget in bytes for the weights of a single block of values
+
+    Returns
+    -------
+    dictionary
+        Dictionary in the format of `calculate_boot_stats()`.
+
+    Examples
+    --------
+    >>> chunks = pd.read_csv("events.csv", chunksize=10 ** 6)
+    >>> calculate_boot_stats_stream((c["value"] for c in chunks), 1000,
+    ...                             random_state=123)
+    """
+
+    accumulator = BootstrapAccumulator(rep, estimator=estimator,
+                                       random_state=random_state,
+                                       sketch_bins=sketch_bins,
+                                       max_bytes=max_bytes)
+    for chunk in chunks:
+        accumulator.update(chunk)
+
+    return accumulator.stats(level=level, pass_dist=pass_dist)
@@ -0,0 +1,166 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pytest import raises
+from strapvizpy.batch import (calculate_boot_stats_grouped,
+                              calculate_boot_stats_many)
+from strapvizpy.bootstrap import calculate_boot_stats
+
+
+def test_calculate_boot_stats_grouped():
+    """
+    Tests the functionality of `calculate_boot_stats_grouped()` against
+    `calculate_boot_stats()` on every group.
+
+    9 tests in total.
+    """
+
+    rng = np.random.default_rng(0)
+    sizes = rng.integers(5, 40, 30)
+    df = pd.DataFrame({
+        "tenant": np.repeat(np.arange(30) % 3, sizes),
+        "endpoint": np.repeat(np.arange(30), sizes),
+        "latency": rng.lognormal(size=sizes.sum()),
+    })
+    df.loc[0, "tenant"] = None
+
+    for estimator in ["mean", "median", "var", "sd"]:
+        stats_df = calculate_boot_stats_grouped(df, "latency",
+                                                by=["tenant", "endpoint"],
+                                                rep=2000,
+                                                estimator=estimator,
+                                                random_state=1,
+                                                max_bytes=10 ** 5)
+        sample = df[df["endpoint"] == 5]["latency"]
+        row = stats_df[stats_df["endpoint"] == 5].iloc[0]
+        expected = calculate_boot_stats(sample, 2000, estimator=estimator,
+                                        random_state=2)
+
+        # checks each group against a separate bootstrap of the group
+        assert np.isclose(row["sample_" + estimator],
+                          expected["sample_" + estimator])
+        assert np.isclose(row["std_err"], expected["std_err"], rtol=0.15)
+
+    # checks the layout of the returned table, without the missing key
+    assert list(stats_df.columns) == [
+        "tenant", "endpoint", "lower", "upper", "sample_sd", "std_err",
+        "level", "sample_size", "n", "rep", "estimator"
+    ]
+    assert len(stats_df) == 30
+    assert stats_df["sample_size"].sum() == sizes.sum() - 1
+
+
+def test_calculate_boot_stats_grouped_errors():
+    """
+    Tests error cases and messages thrown by
+    `calculate_boot_stats_grouped()`.
+
+    4 tests in total.
+    """
+
+    df = pd.DataFrame({"g": [1, 1, 2], "v": [1.0, 2.0, 3.0]})
+
+    # checks that the same seed gives the same intervals
+    assert calculate_boot_stats_grouped(df, "v", "g", 50, n=4,
+                                        random_state=3).equals(
+        calculate_boot_stats_grouped(df, "v", "g", 50, n=4, random_state=3)
+    )
+
+    with raises(TypeError) as e:
+        calculate_boot_stats_grouped(df.to_numpy(), "v", "g", 10)
+    assert str(e.value) == (
+        "df should be of type 'pandas.core.frame.DataFrame'"
+    )
+
+    with raises(ValueError) as e:
+        calculate_boot_stats_grouped(df, "value", "g", 10)
+    assert str(e.value) == "value_col should be a column of df"
+
+    with raises(TypeError) as e:
+        calculate_boot_stats_grouped(df, "v", ("g",), 10)
+    assert str(e.value) == "by should be of type 'str' or 'list'"
+
+
+def test_calculate_boot_stats_many():
+    """
+    Tests the functionality of `calculate_boot_stats_many()` against
+    `calculate_boot_stats()` on every sample, for both input layouts and
+    engines.
+
+    10 tests in total.
+    """
+
+    rng = np.random.default_rng(0)
+    samples = [rng.lognormal(size=size) for size in rng.integers(5, 40, 20)]
+    offsets = np.concatenate(([0], np.cumsum([len(s) for s in samples])))
+
+    for estimator in ["mean", "median"]:
+        stats_df = calculate_boot_stats_many(samples, 2000,
+                                             estimator=estimator,
+                                             random_state=1)
+        expected = calculate_boot_stats(samples[3], 2000,
+                                        estimator=estimator, random_state=2)
+
+        # checks each sample against a separate bootstrap of the sample
+        assert np.isclose(stats_df["sample_" + estimator][3],
+                          expected["sample_" + estimator])
+        assert np.isclose(stats_df["std_err"][3], expected["std_err"],
+                          rtol=0.15)
+
+    # checks the layout of the returned table
+    assert list(stats_df["sample_size"]) == [len(s) for s in samples]
+
+    # checks that ragged values with offsets match the list of samples
+    assert stats_df.equals(
+        calculate_boot_stats_many(np.concatenate(samples), 2000,
+                                  estimator="median", random_state=1,
+                                  offsets=offsets)
+    )
+
+    # checks that no samples give an empty table
+    empty = calculate_boot_stats_many([], 10, estimator="median")
+    assert empty.empty and list(empty) == list(stats_df)
+
+    # checks the compiled engine against the vectorised passes
+    pytest.importorskip("numba")
+    for estimator in ["mean", "median"]:
+        compiled = calculate_boot_stats_many(samples, 2000,
+                                             estimator=estimator,
+                                             random_state=1, engine="numba")
+        vectorised = calculate_boot_stats_many(samples, 2000,
+                                               estimator=estimator,
+                                               random_state=1)
+        assert np.allclose(compiled["std_err"], vectorised["std_err"],
+                           rtol=0.15)
+
+    # checks that a NaN only spreads through its own sample
+    samples[0] = np.r_[np.nan, samples[0]]
+    compiled = calculate_boot_stats_many(samples, 200, random_state=1,
+                                         engine="numba")
+    assert compiled["std_err"].isna().tolist() == [True] + [False] * 19
+
+
+def test_calculate_boot_stats_many_errors():
+    """
+    Tests error cases and messages thrown by `calculate_boot_stats_many()`.
+
+    4 tests in total.
+    """
+
+    with raises(TypeError) as e:
+        calculate_boot_stats_many(np.ones(4), 10)
+    assert str(e.value) == "samples should be of type 'list'"
+
+    with raises(ValueError) as e:
+        calculate_boot_stats_many(np.ones(4), 10, offsets=[0, 2, 3])
+    assert str(e.value) == (
+        "offsets should start at 0 and end at the number of values"
+    )
+
+    with raises(ValueError) as e:
+        calculate_boot_stats_many([[1.0, 2.0], []], 10)
+    assert str(e.value) == "Every sample should hold at least one value"
+
+    with raises(ValueError) as e:
+        calculate_boot_stats_many([[1.0, 2.0]], 10, engine="cython")
+    assert str(e.value) == "Supported engines are auto, numpy, numba"
@@ -0,0 +1,138 @@
+import tracemalloc
+import numpy as np
+from pytest import raises
+from strapvizpy.blocks import optimal_block_length
+from strapvizpy.bootstrap import bootstrap_distribution, calculate_boot_stats
+
+
+def _ar1(size, phi, seed=0):
+    """AR(1) series with coefficient `phi` and standard normal noise."""
+
+    noise = np.random.default_rng(seed).normal(size=size)
+    series = np.empty(size)
+    series[0] = noise[0]
+    for t in range(1, size):
+        series[t] = phi * series[t - 1] + noise[t]
+    return series
+
+
+def test_block_bootstrap():
+    """
+    Tests the moving, circular and stationary bootstraps of
+    `bootstrap_distribution()` on an autocorrelated series.
+
+    11 tests in total.
+    """
+
+    series = _ar1(20000, 0.8)
+    # long-run standard error of the mean of an AR(1) series
+    expected = series.std() / np.sqrt(len(series)) * np.sqrt(1.8 / 0.2)
+    iid = bootstrap_distribution(series, 500, random_state=1).std()
+
+    for block in ["moving", "circular", "stationary"]:
+        dist = bootstrap_distribution(series, 500, block=block,
+                                      random_state=1)
+
+        # checks that blocks recover the autocorrelated standard error
+        assert np.isclose(dist.std(), expected, rtol=0.2)
+        assert dist.std() > 2 * iid
+
+    # checks that segments of blocks within a small budget agree
+    for block in ["moving", "circular"]:
+        assert np.allclose(
+            bootstrap_distribution(series, 50, block=block, random_state=1),
+            bootstrap_distribution(series, 50, block=block, random_state=1,
+                                   max_bytes=10 ** 5)
+        )
+    assert np.isclose(
+        bootstrap_distribution(series, 500, block="stationary",
+                               random_state=1, max_bytes=10 ** 5).std(),
+        expected, rtol=0.2
+    )
+
+    # checks the medians and columns of block bootstraps
+    medians = bootstrap_distribution(np.c_[series, -series], 200,
+                                     estimator="median", block="circular",
+                                     block_length=50, random_state=1)
+    assert np.allclose(medians[:, 0], -medians[:, 1])
+
+    # checks that block lengths grow with the autocorrelation
+    noise = np.random.default_rng(0).normal(size=20000)
+    assert optimal_block_length(noise) <= 3
+    assert optimal_block_length(series) > 20 * optimal_block_length(noise)
+
+
+def test_block_bootstrap_median():
+    """
+    Tests that medians of block bootstraps are exact, stay within the
+    memory budget and propagate NaN.
+
+    4 tests in total.
+    """
+
+    series = _ar1(20000, 0.8)
+
+    # checks that medians of small segments match whole replicates
+    for block in ["moving", "circular"]:
+        assert np.array_equal(
+            bootstrap_distribution(series, 50, estimator="median",
+                                   block=block, random_state=1),
+            bootstrap_distribution(series, 50, estimator="median",
+                                   block=block, random_state=1,
+                                   max_bytes=10 ** 5)
+        )
+
+    # checks that memory does not grow with the length of replicates
+    tracemalloc.start()
+    bootstrap_distribution(series, 20, estimator="median", block="stationary",
+                           block_length=50, max_bytes=10 ** 5,
+                           random_state=1)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < 5 * series.nbytes
+
+    # checks that only replicates drawing a NaN are NaN
+    series[5] = np.nan
+    dist = bootstrap_distribution(series, 200, estimator="median",
+                                  block="circular", block_length=50,
+                                  random_state=1)
+    assert 0.4 < np.isnan(dist).mean() < 0.8
+
+
+def test_block_bootstrap_stats():
+    """
+    Tests block bootstraps of `calculate_boot_stats()` and their errors.
+
+    5 tests in total.
+    """
+
+    series = _ar1(2000, 0.5)
+
+    # checks that the automatic block length is reported
+    stats = calculate_boot_stats(series, 200, block="stationary",
+                                 random_state=1)
+    assert stats["block_length"] == optimal_block_length(series)
+
+    # tests with an invalid block
+    with raises(ValueError) as e:
+        bootstrap_distribution(series, 100, block="overlapping")
+    assert str(e.value) == "Supported blocks are moving, circular, stationary"
+
+    # tests with a block longer than the series
+    with raises(ValueError) as e:
+        bootstrap_distribution(series, 100, block="moving",
+                               block_length=5000)
+    assert str(e.value) == "Invalid value for block_length"
+
+    # tests with invalid input type of block_length
+    with raises(TypeError) as e:
+        bootstrap_distribution(series, 100, block="moving",
+                               block_length=2.5)
+    assert str(e.value) == "block_length should be of type 'str' or 'int'"
+
+    # tests with an interval method assuming independent observations
+    with raises(ValueError) as e:
+        calculate_boot_stats(series, 100, block="moving", method="bca")
+    assert str(e.value) == (
+        "The bca and studentized methods do not support block bootstraps"
+    )
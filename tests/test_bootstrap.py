@@ -2,9 +2,12 @@ from logging import WARNING
 from warnings import WarningMessage, warn_explicit
 import warnings
 import numpy as np
+import pandas as pd
 from pytest import raises
 import pytest
-from strapvizpy.bootstrap import bootstrap_distribution, calculate_boot_stats
+from strapvizpy.bootstrap import (_as_sample, _jackknife,
+                                  bootstrap_distribution,
+                                  calculate_boot_stats)
 
 
 def test_bootstrap_distribution():
@@ -25,9 +28,9 @@ def test_bootstrap_distribution():
 
     # checks the values of returned object
     assert np.array_equal(dist.tolist(),
-                          [1.3333333333333333,
+                          [2.3333333333333335,
                            1.6666666666666667,
-                           1.3333333333333333])
+                           2.3333333333333335])
 
     dist_2 = bootstrap_distribution([1, 2, 3],
                                   3,
@@ -36,9 +39,9 @@ def test_bootstrap_distribution():
 
     # checks with different estimator
     assert np.array_equal(dist_2.tolist(),
-                          [0.2222222222222222,
-                           0.2222222222222222,
-                           0.2222222222222222])
+                          [0.22222222222222224,
+                           0.888888888888889,
+                           0.8888888888888888])
 
     dist_3 = bootstrap_distribution([1, 2, 3],
                                   3,
@@ -49,11 +52,389 @@ def test_bootstrap_distribution():
     assert np.array_equal(dist_2, dist_3)
 
 
+def test_bootstrap_distribution_chunked():
+    """
+    Tests that chunked resampling in `bootstrap_distribution()` matches
+    the single pass result and respects the memory budget.
+
+    4 tests in total.
+    """
+
+    sample = np.arange(50, dtype=float)
+
+    full = bootstrap_distribution(sample, 100, estimator="median",
+                                  random_seed=42, chunk_reps=100)
+    chunked = bootstrap_distribution(sample, 100, estimator="median",
+                                     random_seed=42, chunk_reps=7)
+
+    # checks the shape of returned object
+    assert chunked.shape == (100,)
+
+    # checks that chunking does not change the replicates
+    assert np.array_equal(full, chunked)
+
+    # checks that a byte budget smaller than a replicate still works
+    tiny = bootstrap_distribution(sample, 100, estimator="median",
+                                  random_seed=42, max_bytes=1)
+    assert np.array_equal(full, tiny)
+
+    # checks that the budget is threaded through calculate_boot_stats
+    stats = calculate_boot_stats(sample, 100, estimator="median",
+                                 random_seed=42, max_bytes=1000)
+    assert stats["std_err"] == np.std(full)
+
+
+def test_bootstrap_distribution_parallel():
+    """
+    Tests that parallel resampling in `bootstrap_distribution()` is
+    reproducible for a given seed and number of workers.
+
+    5 tests in total.
+    """
+
+    sample = np.arange(50, dtype=float)
+
+    dist = bootstrap_distribution(sample, 101, random_seed=7, n_jobs=4)
+
+    # checks the shape of returned object
+    assert dist.shape == (101,)
+
+    # checks that the same seed and workers give identical replicates
+    assert np.array_equal(
+        dist, bootstrap_distribution(sample, 101, random_seed=7, n_jobs=4,
+                                     chunk_reps=3)
+    )
+
+    # checks that the process backend draws the same streams
+    assert np.array_equal(
+        dist, bootstrap_distribution(sample, 101, random_seed=7, n_jobs=4,
+                                     backend="process")
+    )
+
+    # checks that more workers than replicates is handled
+    assert bootstrap_distribution(sample, 3, random_seed=7,
+                                  n_jobs=-1).shape == (3,)
+
+    # checks that n_jobs is threaded through calculate_boot_stats
+    stats = calculate_boot_stats(sample, 101, random_seed=7, n_jobs=4)
+    assert stats["std_err"] == np.std(dist)
+
+
+def test_bootstrap_distribution_random_state():
+    """
+    Tests the seeds, seed sequences and generators accepted as
+    `random_state` by `bootstrap_distribution()`.
+
+    5 tests in total.
+    """
+
+    sample = np.arange(50, dtype=float)
+
+    dist = bootstrap_distribution(sample, 20, random_state=0)
+
+    # checks that a zero seed is honoured
+    assert np.array_equal(dist, bootstrap_distribution(sample, 20,
+                                                       random_seed=0))
+
+    # checks that seeds and seed sequences give the same stream
+    assert np.array_equal(
+        dist,
+        bootstrap_distribution(sample, 20,
+                               random_state=np.random.SeedSequence(0))
+    )
+
+    # checks that a generator is drawn from and advanced
+    rng = np.random.default_rng(0)
+    assert np.array_equal(dist, bootstrap_distribution(sample, 20,
+                                                       random_state=rng))
+    assert not np.array_equal(dist, bootstrap_distribution(sample, 20,
+                                                           random_state=rng))
+
+    # checks that the global random state is left untouched
+    np.random.seed(3)
+    expected = np.random.random_sample()
+    np.random.seed(3)
+    calculate_boot_stats(sample, 20, random_state=np.random.default_rng(1))
+    assert np.random.random_sample() == expected
+
+
+def test_bootstrap_distribution_multinomial():
+    """
+    Tests that the multinomial engine of `bootstrap_distribution()`
+    agrees with the naive resampling engine.
+
+    6 tests in total.
+    """
+
+    sample = np.repeat([1.0, 2.0, 5.0, 10.0], [200, 120, 60, 20])
+
+    for estimator in ["mean", "var", "sd"]:
+        naive = bootstrap_distribution(sample, 4000, estimator=estimator,
+                                       random_state=1, engine="naive")
+        multinomial = bootstrap_distribution(sample, 4000,
+                                             estimator=estimator,
+                                             random_state=1,
+                                             engine="multinomial")
+
+        # checks that both engines estimate the same distribution
+        assert np.isclose(naive.mean(), multinomial.mean(), rtol=0.02)
+        assert np.isclose(naive.std(), multinomial.std(), rtol=0.1)
+
+    # checks that "auto" selects the multinomial engine for few values
+    assert np.array_equal(
+        bootstrap_distribution(sample, 50, estimator="sd", random_state=3),
+        bootstrap_distribution(sample, 50, estimator="sd", random_state=3,
+                               engine="multinomial")
+    )
+
+
+def test_bootstrap_distribution_median():
+    """
+    Tests the counting median engine of `bootstrap_distribution()`.
+
+    7 tests in total.
+    """
+
+    sample = np.sort(np.random.default_rng(0).normal(size=101))
+
+    naive = bootstrap_distribution(sample, 500, estimator="median",
+                                   random_state=5, engine="naive")
+    counted = bootstrap_distribution(sample, 500, estimator="median",
+                                     random_state=5)
+
+    # checks that counting indices into a sorted sample gives the same
+    # medians as gathering them, for odd and even bootstrap sizes
+    assert np.allclose(naive, counted)
+    assert np.allclose(
+        bootstrap_distribution(sample, 500, n=40, estimator="median",
+                               random_state=5, engine="naive"),
+        bootstrap_distribution(sample, 500, n=40, estimator="median",
+                               random_state=5, chunk_reps=7)
+    )
+
+    # checks the multinomial counts for few distinct values
+    discrete = np.repeat([1.0, 2.0, 3.0], [300, 100, 400])
+    multinomial = bootstrap_distribution(discrete, 2000, n=200,
+                                         estimator="median", random_state=5)
+    naive = bootstrap_distribution(discrete, 2000, n=200,
+                                   estimator="median", random_state=5,
+                                   engine="naive")
+    assert set(np.unique(multinomial)) <= {1.0, 1.5, 2.0, 2.5, 3.0}
+    assert np.isclose(naive.mean(), multinomial.mean(), rtol=0.05)
+
+    # checks that replicates drawing a missing value are NaN
+    missing = np.r_[np.arange(20.0), np.nan]
+    for engine in ["auto", "multinomial"]:
+        medians = bootstrap_distribution(missing, 200, estimator="median",
+                                         random_state=5, engine=engine)
+        assert np.array_equal(
+            np.isnan(medians),
+            np.isnan(bootstrap_distribution(missing, 200, estimator="median",
+                                            random_state=5, engine="naive"))
+        )
+    assert np.isnan(medians).any() and not np.isnan(medians).all()
+
+
+def test_bootstrap_distribution_columns():
+    """
+    Tests that `bootstrap_distribution()` bootstraps every column of a
+    2-D sample from the same resampled rows.
+
+    6 tests in total.
+    """
+
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=60)
+    df = pd.DataFrame({"x": x, "y": 2 * x, "z": rng.normal(size=60)})
+
+    for estimator in ["mean", "median", "sd"]:
+        dist = bootstrap_distribution(df, 200, estimator=estimator,
+                                      random_state=4)
+
+        # checks the shape and that rows are shared across columns
+        assert dist.shape == (200, 3)
+        assert np.allclose(dist[:, 1], 2 * dist[:, 0])
+
+    # checks the multinomial engine over a few distinct rows
+    rows = np.repeat([[1.0, 3.0], [2.0, 1.0], [4.0, 0.0]], 100, axis=0)
+    multinomial = bootstrap_distribution(rows, 3000, estimator="var",
+                                         random_state=4)
+    naive = bootstrap_distribution(rows, 3000, estimator="var",
+                                   random_state=4, engine="naive")
+    assert np.allclose(multinomial.mean(axis=0), naive.mean(axis=0),
+                       rtol=0.02)
+
+    # checks that each column matches a 1-D bootstrap of the same rows
+    assert np.allclose(
+        bootstrap_distribution(df.to_numpy(), 50, estimator="median",
+                               random_state=4, engine="naive")[:, 2],
+        bootstrap_distribution(df["z"], 50, estimator="median",
+                               random_state=4, engine="naive")
+    )
+
+    # checks the per-column stats of calculate_boot_stats
+    stats = calculate_boot_stats(df, 200, random_state=4)
+    assert np.allclose(stats["sample_mean"], df.mean())
+    assert stats["lower"].shape == stats["std_err"].shape == (3,)
+
+
+def test_bootstrap_distribution_inputs(tmp_path):
+    """
+    Tests that `bootstrap_distribution()` resamples Series, Arrow and
+    memory-mapped samples from their own buffers.
+
+    7 tests in total.
+    """
+
+    sample = np.random.default_rng(0).normal(size=1000)
+    expected = bootstrap_distribution(sample, 100, random_state=1,
+                                      engine="naive")
+
+    # checks that contiguous Series and Arrow buffers are not copied
+    series = pd.Series(sample)
+    assert np.shares_memory(_as_sample(series), series.to_numpy())
+    assert np.array_equal(bootstrap_distribution(series, 100,
+                                                 random_state=1,
+                                                 engine="naive"), expected)
+
+    # checks memory-mapped samples stay mapped and are gathered by index
+    mapped = np.memmap(tmp_path / "sample.dat", dtype=float, mode="w+",
+                       shape=sample.shape)
+    mapped[:] = sample
+    assert isinstance(_as_sample(mapped), np.memmap)
+    assert np.allclose(bootstrap_distribution(mapped, 100, random_state=1),
+                       expected)
+    assert calculate_boot_stats(mapped, 100, random_state=1)["sample_mean"] \
+        == sample.mean()
+
+    pa = pytest.importorskip("pyarrow")
+    arrow = pa.array(sample)
+    assert np.shares_memory(_as_sample(arrow), np.asarray(arrow))
+    assert np.array_equal(
+        bootstrap_distribution(pa.chunked_array([arrow]), 100,
+                               random_state=1, engine="naive"),
+        expected
+    )
+
+
+def test_bootstrap_distribution_weighted():
+    """
+    Tests weighted, frequency and NaN-aware bootstraps of
+    `bootstrap_distribution()` and `calculate_boot_stats()`.
+
+    12 tests in total.
+    """
+
+    values = np.array([1.0, 2.0, 5.0, 10.0])
+    frequencies = np.array([100, 50, 30, 20])
+    expanded = np.repeat(values, frequencies)
+
+    # checks that frequencies match the expanded sample
+    for estimator in ["mean", "median", "var", "sd"]:
+        assert calculate_boot_stats(values, 1000, estimator=estimator,
+                                    frequencies=frequencies,
+                                    random_state=1) == \
+            calculate_boot_stats(expanded, 1000, estimator=estimator,
+                                 random_state=1)
+
+    # checks that weighted gathers only draw rows with weight
+    dist = bootstrap_distribution(values, 100, weights=[0, 0, 1, 0],
+                                  random_state=1, engine="naive")
+    assert np.all(dist == 5.0)
+
+    # checks that gathered frequencies estimate the same distribution
+    naive = calculate_boot_stats(values, 2000, frequencies=frequencies,
+                                 random_state=1, engine="naive")
+    assert np.isclose(naive["std_err"],
+                      calculate_boot_stats(expanded, 2000,
+                                           random_state=1)["std_err"],
+                      rtol=0.1)
+
+    # checks the policies on NaN
+    sample = np.array([1.0, np.nan, 3.0, 4.0])
+    omitted = calculate_boot_stats(sample, 100, nan_policy="omit",
+                                   random_state=1)
+    assert omitted == calculate_boot_stats(sample[[0, 2, 3]], 100,
+                                           random_state=1)
+    assert np.isnan(bootstrap_distribution(sample, 100,
+                                           random_state=1)).any()
+    with raises(ValueError) as e:
+        bootstrap_distribution(sample, 100, nan_policy="raise")
+    assert str(e.value) == "sample contains NaN"
+
+    # tests with invalid weights
+    with raises(ValueError) as e:
+        bootstrap_distribution(values, 100, frequencies=[1, 2.5, 1, 1])
+    assert str(e.value) == "Invalid value for frequencies"
+
+    # tests with weights of the wrong length
+    with raises(ValueError) as e:
+        bootstrap_distribution(values, 100, weights=[1, 2])
+    assert str(e.value) == "weights should have one value per row of sample"
+
+    # tests with weights and an interval method needing the jackknife
+    with raises(ValueError) as e:
+        calculate_boot_stats(values, 100, weights=[1, 1, 1, 1],
+                             method="bca")
+    assert str(e.value) == (
+        "The bca and studentized methods do not support weights"
+    )
+
+
+def test_bootstrap_distribution_numba():
+    """
+    Tests that the numba engine of `bootstrap_distribution()` agrees
+    with the NumPy engines, skipped when numba is not installed.
+
+    13 tests in total.
+    """
+
+    pytest.importorskip("numba")
+
+    rng = np.random.default_rng(0)
+    sample = rng.normal(size=300)
+
+    for estimator in ["mean", "median", "var", "sd"]:
+        numpy = bootstrap_distribution(sample, 3000, estimator=estimator,
+                                       random_state=1, engine="numpy")
+        numba = bootstrap_distribution(sample, 3000, estimator=estimator,
+                                       random_state=1, engine="numba")
+
+        # checks that both engines estimate the same distribution
+        assert np.isclose(numpy.mean(), numba.mean(), atol=0.01)
+        assert np.isclose(numpy.std(), numba.std(), rtol=0.1)
+
+    # checks that the threads do not change the replicates
+    assert np.array_equal(
+        numba, bootstrap_distribution(sample, 3000, estimator="sd",
+                                      random_state=1, engine="numba",
+                                      n_jobs=4)
+    )
+
+    # checks that "auto" stays on the NumPy engines
+    assert np.array_equal(
+        numpy, bootstrap_distribution(sample, 3000, estimator="sd",
+                                      random_state=1)
+    )
+
+    # checks that columns are resampled by the same rows
+    df = pd.DataFrame({"x": sample, "y": 2 * sample})
+    dist = bootstrap_distribution(df, 100, random_state=1, engine="numba")
+    assert np.allclose(dist[:, 1], 2 * dist[:, 0])
+
+    # checks that NaN only spread to the replicates drawing them
+    missing = np.r_[np.nan, sample[:19]]
+    for estimator in ["mean", "median"]:
+        dist = bootstrap_distribution(missing, 2000, estimator=estimator,
+                                      random_state=1, engine="numba")
+        assert 0.5 < np.isnan(dist).mean() < 0.8
+
+
 def test_bootstrap_distribution_errors():
     """
     Tests error cases and messages thrown by `bootstrap_distribution()`.
 
-    10 tests in total.
+    25 tests in total.
     """
 
     # tests with invalid input type of sample
@@ -61,9 +442,15 @@ def test_bootstrap_distribution_errors():
         bootstrap_distribution({1, 2, 3}, 3, 3)
     assert str(e.value) == (
         "sample should be one of the types"
-        "[list, numpy.ndarray, pandas.core.series.Series]"
+        "[list, numpy.ndarray, pandas.core.series.Series, "
+        "pandas.core.frame.DataFrame, pyarrow.Array, pyarrow.ChunkedArray]"
     )
 
+    # tests with invalid input dimensions of sample
+    with raises(ValueError) as e:
+        bootstrap_distribution(np.ones((2, 2, 2)), 3, 3)
+    assert str(e.value) == "sample should be 1 or 2 dimensional"
+
     # tests with invalid input type of rep
     with raises(TypeError) as e:
         bootstrap_distribution([1, 2, 3], 3.3, 3)
@@ -109,6 +496,79 @@ def test_bootstrap_distribution_errors():
         bootstrap_distribution([1, 2, 3], 3, 3, random_seed=-3)
     assert str(e.value) == "Invalid value for random_seed"
 
+    # tests with invalid input type of random_state
+    with raises(TypeError) as e:
+        bootstrap_distribution([1, 2, 3], 3, 3, random_state=1.5)
+    assert str(e.value) == (
+        "random_state should be None or of type 'int', "
+        "numpy.random.SeedSequence or numpy.random.Generator"
+    )
+
+    # tests with invalid input value of random_state
+    with raises(ValueError) as e:
+        bootstrap_distribution([1, 2, 3], 3, 3, random_state=-1)
+    assert str(e.value) == "Invalid value for random_state"
+
+    # tests with invalid input type of engine
+    with raises(TypeError) as e:
+        bootstrap_distribution([1, 2, 3], 3, 3, engine=1)
+    assert str(e.value) == "engine should be of type 'str'"
+
+    # tests with invalid input value of engine
+    with raises(ValueError) as e:
+        bootstrap_distribution([1, 2, 3], 3, 3, engine="gpu")
+    assert str(e.value) == (
+        "Supported engines are auto, numpy, naive, multinomial, numba"
+    )
+
+    # tests with both random_seed and random_state
+    with raises(ValueError) as e:
+        bootstrap_distribution([1, 2, 3], 3, 3, random_seed=1,
+                               random_state=1)
+    assert str(e.value) == (
+        "Only one of random_seed and random_state should be set"
+    )
+
+    # tests with invalid input type of chunk_reps
+    with raises(TypeError) as e:
+        bootstrap_distribution([1, 2, 3], 3, 3, chunk_reps=1.5)
+    assert str(e.value) == "chunk_reps should be None or of type 'int'"
+
+    # tests with invalid input value of chunk_reps
+    with raises(ValueError) as e:
+        bootstrap_distribution([1, 2, 3], 3, 3, chunk_reps=0)
+    assert str(e.value) == "Invalid value for chunk_reps"
+
+    # tests with invalid input type of max_bytes
+    with raises(TypeError) as e:
+        bootstrap_distribution([1, 2, 3], 3, 3, max_bytes="1GB")
+    assert str(e.value) == "max_bytes should be None or of type 'int'"
+
+    # tests with invalid input value of max_bytes
+    with raises(ValueError) as e:
+        bootstrap_distribution([1, 2, 3], 3, 3, max_bytes=-1)
+    assert str(e.value) == "Invalid value for max_bytes"
+
+    # tests with invalid input type of n_jobs
+    with raises(TypeError) as e:
+        bootstrap_distribution([1, 2, 3], 3, 3, n_jobs=2.0)
+    assert str(e.value) == "n_jobs should be of type 'int'"
+
+    # tests with invalid input value of n_jobs
+    with raises(ValueError) as e:
+        bootstrap_distribution([1, 2, 3], 3, 3, n_jobs=0)
+    assert str(e.value) == "Invalid value for n_jobs"
+
+    # tests with invalid input type of backend
+    with raises(TypeError) as e:
+        bootstrap_distribution([1, 2, 3], 3, 3, backend=None)
+    assert str(e.value) == "backend should be of type 'str'"
+
+    # tests with invalid input value of backend
+    with raises(ValueError) as e:
+        bootstrap_distribution([1, 2, 3], 3, 3, backend="gpu")
+    assert str(e.value) == "Supported backends are thread, process"
+
 
 def test_calculate_boot_stats():
     """
@@ -158,7 +618,7 @@ def test_calculate_boot_stats():
 
     assert test_dict["upper"] == 3.5
 
-    assert test_dict["std_err"] == 0.5414773771820943
+    assert test_dict["std_err"] == 0.5778319392349301
 
     assert test_dict["sample_size"] == 4
 
@@ -180,6 +640,131 @@ def test_calculate_boot_stats():
     assert test_dict_3['estimator'] == 'var'
 
 
+def test_calculate_boot_stats_methods():
+    """
+    Tests the basic, BCa and studentized intervals of
+    `calculate_boot_stats()`.
+
+    14 tests in total.
+    """
+
+    sample = np.random.default_rng(0).lognormal(size=40)
+
+    # checks the closed form jackknife against leaving out every value
+    for estimator, func in [("mean", np.mean), ("median", np.median),
+                            ("var", np.var), ("sd", np.std)]:
+        assert np.allclose(
+            np.sort(_jackknife(sample, estimator)),
+            np.sort([func(np.delete(sample, i)) for i in range(40)])
+        )
+
+    percentile = calculate_boot_stats(sample, 2000, random_state=1)
+    basic = calculate_boot_stats(sample, 2000, random_state=1,
+                                 method="basic")
+
+    # checks that basic intervals reflect the percentiles about the mean
+    assert np.isclose(basic["lower"],
+                      2 * sample.mean() - percentile["upper"])
+    assert np.isclose(basic["upper"],
+                      2 * sample.mean() - percentile["lower"])
+
+    # checks that BCa shifts the interval of a right-skewed sample up
+    bca = calculate_boot_stats(sample, 2000, random_state=1, method="bca")
+    assert bca["upper"] > percentile["upper"]
+    assert bca["lower"] < sample.mean() < bca["upper"]
+
+    # checks that studentized intervals resample like the naive engine
+    stats, dist = calculate_boot_stats(sample, 2000, estimator="sd",
+                                       random_state=1, method="studentized",
+                                       pass_dist=True)
+    assert np.array_equal(dist, bootstrap_distribution(
+        sample, 2000, estimator="sd", random_state=1, engine="naive"
+    ))
+    assert stats["lower"] < sample.std() < stats["upper"]
+
+    # checks per-column bounds of 2-D samples
+    stats = calculate_boot_stats(np.c_[sample, 2 * sample], 500,
+                                 estimator="median", random_state=1,
+                                 method="bca")
+    assert np.allclose(stats["lower"][1], 2 * stats["lower"][0])
+
+    # tests with invalid input type of method
+    with raises(TypeError) as e:
+        calculate_boot_stats(sample, 10, method=1)
+    assert str(e.value) == "method should be of type 'str'"
+
+    # tests with invalid input value of method
+    with raises(ValueError) as e:
+        calculate_boot_stats(sample, 10, method="abc")
+    assert str(e.value) == (
+        "Supported methods are percentile, basic, bca, studentized"
+    )
+
+    # tests the studentized method with the median
+    with raises(ValueError) as e:
+        calculate_boot_stats(sample, 10, estimator="median",
+                             method="studentized")
+    assert str(e.value) == (
+        "The studentized method supports the mean, var and sd estimators"
+    )
+
+
+def test_calculate_boot_stats_adaptive():
+    """
+    Tests the adaptive number of replicates of `calculate_boot_stats()`.
+
+    14 tests in total.
+    """
+
+    sample = np.random.default_rng(0).lognormal(size=200)
+
+    stats, dist = calculate_boot_stats(sample, 500, random_state=1,
+                                       tol=0.005, pass_dist=True)
+
+    # checks that replicates are drawn in increments until converged
+    assert stats["rep_used"] == len(dist)
+    assert stats["rep_used"] % 500 == 0 and stats["rep_used"] >= 2000
+    assert stats["rep"] == 500
+    assert max(stats["mc_error_lower"], stats["mc_error_upper"],
+               stats["mc_error_std_err"]) <= 0.005
+
+    # checks that the same seed gives the same replicates
+    assert stats == calculate_boot_stats(sample, 500, random_seed=1,
+                                         tol=0.005)
+
+    # checks that the cap stops an unreachable tolerance
+    capped = calculate_boot_stats(sample, 500, random_state=1, tol=1e-9,
+                                  max_rep=3200, method="bca")
+    assert capped["rep_used"] == 3000
+    assert capped["mc_error_upper"] > 1e-9
+
+    # checks that the default cap allows increments beyond DEFAULT_MAX_REP
+    large = calculate_boot_stats(sample[:5], 100001, random_state=1, tol=1.0)
+    assert large["rep_used"] == 400004
+    assert np.isfinite(large["mc_error_std_err"])
+
+    # tests with invalid input type of tol
+    with raises(TypeError) as e:
+        calculate_boot_stats(sample, 10, tol=1)
+    assert str(e.value) == "tol should be None or of type 'float'"
+
+    # tests with invalid input value of tol
+    with raises(ValueError) as e:
+        calculate_boot_stats(sample, 10, tol=-0.1)
+    assert str(e.value) == "Invalid value for tol"
+
+    # tests with invalid input type of max_rep
+    with raises(TypeError) as e:
+        calculate_boot_stats(sample, 10, tol=0.1, max_rep=1e5)
+    assert str(e.value) == "max_rep should be None or of type 'int'"
+
+    # tests with a cap below two increments
+    for max_rep in [5, 15]:
+        with raises(ValueError) as e:
+            calculate_boot_stats(sample, 10, tol=0.1, max_rep=max_rep)
+        assert str(e.value) == "Invalid value for max_rep"
+
+
 def test_calculate_boot_stats_errors():
     """
     Tests error cases and messages thrown by `calculate_boot_stats()`.
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+from pytest import raises
+from strapvizpy.bootstrap import bootstrap_distribution, calculate_boot_stats
+from strapvizpy.cache import BootstrapCache
+
+
+def test_bootstrap_cache():
+    """
+    Tests hits, misses and eviction of the in-memory tier of
+    `BootstrapCache`.
+
+    11 tests in total.
+    """
+
+    sample = np.random.default_rng(0).normal(size=100)
+    cache = BootstrapCache()
+
+    stats = cache.calculate_boot_stats(sample, 500, random_seed=1)
+    repeat = cache.calculate_boot_stats(pd.Series(sample), rep=500,
+                                        random_state=1)
+
+    # checks that equal data and seeds hit the cache
+    assert stats == calculate_boot_stats(sample, 500, random_seed=1)
+    assert repeat == stats
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # checks that other samples and parameters miss it
+    cache.calculate_boot_stats(sample[::-1], 500, random_seed=1)
+    cache.calculate_boot_stats(sample, 500, random_seed=1, level=0.9)
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    # checks that weights are keyed by content
+    weights = np.ones(100)
+    cache.calculate_boot_stats(sample, 500, random_seed=1, weights=weights)
+    weights[-1] = 2
+    cache.calculate_boot_stats(sample, 500, random_seed=1, weights=weights)
+    assert (cache.hits, cache.misses) == (1, 5)
+
+    # checks that unseeded calls bypass the cache
+    cache.bootstrap_distribution(sample, 10)
+    assert cache.info()["entries"] == 5
+
+    # checks that a seed sequence reused after spawning misses it
+    seed = np.random.SeedSequence(4)
+    first = cache.bootstrap_distribution(sample, 10, random_state=seed,
+                                         n_jobs=2)
+    assert not np.array_equal(
+        cache.bootstrap_distribution(sample, 10, random_state=seed,
+                                     n_jobs=2), first
+    )
+
+    # checks that returned distributions are copies
+    dist = cache.bootstrap_distribution(sample, 10, random_state=2)
+    dist[:] = 0
+    assert np.array_equal(
+        cache.bootstrap_distribution(sample, 10, random_state=2),
+        bootstrap_distribution(sample, 10, random_state=2)
+    )
+
+    # checks that the least recently used results are evicted
+    small = BootstrapCache(max_bytes=2000 * 8)
+    for seed in [0, 1, 0, 2, 0]:
+        small.bootstrap_distribution(sample, 1000, random_state=seed)
+    assert small.evictions == 1 and small.currsize == 2000 * 8
+    assert (small.hits, small.misses) == (2, 3)
+
+    # checks that clearing resets the counters
+    cache.clear()
+    assert cache.info() == {"hits": 0, "misses": 0, "disk_hits": 0,
+                            "evictions": 0, "entries": 0, "currsize": 0}
+
+
+def test_bootstrap_cache_disk(tmp_path):
+    """
+    Tests the on-disk tier of `BootstrapCache` and its errors.
+
+    8 tests in total.
+    """
+
+    sample = np.random.default_rng(0).normal(size=(100, 2))
+    directory = str(tmp_path / "cache")
+
+    stats, dist = BootstrapCache(directory=directory).calculate_boot_stats(
+        sample, 200, n=50, random_seed=3, pass_dist=True
+    )
+    BootstrapCache(directory=directory).bootstrap_distribution(
+        sample, 200, random_state=np.random.SeedSequence(3)
+    )
+
+    # checks that a new cache reads the results written by another
+    cache = BootstrapCache(directory=directory)
+    cached_stats, cached_dist = cache.calculate_boot_stats(
+        sample, 200, n=50, random_seed=3, pass_dist=True
+    )
+    assert np.array_equal(cached_dist, dist)
+    assert np.array_equal(cached_stats["upper"], stats["upper"])
+    assert cached_stats["n"] == 50 and cached_stats["estimator"] == "mean"
+    assert np.array_equal(
+        cache.bootstrap_distribution(sample, 200,
+                                     random_state=np.random.SeedSequence(3)),
+        bootstrap_distribution(sample, 200, random_state=3)
+    )
+    assert (cache.disk_hits, cache.misses) == (2, 0)
+
+    # tests with invalid input type of max_bytes
+    with raises(TypeError) as e:
+        BootstrapCache(max_bytes=1.5)
+    assert str(e.value) == "max_bytes should be of type 'int'"
+
+    # tests with invalid input value of max_bytes
+    with raises(ValueError) as e:
+        BootstrapCache(max_bytes=-1)
+    assert str(e.value) == "Invalid value for max_bytes"
+
+    # tests with invalid input type of directory
+    with raises(TypeError) as e:
+        BootstrapCache(directory=1)
+    assert str(e.value) == "directory should be None or of type 'str'"
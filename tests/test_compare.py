@@ -0,0 +1,70 @@
+import numpy as np
+from pytest import raises
+from strapvizpy.bootstrap import calculate_boot_stats
+from strapvizpy.compare import bootstrap_compare
+from strapvizpy.display import plot_ci, tabulate_stats
+
+
+def test_bootstrap_compare():
+    """
+    Tests the two-sample statistics of `bootstrap_compare()` against
+    separate bootstraps of each sample.
+
+    8 tests in total.
+    """
+
+    rng = np.random.default_rng(0)
+    a = rng.lognormal(size=400)
+    b = rng.lognormal(0.2, size=300)
+
+    stats = bootstrap_compare(a, b, 4000, random_state=1)
+    se_a = calculate_boot_stats(a, 4000, random_state=2)["std_err"]
+    se_b = calculate_boot_stats(b, 4000, random_state=3)["std_err"]
+
+    # checks the estimate and the standard error of a difference
+    assert stats["sample_diff_mean"] == b.mean() - a.mean()
+    assert np.isclose(stats["std_err"], np.hypot(se_a, se_b), rtol=0.1)
+    assert stats["lower"] < stats["sample_diff_mean"] < stats["upper"]
+
+    # checks the ratio and the median difference
+    ratio = bootstrap_compare(a, b, 2000, "ratio_mean", random_state=1)
+    assert ratio["sample_ratio_mean"] == b.mean() / a.mean()
+    median = bootstrap_compare(a, b, 2000, "diff_median", random_state=1)
+    assert median["sample_diff_median"] == np.median(b) - np.median(a)
+
+    # checks that chunked and parallel passes are reproducible
+    assert bootstrap_compare(a, b, 2000, "diff_median", random_state=1,
+                             chunk_reps=7) == median
+    assert bootstrap_compare(a, b, 2000, random_state=1, n_jobs=2) == \
+        bootstrap_compare(a, b, 2000, random_state=1, n_jobs=2)
+
+    # tests with an invalid statistic
+    with raises(ValueError) as e:
+        bootstrap_compare(a, b, 100, "ratio_median")
+    assert str(e.value) == (
+        "Supported statistics are diff_mean, ratio_mean, diff_median"
+    )
+
+
+def test_bootstrap_compare_display():
+    """
+    Tests that `tabulate_stats()` and `plot_ci()` render the results of
+    `bootstrap_compare()`.
+
+    3 tests in total.
+    """
+
+    rng = np.random.default_rng(0)
+    a, b = rng.normal(size=50), rng.normal(1, size=60)
+    stats, dist = bootstrap_compare(a, b, 500, random_state=1,
+                                    pass_dist=True)
+
+    # checks the tables of the comparison
+    stats_table, params_table = tabulate_stats(stats)
+    assert stats_table.data["Sample diff_mean"][0] == b.mean() - a.mean()
+    assert params_table.data["Sample Size"][0] == 110
+
+    # checks that the distribution is plotted as it is
+    histogram = plot_ci((stats, dist), title="Treatment - control")
+    assert histogram.gcf().number > 0, "Chart was not created correctly"
+    histogram.close("all")
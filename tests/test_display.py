@@ -1,8 +1,12 @@
+import os
+import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from pytest import raises
-from strapvizpy.display import plot_ci, tabulate_stats
+from strapvizpy.display import (plot_ci, plot_ci_batch, tabulate_stats,
+                                tabulate_stats_many)
 from strapvizpy.bootstrap import calculate_boot_stats
+from strapvizpy.result import BootstrapResult
 
 
 def test_plot_ci():
@@ -14,7 +18,7 @@ def test_plot_ci():
     None
         The test should pass and no asserts should be displayed.
         
-    9 tests in total
+    10 tests in total
     """
     
     # test integration with calculate_boot_stats function
@@ -112,6 +116,11 @@ def test_plot_ci():
                          path="./tests/")
     assert histogram.gcf().number > 0, "Chart was not created correctly"
 
+    # tests that a generator can be passed as the random state
+    histogram = plot_ci([1, 2, 3, 4, 5, 6, 7], 1000,
+                        random_state=np.random.default_rng(123))
+    assert histogram.gcf().number > 0, "Chart was not created correctly"
+
     # tests with invalid input value of path
     with raises(NameError) as e:
         plot_ci([1, 2, 3, 4, 5, 6, 7], 1000, path="Users/")
@@ -120,6 +129,72 @@ def test_plot_ci():
     )
 
 
+def test_plot_ci_axes(tmp_path):
+    """
+    Tests that `plot_ci()` and `plot_ci_batch()` draw onto their own
+    figures without touching pyplot state.
+
+    7 tests in total.
+    """
+
+    plt.close("all")
+    result = BootstrapResult.from_sample([1, 2, 3, 4, 5], 500,
+                                         random_state=1)
+    _, axes = plt.subplots(1, 2)
+
+    # checks that charts are drawn onto the given Axes only
+    drawn = plot_ci(result, ax=axes[1], title="Second")
+    assert drawn is axes[1]
+    assert axes[1].get_title() == "Second" and not axes[0].has_data()
+    plt.close("all")
+
+    # checks that batches render one file per result, without figures
+    results = [result, calculate_boot_stats([2, 4, 6], 500,
+                                            random_state=1, pass_dist=True)]
+    files = plot_ci_batch(results, str(tmp_path), fmt="svg")
+    assert files == [str(tmp_path / "ci_0.svg"), str(tmp_path / "ci_1.svg")]
+    assert all((tmp_path / f"ci_{i}.svg").stat().st_size > 0
+               for i in range(2))
+    assert plt.get_fignums() == []
+
+    # checks that worker processes render the same files
+    files = plot_ci_batch(results * 3, str(tmp_path), n_jobs=2)
+    assert all(os.path.getsize(file) > 0 for file in files[2:])
+
+    # tests with an invalid format
+    with raises(ValueError) as e:
+        plot_ci_batch(results, str(tmp_path), fmt="jpg")
+    assert str(e.value) == "Supported formats are png, svg"
+
+
+def test_plot_ci_binned():
+    """
+    Tests that `plot_ci()` draws distributions binned once, and results
+    stored as a histogram from their own counts.
+
+    3 tests in total.
+    """
+
+    rng = np.random.default_rng(0)
+    result = BootstrapResult.from_sample(rng.normal(size=100), 200000,
+                                         random_state=1)
+    _, ax = plt.subplots()
+
+    # checks that the replicates are drawn as stairs of their bins
+    plot_ci(result, bin_size=40, ax=ax)
+    stairs = ax.patches[0]
+    assert len(stairs.get_data().values) == 40
+    assert stairs.get_data().values.sum() == 200000
+
+    # checks that histogram results are drawn from their counts
+    binned = BootstrapResult(result.dist, result.sample_estimate,
+                             storage="histogram", bins=64)
+    _, ax = plt.subplots()
+    plot_ci(binned, ax=ax)
+    assert np.array_equal(ax.patches[0].get_data().values, binned.counts)
+    plt.close("all")
+
+
 def test_table_outputs():
     """Tests the functionality of the create_tables function."""
     
@@ -206,3 +281,47 @@ def test_table_errors():
     assert str(e.value) == (
         "The path parameter must be a character string."
     )
+
+
+def test_tabulate_stats_many(tmp_path):
+    """
+    Tests the single table of `tabulate_stats_many()` and its exports.
+
+    8 tests in total.
+    """
+
+    st = [calculate_boot_stats(np.arange(size), 200, random_seed=123)
+          for size in range(2, 12)]
+    st.append(calculate_boot_stats(np.arange(20), 200, n=10,
+                                   estimator="median", random_seed=123,
+                                   pass_dist=True))
+    st.append(BootstrapResult.from_sample([1, 2, 3], 200, random_state=1))
+    table = tabulate_stats_many(st)
+
+    # checks one row per result, agreeing with tabulate_stats()
+    assert isinstance(table, pd.DataFrame) and len(table) == 12
+    assert table["Lower Bound CI"][3] == st[3]["lower"]
+    assert table["Sample Estimate"][10] == np.median(np.arange(20))
+    assert list(table["Samples per bootstrap"][9:]) == [11, 10, 3]
+
+    # checks that the table is styled only on request
+    styled = tabulate_stats_many(st, estimator=False, alpha=False,
+                                 style=True)
+    assert list(styled.data.columns) == [
+        "Lower Bound CI", "Upper Bound CI", "Standard Error", "Sample Size",
+        "Repetition", "Samples per bootstrap"
+    ]
+
+    # checks the written tables
+    tabulate_stats_many(st, path=str(tmp_path), fmt="latex")
+    assert "\\toprule" in (tmp_path / "bootstrap_stats.tex").read_text()
+    tabulate_stats_many(st, path=str(tmp_path))
+    assert np.allclose(
+        pd.read_csv(tmp_path / "bootstrap_stats.csv")["Standard Error"],
+        table["Standard Error"]
+    )
+
+    # tests with an invalid format
+    with raises(ValueError) as e:
+        tabulate_stats_many(st, fmt="xlsx")
+    assert str(e.value) == "Supported formats are csv, latex, html, parquet"
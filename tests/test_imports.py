@@ -0,0 +1,64 @@
+import subprocess
+import sys
+from pytest import raises
+import strapvizpy
+
+# Import time budget, in microseconds, of strapvizpy.bootstrap on top of
+# NumPy, generous enough for slow machines
+IMPORT_BUDGET_US = 500000
+
+
+def _import_times(statement):
+    """Cumulative import times, in microseconds, by module name."""
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_time():
+    """
+    Tests that importing `strapvizpy.bootstrap` stays fast and loads
+    neither pandas nor matplotlib.
+
+    4 tests in total.
+    """
+
+    times = _import_times("import strapvizpy.bootstrap")
+
+    # checks that the heavy optional modules are not imported
+    assert "pandas" not in times
+    assert "matplotlib" not in times
+
+    # checks the import time on top of NumPy against the budget
+    assert (times["strapvizpy.bootstrap"] - times["numpy"] <
+            IMPORT_BUDGET_US)
+
+    # checks that the display module defers matplotlib to drawing
+    assert "matplotlib" not in _import_times("import strapvizpy.display")
+
+
+def test_lazy_api():
+    """
+    Tests the lazy public API of the `strapvizpy` package.
+
+    3 tests in total.
+    """
+
+    # checks that names resolve to their submodules' objects
+    from strapvizpy.display import plot_ci
+    assert strapvizpy.plot_ci is plot_ci
+    assert "calculate_boot_stats" in dir(strapvizpy)
+
+    # tests with an unknown name
+    with raises(AttributeError) as e:
+        strapvizpy.plot
+    assert str(e.value) == "module 'strapvizpy' has no attribute 'plot'"
@@ -0,0 +1,165 @@
+import numpy as np
+from pytest import raises
+from strapvizpy.bootstrap import bootstrap_distribution, calculate_boot_stats
+from strapvizpy.display import plot_ci, tabulate_stats
+from strapvizpy.result import BootstrapResult, stats_from_distribution
+
+
+def test_stats_from_distribution():
+    """
+    Tests the stats of several levels derived by
+    `stats_from_distribution()` from one distribution.
+
+    8 tests in total.
+    """
+
+    sample = np.random.default_rng(0).normal(size=50)
+    dist = bootstrap_distribution(sample, 1000, random_state=1)
+
+    levels = stats_from_distribution(dist, [0.9, 0.95, 0.99],
+                                     sample_estimate=sample.mean(),
+                                     sample_size=50)
+
+    # checks that every level matches a separate calculate_boot_stats
+    for stats, level in zip(levels, [0.9, 0.95, 0.99]):
+        assert stats == calculate_boot_stats(sample, 1000, level=level,
+                                             random_state=1)
+
+    # checks that intervals widen with the level
+    assert levels[0]["upper"] < levels[1]["upper"] < levels[2]["upper"]
+
+    # checks that a single level returns a dictionary
+    assert stats_from_distribution(dist, 0.95,
+                                   sample_estimate=sample.mean(),
+                                   sample_size=50) == levels[1]
+
+    # tests a distribution without its sample estimate
+    with raises(ValueError) as e:
+        stats_from_distribution(dist)
+    assert str(e.value) == "sample_estimate should be set for a distribution"
+
+    # tests with invalid input type of dist
+    with raises(TypeError) as e:
+        stats_from_distribution(list(dist), sample_estimate=0.0)
+    assert str(e.value) == (
+        "dist should be a 1 or 2 dimensional numpy.ndarray or a "
+        "BootstrapResult"
+    )
+
+    # tests with an invalid level among several
+    with raises(ValueError) as e:
+        stats_from_distribution(dist, [0.9, 1.5], sample_estimate=0.0)
+    assert str(e.value) == "level should be between 0 and 1"
+
+
+def test_bootstrap_result():
+    """
+    Tests that `BootstrapResult` is rendered by `plot_ci()` and
+    `tabulate_stats()` without resampling.
+
+    6 tests in total.
+    """
+
+    sample = np.random.default_rng(0).lognormal(size=(50, 2))
+    result = BootstrapResult.from_sample(sample[:, 0], 1000, level=0.9,
+                                         estimator="median", random_state=1)
+
+    # checks the stats of the result at its own and other levels
+    assert result.rep == 1000
+    assert result.stats() == calculate_boot_stats(sample[:, 0], 1000,
+                                                  level=0.9,
+                                                  estimator="median",
+                                                  random_state=1)
+    assert result.stats(0.99)["level"] == 0.99
+
+    # checks the per-column stats of a 2-D result
+    stats = BootstrapResult.from_sample(sample, 100, random_state=1).stats()
+    assert stats["lower"].shape == (2,)
+
+    # checks that rendering uses the result as it is
+    histogram = plot_ci(result, title="Bootstrap")
+    assert histogram.gcf().number > 0, "Chart was not created correctly"
+    histogram.close("all")
+    stats_table, _ = tabulate_stats(result)
+    assert stats_table.data["Sample median"][0] == np.median(sample[:, 0])
+
+
+def test_bootstrap_result_storage():
+    """
+    Tests the float32 and histogram storages of `BootstrapResult` and its
+    dictionary access.
+
+    13 tests in total.
+    """
+
+    sample = np.random.default_rng(0).normal(size=50)
+    dist = bootstrap_distribution(sample, 10000, random_state=1)
+    full = BootstrapResult(dist, sample.mean(), sample_size=50)
+    single = BootstrapResult(dist, sample.mean(), storage="float32")
+    binned = BootstrapResult(dist, sample.mean(), storage="histogram",
+                             bins=512)
+
+    # checks that stats are read like a dictionary and computed once
+    assert dict(full) == full.stats()
+    assert full["upper"] == np.percentile(dist, 97.5)
+    assert full._stats is full._stats
+
+    # checks the reduced storages keep close percentiles
+    assert single.dist.dtype == np.float32 and binned.dist is None
+    width = (dist.max() - dist.min()) / 512
+    assert abs(binned["lower"] - full["lower"]) <= width
+    assert abs(single["upper"] - full["upper"]) < 1e-6
+
+    # checks that the standard error of a histogram stays exact
+    assert binned["std_err"] == np.std(dist)
+
+    # checks that a histogram result is rendered from its counts
+    histogram = plot_ci(binned)
+    assert histogram.gcf().number > 0, "Chart was not created correctly"
+    histogram.close("all")
+
+    # checks that NaN replicates are counted and give NaN as with floats
+    dist[:10] = np.nan
+    binned = BootstrapResult(dist, sample.mean(), storage="histogram")
+    assert binned.nan_count == 10 and binned.counts.sum() == len(dist) - 10
+    assert np.isnan(binned["lower"]) and np.isnan(binned["std_err"])
+    assert binned.low == np.nanmin(dist)
+
+    # tests with an invalid storage
+    with raises(ValueError) as e:
+        BootstrapResult(dist, sample.mean(), storage="float16")
+    assert str(e.value) == "Supported storages are float64, float32, histogram"
+
+    # tests the histogram storage of infinite replicates
+    with raises(ValueError) as e:
+        BootstrapResult(np.array([1.0, np.inf]), 1.0, storage="histogram")
+    assert str(e.value) == (
+        "Histogram storage supports finite or NaN replicates"
+    )
+
+
+def test_bootstrap_result_weighted():
+    """
+    Tests that `BootstrapResult.from_sample()` estimates weighted,
+    frequency and NaN-omitting samples as `calculate_boot_stats()` does.
+
+    6 tests in total.
+    """
+
+    # checks that weights shape the estimate as well as the replicates
+    result = BootstrapResult.from_sample([1., 2., 3.], 500,
+                                         weights=[0, 0, 1], random_state=1)
+    assert np.all(result.dist == 3.0) and result["sample_mean"] == 3.0
+
+    # checks that frequencies stand for the expanded sample
+    result = BootstrapResult.from_sample([1., 2., 3.], 500,
+                                         frequencies=[1, 1, 2],
+                                         estimator="median", random_state=1)
+    assert result["sample_median"] == 2.5
+    assert result["sample_size"] == 4
+
+    # checks that omitted NaN leave neither the estimate nor the size
+    result = BootstrapResult.from_sample([1., np.nan, 3.], 500,
+                                         nan_policy="omit", random_state=1)
+    assert result["sample_mean"] == 2.0
+    assert result["sample_size"] == 2
@@ -0,0 +1,198 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from multiprocessing import get_context
+import numpy as np
+import pandas as pd
+from pytest import raises
+from strapvizpy.streaming import (BootstrapAccumulator,
+                                  calculate_boot_stats_stream)
+
+
+def test_calculate_boot_stats_stream():
+    """
+    Tests the online Poisson bootstrap of `calculate_boot_stats_stream()`
+    against the statistics of the full sample.
+
+    9 tests in total.
+    """
+
+    sample = np.random.default_rng(0).normal(10, 2, 20000)
+    chunks = [pd.Series(chunk) for chunk in np.array_split(sample, 7)]
+
+    stats = calculate_boot_stats_stream(iter(chunks), 300, random_state=1)
+
+    # checks the keys and parameters of the stats dictionary
+    assert list(stats) == ["lower", "upper", "sample_mean", "std_err",
+                           "level", "sample_size", "n", "rep", "estimator"]
+    assert stats["sample_size"] == 20000
+    assert stats["rep"] == 300
+
+    # checks the exact sample estimate and the bootstrapped interval
+    assert np.isclose(stats["sample_mean"], sample.mean())
+    assert np.isclose(stats["std_err"], sample.std() / np.sqrt(20000),
+                      rtol=0.15)
+    assert stats["lower"] < sample.mean() < stats["upper"]
+
+    # checks the moments of the other estimators
+    stats = calculate_boot_stats_stream(chunks, 300, estimator="var",
+                                        random_state=1)
+    assert np.isclose(stats["sample_var"], sample.var())
+    stats, dist = calculate_boot_stats_stream(chunks, 300, estimator="sd",
+                                              random_state=1, max_bytes=1,
+                                              pass_dist=True)
+    assert np.isclose(stats["sample_sd"], sample.std())
+    assert dist.shape == (300,)
+
+    # checks the median sketch, whose error is relative to the median
+    stats = calculate_boot_stats_stream(chunks, 300, estimator="median",
+                                        random_state=1)
+    assert np.isclose(stats["sample_median"], np.median(sample), rtol=1e-3)
+
+
+def test_bootstrap_accumulator():
+    """
+    Tests `BootstrapAccumulator` updates, sketch rescaling and errors.
+
+    6 tests in total.
+    """
+
+    rng = np.random.default_rng(2)
+    chunks = [rng.normal(0, 1, 500), rng.normal(0, 1, 500) * 50,
+              rng.normal(0, 1, 500) + 200]
+
+    acc = BootstrapAccumulator(100, estimator="median", random_state=3,
+                               sketch_bins=256)
+    for chunk in chunks:
+        assert acc.update(chunk) is acc
+    acc.update([])
+
+    # checks that the sketch grows to cover every chunk's range
+    sample = np.concatenate(chunks)
+    stats = acc.stats()
+    assert np.isclose(stats["sample_median"], np.median(sample), rtol=0.02)
+    assert stats["lower"] <= stats["upper"]
+
+    # tests with invalid input value of rep
+    with raises(ValueError) as e:
+        BootstrapAccumulator(0)
+    assert str(e.value) == "Invalid value for rep"
+
+    # tests with invalid input value of sketch_bins
+    with raises(ValueError) as e:
+        BootstrapAccumulator(10, sketch_bins=1)
+    assert str(e.value) == "Invalid value for sketch_bins"
+
+    # tests the stats of an empty stream
+    with raises(ValueError) as e:
+        BootstrapAccumulator(10).stats()
+    assert str(e.value) == "No observations have been added"
+
+
+def test_bootstrap_accumulator_non_finite():
+    """
+    Tests that every estimator of `BootstrapAccumulator` propagates NaN to
+    the replicates weighting it and rejects infinite values.
+
+    10 tests in total.
+    """
+
+    sample = np.random.default_rng(4).normal(5, 1, 50)
+    sample[7] = np.nan
+
+    for estimator in ["mean", "median", "var", "sd"]:
+        acc = BootstrapAccumulator(500, estimator=estimator, random_state=5)
+        stats, dist = acc.update(sample).stats(pass_dist=True)
+
+        # checks the NaN estimate and the share of NaN replicates,
+        # 1 - exp(-1) being the chance of a positive Poisson(1) weight
+        assert np.isnan(stats[f"sample_{estimator}"])
+        assert 0.55 < np.isnan(dist).mean() < 0.72
+
+    # checks a stream of NaN only
+    stats = BootstrapAccumulator(10).update([np.nan]).stats()
+    assert np.isnan(stats["sample_mean"])
+
+    # tests with an infinite value
+    with raises(ValueError) as e:
+        BootstrapAccumulator(10, estimator="median").update([1.0, np.inf])
+    assert str(e.value) == "chunk contains infinite values"
+
+
+def test_bootstrap_accumulator_heavy_tailed():
+    """
+    Tests the relative accuracy of the median sketch of
+    `BootstrapAccumulator` on skewed data with extreme outliers.
+
+    4 tests in total.
+    """
+
+    sample = np.random.default_rng(4).lognormal(1, 2, 200000)
+    stats = calculate_boot_stats_stream(np.array_split(sample, 5), 100,
+                                        estimator="median", random_state=5)
+
+    # checks the median of a heavy-tailed sample and its interval
+    assert np.isclose(stats["sample_median"], np.median(sample), rtol=0.01)
+    assert stats["lower"] < np.median(sample) < stats["upper"]
+
+    # checks that a single extreme value barely moves the median
+    outlier = calculate_boot_stats_stream([sample, [1e9]], 100,
+                                          estimator="median", random_state=5)
+    assert np.isclose(outlier["sample_median"], np.median(sample), rtol=0.01)
+
+    # checks zeros and negative values around the median
+    signed = np.r_[-sample[:995], np.zeros(10), sample[:995]]
+    stats = calculate_boot_stats_stream([signed], 100, estimator="median",
+                                        random_state=5)
+    assert stats["sample_median"] == 0
+
+
+def _shard(estimator, seed, part):
+    """Serialised accumulator of one shard, as sent by a worker node."""
+
+    acc = BootstrapAccumulator(300, estimator, random_state=seed)
+    return acc.update(part).to_bytes()
+
+
+def test_bootstrap_accumulator_merge():
+    """
+    Tests merging `BootstrapAccumulator` shards updated by separate
+    processes against a single stream.
+
+    7 tests in total.
+    """
+
+    sample = np.random.default_rng(6).lognormal(1, 1, 30000)
+    parts = np.array_split(sample, 4)
+    seeds = np.random.SeedSequence(7).spawn(4)
+
+    with ProcessPoolExecutor(2, mp_context=get_context("spawn")) as pool:
+        for estimator in ["mean", "median"]:
+            shards = [BootstrapAccumulator.from_bytes(data) for data in
+                      pool.map(_shard, [estimator] * 4, seeds, parts)]
+            stats = reduce(BootstrapAccumulator.merge, shards).stats()
+            single = calculate_boot_stats_stream([sample], 300,
+                                                 estimator=estimator,
+                                                 random_state=8)
+
+            # checks the merged shards against a single stream
+            assert stats["sample_size"] == 30000
+            assert np.isclose(stats["std_err"], single["std_err"],
+                              rtol=0.15)
+
+    # checks that merges are associative
+    shards = [BootstrapAccumulator.from_bytes(_shard("var", seed, part))
+              for seed, part in zip(seeds, parts)]
+    left = BootstrapAccumulator.from_bytes(shards[0].to_bytes())
+    left.merge(shards[1]).merge(shards[2])
+    right = BootstrapAccumulator.from_bytes(shards[1].to_bytes())
+    right = shards[0].merge(right.merge(shards[2]))
+    assert np.allclose(left.stats(pass_dist=True)[1],
+                       right.stats(pass_dist=True)[1])
+    assert np.isclose(left.stats()["sample_var"], np.var(
+        np.concatenate(parts[:3])))
+
+    # tests merging accumulators of different estimators
+    with raises(ValueError) as e:
+        BootstrapAccumulator(300).merge(shards[3])
+    assert str(e.value) == ("Only accumulators of the same rep, estimator "
+                            "and sketch_bins can be merged")